@@ -0,0 +1,109 @@
+"""
+Compare job throughput of a saturated task when the poller waits for a freed slot
+against the previous behaviour of sleeping ``poll_retry_delay`` seconds.
+
+Runs fully in-process against a fake gateway that always has jobs available.
+
+Usage: python benchmarks/capacity_signalling.py [--duration SECONDS]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import time
+from collections.abc import AsyncGenerator
+from itertools import count
+from typing import Any
+
+from pyzeebe import Job
+from pyzeebe.task import task_builder
+from pyzeebe.task.task_config import TaskConfig
+from pyzeebe.worker.job_executor import JobExecutor
+from pyzeebe.worker.job_poller import JobPoller
+from pyzeebe.worker.task_state import TaskState
+
+HANDLER_DURATION = 0.005
+GATEWAY_ROUND_TRIP = 0.002
+MAX_RUNNING_JOBS = 32
+POLL_RETRY_DELAY = 1
+
+
+class FakeZeebeAdapter:
+    connected = True
+    retrying_connection = False
+
+    def __init__(self) -> None:
+        self.completed = 0
+        self._keys = count()
+
+    async def activate_jobs(self, task_type: str, max_jobs_to_activate: int, **kwargs: Any) -> AsyncGenerator[Job]:
+        await asyncio.sleep(GATEWAY_ROUND_TRIP)
+        for _ in range(max_jobs_to_activate):
+            yield Job(
+                key=next(self._keys),
+                type=task_type,
+                process_instance_key=1,
+                bpmn_process_id="benchmark",
+                process_definition_version=1,
+                process_definition_key=1,
+                element_id="task",
+                element_instance_key=1,
+                custom_headers={},
+                worker="benchmark",
+                retries=3,
+                deadline=0,
+                variables={},
+            )
+
+    async def complete_job(self, job_key: int, variables: Any) -> None:
+        self.completed += 1
+
+
+class SleepingJobPoller(JobPoller):
+    """Poller reproducing the behaviour before capacity signalling."""
+
+    async def activate_max_jobs(self) -> None:
+        if self.calculate_max_jobs_to_activate() > 0:
+            await self.poll_once()
+        else:
+            await asyncio.sleep(self.poll_retry_delay)
+
+
+async def handler() -> dict[str, Any]:
+    await asyncio.sleep(HANDLER_DURATION)
+    return {}
+
+
+async def run(poller_class: type[JobPoller], duration: float) -> float:
+    adapter = FakeZeebeAdapter()
+    config = TaskConfig("benchmark", None, 10000, MAX_RUNNING_JOBS, MAX_RUNNING_JOBS, [], False, "", [], [])
+    task = task_builder.build_task(handler, config)
+    queue: asyncio.Queue[Job] = asyncio.Queue()
+    task_state = TaskState()
+    poller = poller_class(adapter, task, queue, "benchmark", 0, task_state, POLL_RETRY_DELAY, None)  # type: ignore[arg-type]
+    executor = JobExecutor(task, queue, task_state, adapter)  # type: ignore[arg-type]
+
+    tasks = [asyncio.create_task(poller.poll()), asyncio.create_task(executor.execute())]
+    start = time.perf_counter()
+    await asyncio.sleep(duration)
+    elapsed = time.perf_counter() - start
+    for running in tasks:
+        running.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    return adapter.completed / elapsed
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--duration", type=float, default=5.0)
+    args = parser.parse_args()
+
+    sleeping = await run(SleepingJobPoller, args.duration)
+    signalled = await run(JobPoller, args.duration)
+    print(f"sleep(poll_retry_delay={POLL_RETRY_DELAY}s): {sleeping:10.1f} jobs/sec")
+    print(f"capacity signalling:           {signalled:10.1f} jobs/sec")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
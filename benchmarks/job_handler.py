@@ -0,0 +1,165 @@
+"""
+Measure the per-job overhead of the job handler hot path: decorators, argument binding, calling the task function
+and reporting the result. The task functions do no work, so the numbers are pyzeebe's own cost per job.
+
+Usage: python benchmarks/job_handler.py [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from pyzeebe import Job, JobController, TaskDecorator, inline
+from pyzeebe.codec import get_default_codec
+from pyzeebe.job.lazy_json import LazyJsonMapping
+from pyzeebe.task import task_builder
+from pyzeebe.task.task_config import TaskConfig
+
+VARIABLES = {f"variable_{index}": index for index in range(50)}
+RAW_VARIABLES = json.dumps(VARIABLES)
+CODEC = get_default_codec()
+
+
+@dataclass
+class Model:
+    variable_0: int
+    variable_1: int
+
+
+async def no_parameters() -> None:
+    return None
+
+
+async def two_parameters(variable_0: int, variable_1: int) -> None:
+    return None
+
+
+async def all_variables(**variables: Any) -> None:
+    return None
+
+
+async def job_parameter(job: Job) -> None:
+    return None
+
+
+async def model_parameter(model: Model) -> None:
+    return None
+
+
+def sync_two_parameters(variable_0: int, variable_1: int) -> None:
+    return None
+
+
+@inline
+def inline_two_parameters(variable_0: int, variable_1: int) -> None:
+    return None
+
+
+def log_job(job: Job) -> Job:
+    return job
+
+
+@inline
+def inline_log_job(job: Job) -> Job:
+    return job
+
+
+async def forward_variables(**variables: Any) -> dict[str, Any]:
+    return variables
+
+
+async def forward_raw_variables(variables: str) -> str:
+    return variables
+
+
+SCENARIOS: dict[str, tuple[Callable[..., Any], list[str] | None, list[TaskDecorator]]] = {
+    "no parameters": (no_parameters, None, []),
+    "2 of 50 variables": (two_parameters, ["variable_0", "variable_1"], []),
+    "all 50 variables": (all_variables, [], []),
+    "job parameter": (job_parameter, [], []),
+    "dataclass parameter": (model_parameter, ["variable_0", "variable_1"], []),
+    "sync, 2 of 50 variables": (sync_two_parameters, ["variable_0", "variable_1"], []),
+    "inline, 2 of 50 variables": (inline_two_parameters, ["variable_0", "variable_1"], []),
+    "sync, decorators": (no_parameters, None, [log_job]),
+    "inline decorators": (no_parameters, None, [inline_log_job]),
+    "forward 50 variables": (forward_variables, [], []),
+    "forward raw variables": (forward_raw_variables, [], []),
+}
+
+
+class EncodingJobController(JobController):
+    """Encodes the result like the job adapter does, without sending it."""
+
+    async def set_running_after_decorators_status(self) -> None:
+        pass
+
+    async def set_success_status(self, variables: Any = None) -> None:
+        if not isinstance(variables, (str, bytes)):
+            CODEC.dumps(variables)
+
+
+def create_job(key: int) -> Job:
+    return Job(
+        key=key,
+        type="benchmark",
+        process_instance_key=1,
+        bpmn_process_id="process",
+        process_definition_version=1,
+        process_definition_key=1,
+        element_id="task",
+        element_instance_key=1,
+        custom_headers={},
+        worker="benchmark",
+        retries=3,
+        deadline=0,
+        variables=LazyJsonMapping(RAW_VARIABLES, CODEC.loads),
+    )
+
+
+async def measure(
+    task_function: Callable[..., Any], variables_to_fetch: list[str] | None, decorators: list[TaskDecorator], jobs: int
+) -> float:
+    raw_variables = task_function is forward_raw_variables
+    config = TaskConfig(
+        "benchmark",
+        None,
+        10000,
+        32,
+        32,
+        variables_to_fetch,
+        False,
+        "",
+        decorators,
+        decorators,
+        raw_variables=raw_variables,
+        typed_variables=task_function is model_parameter,
+    )
+    task = task_builder.build_task(task_function, config)
+    prepared = [create_job(key) for key in range(jobs)]
+    controllers = [EncodingJobController(job, None) for job in prepared]  # type: ignore[arg-type]
+
+    start = time.perf_counter()
+    for job, controller in zip(prepared, controllers):
+        await task.job_handler(job, controller)
+    return (time.perf_counter() - start) / jobs * 1e6
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'scenario':>26} {'µs/job':>8}")
+    for name, (task_function, variables_to_fetch, decorators) in SCENARIOS.items():
+        jobs = args.jobs // 20 if name.startswith("sync") else args.jobs
+        print(f"{name:>26} {await measure(task_function, variables_to_fetch, decorators, jobs):8.2f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
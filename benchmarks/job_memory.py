@@ -0,0 +1,74 @@
+"""
+Measure the memory held per queued job: the Job object itself and a Job with its lazily decoded variables and
+custom headers, the way jobs wait in a worker's queue.
+
+Usage: python benchmarks/job_memory.py [--jobs N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import sys
+import tracemalloc
+from collections.abc import Callable
+from dataclasses import replace
+
+from pyzeebe import Job
+from pyzeebe.job.lazy_json import LazyJsonMapping
+
+RAW_VARIABLES = json.dumps({f"variable_{index}": index for index in range(10)})
+RAW_HEADERS = json.dumps({"header": "value"})
+
+
+def create_job(key: int) -> Job:
+    return Job(
+        key=key,
+        type="benchmark",
+        process_instance_key=key,
+        bpmn_process_id="process",
+        process_definition_version=1,
+        process_definition_key=1,
+        element_id="task",
+        element_instance_key=key,
+        custom_headers=LazyJsonMapping(RAW_HEADERS),
+        worker="benchmark",
+        retries=3,
+        deadline=0,
+        variables=LazyJsonMapping(RAW_VARIABLES),
+    )
+
+
+def measure(create: Callable[[int], object], jobs: int) -> float:
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    kept = [create(key) for key in range(jobs)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del kept
+    return (after - before) / jobs
+
+
+def is_hashable(job: Job) -> bool:
+    try:
+        hash(job)
+    except TypeError:
+        return False
+    return True
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--jobs", type=int, default=50_000)
+    args = parser.parse_args()
+
+    job = create_job(1)
+    print(f"{'Job object (sys.getsizeof)':>34} {sys.getsizeof(job) + sys.getsizeof(getattr(job, '__dict__', {})):8} B")
+    print(f"{'queued job incl. variables':>34} {measure(create_job, args.jobs):8.0f} B")
+    print(f"{'usable as dict key':>34} {str(is_hashable(replace(job, variables={}))):>8}")
+
+
+if __name__ == "__main__":
+    main()
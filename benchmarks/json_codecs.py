@@ -0,0 +1,72 @@
+"""
+Compare the installed JSON codecs on job variable payloads of realistic sizes.
+
+Each payload is a list of order-like records, which mixes strings, numbers, booleans and nesting
+the way business process variables usually do.
+
+Usage: python benchmarks/json_codecs.py [--repeat N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import timeit
+from typing import Any
+
+from pyzeebe.codec import json_codec
+from pyzeebe.codec.json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+)
+
+PAYLOAD_SIZES = {"1 KB": 4, "10 KB": 40, "100 KB": 400, "1 MB": 4000}
+
+
+def record(index: int) -> dict[str, Any]:
+    return {
+        "orderId": f"order-{index:08d}",
+        "customer": {"id": index * 7, "name": "Jane Doe", "vip": index % 3 == 0},
+        "items": [{"sku": f"sku-{item}", "quantity": item + 1, "price": 9.99 * (item + 1)} for item in range(2)],
+        "total": 49.95,
+        "approved": True,
+    }
+
+
+def payload(records: int) -> dict[str, Any]:
+    return {"orders": [record(index) for index in range(records)], "batchId": "2024-01-01"}
+
+
+def codecs() -> list[JsonCodec]:
+    available: list[JsonCodec] = [StdlibJsonCodec()]
+    if json_codec.HAS_ORJSON:
+        available.append(OrjsonCodec())
+    if json_codec.HAS_MSGSPEC:
+        available.append(MsgspecJsonCodec())
+    return available
+
+
+def measure(codec: JsonCodec, value: dict[str, Any], raw: str, repeat: int) -> tuple[float, float]:
+    number = max(1, 20_000 // len(raw) * 50)
+    dumps = min(timeit.repeat(lambda: codec.dumps(value), number=number, repeat=repeat)) / number
+    loads = min(timeit.repeat(lambda: codec.loads(raw), number=number, repeat=repeat)) / number
+    return dumps * 1e6, loads * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'payload':>8} {'codec':>8} {'dumps µs':>12} {'loads µs':>12}")
+    for label, records in PAYLOAD_SIZES.items():
+        value = payload(records)
+        raw = StdlibJsonCodec().dumps(value)
+        for codec in codecs():
+            dumps, loads = measure(codec, value, raw, args.repeat)
+            print(f"{label:>8} {codec.name:>8} {dumps:12.1f} {loads:12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Measure how long the event loop stalls while a large payload is encoded and decoded, with and without offloading the
+JSON work to a thread. A ticker task stands in for the other jobs, polls and streams of the worker. Also measures what
+deciding whether to offload costs, next to encoding the payload with the default codec.
+
+Usage: python benchmarks/json_offload.py [--size-mb N]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+import timeit
+from collections.abc import Callable
+
+from pyzeebe.codec import JsonOffloader, StdlibJsonCodec, get_default_codec
+from pyzeebe.codec.offload import DEFAULT_OFFLOAD_THRESHOLD, exceeds_size
+from pyzeebe.job.lazy_json import LazyJsonMapping
+
+
+def create_payload(size_mb: float) -> dict[str, object]:
+    return {
+        "items": [{"id": index, "name": f"item-{index}", "tags": ["a", "b"]} for index in range(int(size_mb * 14_000))],
+        "index": {f"item-{index}": index for index in range(int(size_mb * 14_000))},
+    }
+
+
+def best_ms(function: Callable[[], object]) -> float:
+    return min(timeit.repeat(function, number=1, repeat=20)) * 1000
+
+
+async def ticker(stalls: list[float], stop: asyncio.Event) -> None:
+    last = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(0)
+        now = time.perf_counter()
+        stalls.append(now - last)
+        last = now
+
+
+async def measure(offloader: JsonOffloader, payload: dict[str, object], raw: str) -> float:
+    stalls: list[float] = []
+    stop = asyncio.Event()
+    ticking = asyncio.create_task(ticker(stalls, stop))
+    await asyncio.sleep(0)
+
+    await offloader.dumps(payload)
+    variables = LazyJsonMapping(raw, offloader.codec.loads)
+    if offloader.is_large(variables):
+        await offloader.decode(variables.decode)
+    else:
+        variables.decode()
+
+    stop.set()
+    await ticking
+    return max(stalls) * 1000
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size-mb", type=float, default=5)
+    args = parser.parse_args()
+
+    payload = create_payload(args.size_mb)
+    raw = json.dumps(payload)
+    print(f"payload: {len(raw) / 1024 / 1024:.2f} MB")
+    codec = get_default_codec()
+    print(f"    size estimate: {best_ms(lambda: exceeds_size(payload, DEFAULT_OFFLOAD_THRESHOLD)):7.2f} ms")
+    print(f"{type(codec).__name__:>17}: {best_ms(lambda: codec.dumps(payload)):7.2f} ms")
+    for name, threshold in (("on event loop", None), ("offloaded", 1024 * 1024)):
+        offloader = JsonOffloader(StdlibJsonCodec(), threshold)
+        print(f"{name:>14}: longest event loop stall {await measure(offloader, payload, raw):7.1f} ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -7,11 +7,13 @@ from pyzeebe.channel import (
 )
 from pyzeebe.client.client import ZeebeClient
 from pyzeebe.client.sync_client import SyncZeebeClient
+from pyzeebe.function_tools.async_tools import inline
 from pyzeebe.job.job import Job, JobController
 from pyzeebe.job.job_status import JobStatus
 from pyzeebe.task.exception_handler import ExceptionHandler, default_exception_handler
 from pyzeebe.task.task_config import TaskConfig
 from pyzeebe.task.types import TaskDecorator
+from pyzeebe.worker.supervisor import WorkerSupervisor
 from pyzeebe.worker.task_router import ZeebeTaskRouter
 from pyzeebe.worker.worker import ZeebeWorker
 
@@ -32,4 +34,6 @@ __all__ = (
     "ZeebeTaskRouter",
     "default_exception_handler",
     "ZeebeWorker",
+    "WorkerSupervisor",
+    "inline",
 )
@@ -5,6 +5,7 @@ from collections.abc import Iterable
 
 import grpc
 
+from pyzeebe.codec import JsonCodec
 from pyzeebe.grpc_internals.types import (
     BroadcastSignalResponse,
     CancelProcessInstanceResponse,
@@ -23,14 +24,18 @@ from pyzeebe.types import Variables
 class ZeebeClient:
     """A zeebe client that can connect to a zeebe instance and perform actions."""
 
-    def __init__(self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = 10) -> None:
+    def __init__(
+        self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = 10, json_codec: JsonCodec | None = None
+    ) -> None:
         """
         Args:
             grpc_channel (grpc.aio.Channel): GRPC Channel connected to a Zeebe gateway
             max_connection_retries (int): Amount of connection retries before client gives up on connecting to zeebe. To setup with infinite retries use -1
+            json_codec (JsonCodec): Codec of variables and decision outputs. Default: orjson or msgspec if installed,
+                otherwise the json module
         """
 
-        self.zeebe_adapter = ZeebeAdapter(grpc_channel, max_connection_retries)
+        self.zeebe_adapter = ZeebeAdapter(grpc_channel, max_connection_retries, json_codec)
 
     async def run_process(
         self,
@@ -6,6 +6,7 @@ import os
 import grpc
 
 from pyzeebe import ZeebeClient
+from pyzeebe.codec import JsonCodec
 from pyzeebe.grpc_internals.types import (
     BroadcastSignalResponse,
     CancelProcessInstanceResponse,
@@ -21,9 +22,11 @@ from pyzeebe.types import Variables
 
 
 class SyncZeebeClient:
-    def __init__(self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = 10) -> None:
+    def __init__(
+        self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = 10, json_codec: JsonCodec | None = None
+    ) -> None:
         self.loop = asyncio.get_event_loop()
-        self.client = ZeebeClient(grpc_channel, max_connection_retries)
+        self.client = ZeebeClient(grpc_channel, max_connection_retries, json_codec)
 
     def run_process(
         self,
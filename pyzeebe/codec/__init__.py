@@ -0,0 +1,17 @@
+from .json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_default_codec,
+)
+from .offload import JsonOffloader
+
+__all__ = (
+    "JsonCodec",
+    "JsonOffloader",
+    "MsgspecJsonCodec",
+    "OrjsonCodec",
+    "StdlibJsonCodec",
+    "get_default_codec",
+)
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any
+
+from pyzeebe.function_tools.model_tools import encode_model
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:  # pragma: no cover
+    HAS_ORJSON = False
+
+try:
+    import msgspec
+
+    HAS_MSGSPEC = True
+except ImportError:  # pragma: no cover
+    HAS_MSGSPEC = False
+
+
+class JsonCodec(ABC):
+    """
+    Encodes and decodes the JSON documents exchanged with Zeebe: variables, custom headers and decision outputs.
+    Dataclasses, pydantic models and msgspec structs returned by tasks are encoded as JSON objects.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, value: Any) -> str: ...
+
+    @abstractmethod
+    def loads(self, raw: str | bytes) -> Any: ...
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}()"
+
+
+class StdlibJsonCodec(JsonCodec):
+    name = "json"
+
+    def dumps(self, value: Any) -> str:
+        return json.dumps(value, default=encode_model)
+
+    def loads(self, raw: str | bytes) -> Any:
+        return json.loads(raw)
+
+
+class OrjsonCodec(JsonCodec):
+    name = "orjson"
+
+    def __init__(self) -> None:
+        if not HAS_ORJSON:
+            raise ImportError("OrjsonCodec requires orjson. Install it with: pip install pyzeebe[orjson]")
+
+    def dumps(self, value: Any) -> str:
+        # Like json.dumps, accept non string keys such as ints
+        return orjson.dumps(value, default=encode_model, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def loads(self, raw: str | bytes) -> Any:
+        return orjson.loads(raw)
+
+
+class MsgspecJsonCodec(JsonCodec):
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        if not HAS_MSGSPEC:
+            raise ImportError("MsgspecJsonCodec requires msgspec. Install it with: pip install pyzeebe[msgspec]")
+        self._encoder = msgspec.json.Encoder(enc_hook=encode_model)
+        self._decoder = msgspec.json.Decoder()
+
+    def dumps(self, value: Any) -> str:
+        encoded: bytes = self._encoder.encode(value)
+        return encoded.decode()
+
+    def loads(self, raw: str | bytes) -> Any:
+        return self._decoder.decode(raw)
+
+
+def get_default_codec() -> JsonCodec:
+    """The fastest installed codec: orjson, then msgspec, then the standard library's json module."""
+    if HAS_ORJSON:
+        return OrjsonCodec()
+    if HAS_MSGSPEC:
+        return MsgspecJsonCodec()
+    return StdlibJsonCodec()
@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import logging
+from collections.abc import Callable, Mapping, Sequence
+from typing import Any, TypeVar
+
+from pyzeebe.codec.json_codec import JsonCodec
+from pyzeebe.errors import SettingsError
+from pyzeebe.job.lazy_json import LazyJsonMapping
+
+logger = logging.getLogger(__name__)
+
+R = TypeVar("R")
+
+DEFAULT_OFFLOAD_THRESHOLD = 1024 * 1024
+SCALAR_SIZE = 8
+# Arrays and objects longer than this are estimated from as many of their items
+SAMPLE_SIZE = 32
+# Values the size estimate visits at most, it extrapolates from those once it visited as many
+ESTIMATE_BUDGET = 1000
+LIST_CHUNK_SIZE = 1000
+
+
+class JsonOffloader:
+    """
+    Encodes and decodes JSON payloads of at least threshold bytes in a thread, so a single large payload doesn't
+    stall every other job, poll and stream of the worker. Counts how often that happened.
+
+    The JSON libraries hold the GIL while they run, so a thread alone doesn't free the event loop. Large payloads are
+    therefore encoded in chunks. Decoding can't be split up, the event loop waits while the codec holds the GIL.
+    """
+
+    def __init__(self, codec: JsonCodec, threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD) -> None:
+        if threshold is not None and threshold < 0:
+            raise SettingsError("json_offload_threshold can't be negative")
+        self.codec = codec
+        self.threshold = threshold
+        self.offloaded_encodes = 0
+        self.offloaded_decodes = 0
+
+    async def dumps(self, value: Any) -> str:
+        if self.threshold is None or not exceeds_size(value, self.threshold):
+            return self.codec.dumps(value)
+        self.offloaded_encodes += 1
+        logger.debug("Encoding a payload of at least %s bytes in a thread", self.threshold)
+        return await self._run(dumps_in_chunks, value, self.codec.dumps)
+
+    def is_large(self, variables: Mapping[str, Any]) -> bool:
+        """Whether variables received from Zeebe still have to be decoded and are large enough to offload."""
+        return (
+            self.threshold is not None
+            and isinstance(variables, LazyJsonMapping)
+            and not variables.is_decoded
+            and len(variables.raw) >= self.threshold
+        )
+
+    async def decode(self, function: Callable[..., R], *args: Any) -> R:
+        """Run a function that decodes large variables, like binding a job's variables to a task's arguments."""
+        self.offloaded_decodes += 1
+        logger.debug("Decoding a payload of at least %s bytes in a thread", self.threshold)
+        return await self._run(function, *args)
+
+    async def _run(self, function: Callable[..., R], *args: Any) -> R:
+        return await asyncio.get_running_loop().run_in_executor(None, function, *args)
+
+
+def exceeds_size(value: Any, limit: int) -> bool:
+    """Estimate whether the JSON of value has at least limit bytes, without encoding it."""
+    return estimate_size(value, limit) >= limit
+
+
+def estimate_size(value: Any, limit: int, budget: int = ESTIMATE_BUDGET) -> int:
+    """
+    Rough size of the JSON of value. Stops once the estimate crosses limit, extrapolates long arrays and objects from
+    a sample of their items and visits at most budget values, so its cost doesn't grow with the payload.
+    """
+    return _SizeEstimate(budget).size(value, limit)
+
+
+class _SizeEstimate:
+    def __init__(self, budget: int) -> None:
+        self.budget = budget
+
+    def size(self, value: Any, limit: float) -> int:
+        self.budget -= 1
+        value_type = type(value)
+        if value_type is str:
+            return len(value) + 2
+        if value_type in (int, float, bool) or value is None:
+            return SCALAR_SIZE
+        if isinstance(value, LazyJsonMapping) and not value.is_decoded:
+            return len(value.raw)
+        if isinstance(value, (list, tuple)):
+            return self.sum_sizes(value, limit)
+        if isinstance(value, Mapping):
+            return self.sum_sizes(list(value), limit) + self.sum_sizes(list(value.values()), limit)
+        if dataclasses.is_dataclass(value) and not isinstance(value, type):
+            return self.sum_sizes([getattr(value, field.name) for field in dataclasses.fields(value)], limit)
+        return SCALAR_SIZE
+
+    def sum_sizes(self, values: Sequence[Any], limit: float) -> int:
+        if len(values) > SAMPLE_SIZE:
+            sample = values[:: len(values) // SAMPLE_SIZE][:SAMPLE_SIZE]
+            scale = len(values) / len(sample)
+            return int(self.sum_sizes(sample, limit / scale) * scale)
+        size = 2
+        for count, value in enumerate(values):
+            if self.budget <= 0:
+                # Out of budget, the remaining values are assumed to be like the ones estimated so far
+                return size + (size - 2) * (len(values) - count) // max(count, 1)
+            size += self.size(value, limit - size) + 1
+            if size >= limit:
+                break
+        return size
+
+
+def dumps_in_chunks(value: Any, dumps: Callable[[Any], str], depth: int = 2) -> str:
+    """
+    Encode a JSON object or array piece by piece. The codecs hold the GIL while encoding, between the pieces the
+    event loop thread gets its turn.
+    """
+    if depth and type(value) is dict and value and all(type(key) is str for key in value):
+        return (
+            "{"
+            + ",".join(f"{dumps(key)}:{dumps_in_chunks(item, dumps, depth - 1)}" for key, item in value.items())
+            + "}"
+        )
+    if depth and type(value) is list and len(value) > LIST_CHUNK_SIZE:
+        chunks = (dumps(value[index : index + LIST_CHUNK_SIZE]) for index in range(0, len(value), LIST_CHUNK_SIZE))
+        return "[" + ",".join(chunk[1:-1] for chunk in chunks) + "]"
+    return dumps(value)
@@ -13,3 +13,6 @@ AsyncFunction = Callable[Parameters, Awaitable[ReturnType]]
 Function = Union[SyncFunction[Parameters, ReturnType], AsyncFunction[Parameters, ReturnType]]
 
 DictFunction = Callable[Parameters, Awaitable[Optional[dict[str, Any]]]]
+
+# Name and model type of the parameter that receives all job variables
+ModelParameter = tuple[str, type]
@@ -3,8 +3,9 @@ from __future__ import annotations
 import asyncio
 import functools
 import sys
-from collections.abc import Iterable
-from typing import Any, TypeVar
+from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
+from typing import Any, Optional, TypeVar
 
 from typing_extensions import ParamSpec, TypeIs
 
@@ -18,22 +19,56 @@ else:
 P = ParamSpec("P")
 R = TypeVar("R")
 
+ExecutorProvider = Callable[[], Optional[Executor]]
 
-def asyncify_all_functions(functions: Iterable[Function[..., Any]]) -> list[AsyncFunction[..., Any]]:
+INLINE_ATTRIBUTE = "__pyzeebe_inline__"
+
+
+def inline(function: SyncFunction[P, R]) -> SyncFunction[P, R]:
+    """
+    Mark a sync task function or decorator as non-blocking, so it is called directly on the event loop instead of
+    in a thread. Only use it for functions that return quickly, like logging or small computations.
+    """
+    setattr(function, INLINE_ATTRIBUTE, True)
+    return function
+
+
+def is_inline(function: Function[P, R]) -> bool:
+    return getattr(function, INLINE_ATTRIBUTE, False) is True
+
+
+def asyncify_all_functions(
+    functions: Iterable[Function[..., Any]], executor: ExecutorProvider | None = None
+) -> list[AsyncFunction[..., Any]]:
     async_functions: list[AsyncFunction[..., Any]] = []
     for function in functions:
         if not is_async_function(function):
-            async_functions.append(asyncify(function))
+            async_functions.append(asyncify(function, executor))
         else:
             async_functions.append(function)
     return async_functions
 
 
-def asyncify(task_function: SyncFunction[P, R]) -> AsyncFunction[P, R]:
+def asyncify(task_function: SyncFunction[P, R], executor: ExecutorProvider | None = None) -> AsyncFunction[P, R]:
+    """
+    Run a sync function in an executor. The executor is looked up on every call (so it can be created later),
+    if there is none the event loop's default executor is used. Functions marked with :py:func:`inline` are called
+    directly instead.
+    """
+    if is_inline(task_function):
+
+        @functools.wraps(task_function)
+        async def inline_function(*args: P.args, **kwargs: P.kwargs) -> R:
+            return task_function(*args, **kwargs)
+
+        return inline_function
+
     @functools.wraps(task_function)
     async def async_function(*args: P.args, **kwargs: P.kwargs) -> R:
         loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, functools.partial(task_function, *args, **kwargs))
+        return await loop.run_in_executor(
+            executor() if executor else None, functools.partial(task_function, *args, **kwargs)
+        )
 
     return async_function
 
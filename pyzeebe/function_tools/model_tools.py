@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import dataclasses
+from collections.abc import Mapping
+from typing import Any
+
+from typing_extensions import TypeIs
+
+from pyzeebe.job.lazy_json import LazyJsonMapping
+
+try:
+    import msgspec
+
+    HAS_MSGSPEC = True
+except ImportError:  # pragma: no cover
+    HAS_MSGSPEC = False
+
+try:
+    import pydantic
+
+    HAS_PYDANTIC = True
+except ImportError:  # pragma: no cover
+    HAS_PYDANTIC = False
+
+
+def is_msgspec_model(model_type: Any) -> TypeIs[type[msgspec.Struct]]:
+    return HAS_MSGSPEC and isinstance(model_type, type) and issubclass(model_type, msgspec.Struct)
+
+
+def is_pydantic_model(model_type: Any) -> TypeIs[type[pydantic.BaseModel]]:
+    return HAS_PYDANTIC and isinstance(model_type, type) and issubclass(model_type, pydantic.BaseModel)
+
+
+def is_model_type(annotation: Any) -> TypeIs[type]:
+    """Dataclasses, pydantic models and msgspec structs can be bound to job variables."""
+    return (
+        (isinstance(annotation, type) and dataclasses.is_dataclass(annotation))
+        or is_pydantic_model(annotation)
+        or is_msgspec_model(annotation)
+    )
+
+
+def get_model_fields(model_type: type) -> list[str]:
+    """Names of the variables a model is built from."""
+    if is_msgspec_model(model_type):
+        return [field.encode_name for field in msgspec.structs.fields(model_type)]
+    if is_pydantic_model(model_type):
+        return [field.alias or name for name, field in model_type.model_fields.items()]
+    return [field.name for field in dataclasses.fields(model_type)]
+
+
+def load_model(variables: Mapping[str, Any], model_type: type) -> Any:
+    """
+    Build a model from job variables. msgspec structs and pydantic models are validated, and decoded straight from
+    the JSON received from Zeebe if the variables weren't decoded yet.
+    """
+    raw = variables.raw if isinstance(variables, LazyJsonMapping) and not variables.is_decoded else None
+    if is_msgspec_model(model_type):
+        if raw is not None:
+            return msgspec.json.decode(raw, type=model_type)
+        return msgspec.convert(variables, type=model_type)
+    if is_pydantic_model(model_type):
+        if raw is not None:
+            return model_type.model_validate_json(raw)
+        return model_type.model_validate(variables)
+    if isinstance(variables, LazyJsonMapping):
+        variables = variables.decode()
+    field_names = [field.name for field in dataclasses.fields(model_type)]
+    return model_type(**{name: variables[name] for name in field_names if name in variables})
+
+
+def encode_model(value: Any) -> Any:
+    """Default hook of the JSON codecs, turns models returned by tasks into JSON compatible values."""
+    if is_msgspec_model(type(value)):
+        return msgspec.to_builtins(value)
+    if is_pydantic_model(type(value)):
+        return value.model_dump(mode="json", by_alias=True)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import inspect
+import typing
 from typing import Any
 
-from pyzeebe.function_tools import Function
+from pyzeebe.function_tools import Function, ModelParameter
+from pyzeebe.function_tools.model_tools import get_model_fields, is_model_type
 from pyzeebe.job.job import Job
 
 
-def get_parameters_from_function(task_function: Function[..., Any]) -> list[str] | None:
+def get_parameters_from_function(task_function: Function[..., Any], typed_variables: bool = False) -> list[str] | None:
     function_signature = inspect.signature(task_function)
     for _, parameter in function_signature.parameters.items():
         if parameter.kind in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD):
@@ -16,16 +18,54 @@ def get_parameters_from_function(task_function: Function[..., Any]) -> list[str]
     if not function_signature.parameters:
         return None
 
-    if all(param.annotation == Job for param in function_signature.parameters.values()):
+    annotations = get_annotations(task_function)
+    if all(annotation == Job for annotation in annotations.values()):
         return []
 
-    return [param.name for param in function_signature.parameters.values() if param.annotation != Job]
+    model_parameter = get_model_parameter(task_function) if typed_variables else None
+    if model_parameter:
+        return get_model_fields(model_parameter[1])
+
+    return [name for name, annotation in annotations.items() if annotation != Job]
 
 
 def get_job_parameter_name(function: Function[..., Any]) -> str | None:
-    function_signature = inspect.signature(function)
-    params = list(function_signature.parameters.values())
-    for param in params:
-        if param.annotation == Job:
-            return param.name
+    for name, annotation in get_annotations(function).items():
+        if annotation == Job:
+            return name
+    return None
+
+
+def receives_job_list(function: Function[..., Any]) -> bool:
+    return any(
+        typing.get_origin(annotation) is list and typing.get_args(annotation) == (Job,)
+        for annotation in get_annotations(function).values()
+    )
+
+
+def get_model_parameter(function: Function[..., Any]) -> ModelParameter | None:
+    """The only parameter besides the Job, if it's annotated with a model that receives all job variables."""
+    parameter = get_variables_parameter(function)
+    if parameter and is_model_type(parameter[1]):
+        return parameter
     return None
+
+
+def get_variables_parameter(function: Function[..., Any]) -> tuple[str, Any] | None:
+    """Name and annotation of the only parameter besides the Job."""
+    parameters = [(name, annotation) for name, annotation in get_annotations(function).items() if annotation != Job]
+    if len(parameters) == 1:
+        return parameters[0]
+    return None
+
+
+def get_annotations(function: Function[..., Any]) -> dict[str, Any]:
+    """Annotations of the function's parameters, resolved if they are strings (from __future__ import annotations)."""
+    try:
+        type_hints = typing.get_type_hints(function)
+    except (NameError, TypeError):
+        type_hints = {}
+    return {
+        param.name: type_hints.get(param.name, param.annotation)
+        for param in inspect.signature(function).parameters.values()
+    }
@@ -6,7 +6,7 @@ from dataclasses import dataclass
 from pyzeebe.types import JsonType, Variables
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateProcessInstanceResponse:
     process_definition_key: int
     """the key of the process definition which was used to create the process instance"""
@@ -24,7 +24,7 @@ class CreateProcessInstanceResponse:
     """the tenant ID of the created process instance"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CreateProcessInstanceWithResultResponse:
     process_definition_key: int
     """the key of the process definition which was used to create the process instance"""
@@ -44,14 +44,14 @@ class CreateProcessInstanceWithResultResponse:
     """the tenant ID of the created process instance"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CancelProcessInstanceResponse:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeployResourceResponse:
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class ProcessMetadata:
         bpmn_process_id: str
         """the bpmn process ID, as parsed during deployment; together with the version forms a
@@ -66,7 +66,7 @@ class DeployResourceResponse:
         tenant_id: str | None
         """the tenant ID of the deployed process"""
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class DecisionMetadata:
         dmn_decision_id: str
         """the dmn decision ID, as parsed during deployment; together with the
@@ -91,7 +91,7 @@ class DeployResourceResponse:
         tenant_id: str | None
         """the tenant ID of the deployed decision"""
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class DecisionRequirementsMetadata:
         dmn_decision_requirements_id: str
         """the dmn decision requirements ID, as parsed during deployment; together
@@ -112,7 +112,7 @@ class DeployResourceResponse:
         tenant_id: str | None
         """the tenant ID of the deployed decision requirements"""
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class FormMetadata:
         form_id: str
         """the form ID, as parsed during deployment; together with the
@@ -135,16 +135,16 @@ class DeployResourceResponse:
     """the tenant ID of the deployed resources"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EvaluateDecisionResponse:
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class EvaluatedDecision:
 
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class MatchedDecisionRule:
 
-            @dataclass(frozen=True)
+            @dataclass(frozen=True, slots=True)
             class EvaluatedDecisionOutput:
                 output_id: str
                 """the id of the evaluated decision output"""
@@ -160,7 +160,7 @@ class EvaluateDecisionResponse:
             evaluated_outputs: list[EvaluatedDecisionOutput]
             """the evaluated decision outputs"""
 
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class EvaluatedDecisionInput:
             input_id: str
             """the id of the evaluated decision input"""
@@ -230,7 +230,7 @@ class EvaluateDecisionResponse:
     """the unique key identifying this decision evaluation"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class BroadcastSignalResponse:
     key: int
     """the unique ID of the signal that was broadcasted"""
@@ -238,7 +238,7 @@ class BroadcastSignalResponse:
     """the tenant ID of the signal that was broadcasted"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PublishMessageResponse:
     key: int
     """the unique ID of the message that was published"""
@@ -246,33 +246,33 @@ class PublishMessageResponse:
     """the tenant ID of the message"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompleteJobResponse:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class FailJobResponse:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ThrowErrorResponse:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UpdateJobTimeoutResponse:
     pass
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TopologyResponse:
 
-    @dataclass(frozen=True)
+    @dataclass(frozen=True, slots=True)
     class BrokerInfo:
 
-        @dataclass(frozen=True)
+        @dataclass(frozen=True, slots=True)
         class Partition:
 
             class PartitionBrokerRole(enum.IntEnum):
@@ -319,7 +319,7 @@ class TopologyResponse:
     """gateway version"""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class HealthCheckResponse:
     """GRPC Health Checking Protocol
 
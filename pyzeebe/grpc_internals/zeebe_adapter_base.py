@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import logging
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import TYPE_CHECKING, NoReturn, TypeAlias, cast
 
 import grpc
 from grpc_health.v1.health_pb2_grpc import HealthStub
 
+from pyzeebe.codec import JsonCodec, get_default_codec
 from pyzeebe.errors import (
     UnknownGrpcStatusCodeError,
     ZeebeBackPressureError,
@@ -24,10 +27,29 @@ if TYPE_CHECKING:
 Callback: TypeAlias = Callable[[], None]
 logger = logging.getLogger(__name__)
 
+# Whether failed requests of the current asyncio task count towards max_connection_retries
+_counts_connection_retries: ContextVar[bool] = ContextVar("counts_connection_retries", default=True)
+
+
+@contextmanager
+def uncounted_retries() -> Iterator[None]:
+    """
+    Requests made inside don't count towards max_connection_retries. For background retries of a request whose first
+    failure already counted, so a short outage with many retried requests doesn't close the channel.
+    """
+    token = _counts_connection_retries.set(False)
+    try:
+        yield
+    finally:
+        _counts_connection_retries.reset(token)
+
 
 class ZeebeAdapterBase:
-    def __init__(self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = -1):
+    def __init__(
+        self, grpc_channel: grpc.aio.Channel, max_connection_retries: int = -1, json_codec: JsonCodec | None = None
+    ):
         self._channel = grpc_channel
+        self._json_codec = json_codec or get_default_codec()
         self._gateway_stub = cast("GatewayAsyncStub", GatewayStub(grpc_channel))
         self._health_stub = HealthStub(grpc_channel)
         self._connected = True
@@ -51,9 +73,10 @@ class ZeebeAdapterBase:
             pyzeebe_error = self._create_pyzeebe_error_from_grpc_error(grpc_error)
             raise pyzeebe_error
         except (ZeebeGatewayUnavailableError, ZeebeInternalError, ZeebeDeadlineExceeded):
-            self._current_connection_retries += 1
-            if not self._should_retry():
-                await self._close()
+            if _counts_connection_retries.get():
+                self._current_connection_retries += 1
+                if not self._should_retry():
+                    await self._close()
             raise
 
     async def _close(self) -> None:
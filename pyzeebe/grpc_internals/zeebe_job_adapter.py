@@ -1,12 +1,12 @@
 from __future__ import annotations
 
-import json
 import logging
-import types
 from collections.abc import AsyncGenerator, Iterable
 
 import grpc
 
+from pyzeebe.codec import JsonCodec
+from pyzeebe.codec.offload import DEFAULT_OFFLOAD_THRESHOLD, JsonOffloader
 from pyzeebe.errors import (
     ActivateJobsRequestInvalidError,
     JobAlreadyDeactivatedError,
@@ -16,6 +16,7 @@ from pyzeebe.errors import (
 from pyzeebe.grpc_internals.grpc_utils import is_error_status
 from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
 from pyzeebe.job.job import Job
+from pyzeebe.job.lazy_json import LazyJsonCache, LazyJsonMapping
 from pyzeebe.proto.gateway_pb2 import (
     ActivatedJob,
     ActivateJobsRequest,
@@ -25,7 +26,7 @@ from pyzeebe.proto.gateway_pb2 import (
     ThrowErrorRequest,
     UpdateJobTimeoutRequest,
 )
-from pyzeebe.types import Variables
+from pyzeebe.types import RawJson, Variables
 
 from .types import (
     CompleteJobResponse,
@@ -37,9 +38,22 @@ from .types import (
 logger = logging.getLogger(__name__)
 
 DEFAULT_GRPC_REQUEST_TIMEOUT = 20  # This constant represents the fallback timeout value
+# Custom headers are static per BPMN element, a worker sees only a few distinct ones
+CUSTOM_HEADERS_CACHE_SIZE = 1024
 
 
 class ZeebeJobAdapter(ZeebeAdapterBase):
+    def __init__(
+        self,
+        grpc_channel: grpc.aio.Channel,
+        max_connection_retries: int = -1,
+        json_codec: JsonCodec | None = None,
+        json_offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+    ):
+        super().__init__(grpc_channel, max_connection_retries, json_codec)
+        self.json_offloader = JsonOffloader(self._json_codec, json_offload_threshold)
+        self._custom_headers = LazyJsonCache(self._json_codec.loads, CUSTOM_HEADERS_CACHE_SIZE)
+
     async def activate_jobs(
         self,
         task_type: str,
@@ -82,17 +96,18 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
         stream_request_timeout: int,
         tenant_ids: Iterable[str] | None = None,
     ) -> AsyncGenerator[Job]:
+        call = self._gateway_stub.StreamActivatedJobs(
+            StreamActivatedJobsRequest(
+                type=task_type,
+                worker=worker,
+                timeout=timeout,
+                fetchVariable=variables_to_fetch,
+                tenantIds=tenant_ids or [],
+            ),
+            timeout=stream_request_timeout,
+        )
         try:
-            async for raw_job in self._gateway_stub.StreamActivatedJobs(
-                StreamActivatedJobsRequest(
-                    type=task_type,
-                    worker=worker,
-                    timeout=timeout,
-                    fetchVariable=variables_to_fetch,
-                    tenantIds=tenant_ids or [],
-                ),
-                timeout=stream_request_timeout,
-            ):
+            async for raw_job in call:
                 job = self._create_job_from_raw_job(raw_job)
                 logger.debug("Got job: %s from zeebe", job)
                 yield job
@@ -100,6 +115,11 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
             if is_error_status(grpc_error, grpc.StatusCode.INVALID_ARGUMENT):
                 raise StreamActivateJobsRequestInvalidError(task_type, worker, timeout) from grpc_error
             await self._handle_grpc_error(grpc_error)
+        finally:
+            # Closing the generator early must close the stream, otherwise Zeebe keeps pushing jobs to it
+            if call.cancel():
+                # Wait for grpc to settle the call, so it doesn't report back to a loop that's already closed
+                await call.code()
 
     def _create_job_from_raw_job(self, response: ActivatedJob) -> Job:
         return Job(
@@ -111,17 +131,19 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
             process_definition_key=response.processDefinitionKey,
             element_id=response.elementId,
             element_instance_key=response.elementInstanceKey,
-            custom_headers=types.MappingProxyType(json.loads(response.customHeaders)),
+            custom_headers=self._custom_headers.get(response.customHeaders),
             worker=response.worker,
             retries=response.retries,
             deadline=response.deadline,
-            variables=types.MappingProxyType(json.loads(response.variables)),
+            variables=LazyJsonMapping(response.variables, self._json_codec.loads),
             tenant_id=response.tenantId,
         )
 
-    async def complete_job(self, job_key: int, variables: Variables) -> CompleteJobResponse:
+    async def complete_job(self, job_key: int, variables: Variables | RawJson) -> CompleteJobResponse:
         try:
-            await self._gateway_stub.CompleteJob(CompleteJobRequest(jobKey=job_key, variables=json.dumps(variables)))
+            await self._gateway_stub.CompleteJob(
+                CompleteJobRequest(jobKey=job_key, variables=await self._encode_variables(variables))
+            )
         except grpc.aio.AioRpcError as grpc_error:
             if is_error_status(grpc_error, grpc.StatusCode.NOT_FOUND):
                 raise JobNotFoundError(job_key=job_key) from grpc_error
@@ -131,6 +153,14 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
 
         return CompleteJobResponse()
 
+    async def _encode_variables(self, variables: Variables | RawJson) -> str:
+        # Variables that are already encoded are sent as they are
+        if isinstance(variables, bytes):
+            return variables.decode()
+        if isinstance(variables, str):
+            return variables
+        return await self.json_offloader.dumps(variables)
+
     async def fail_job(
         self, job_key: int, retries: int, message: str, retry_back_off_ms: int, variables: Variables
     ) -> FailJobResponse:
@@ -141,7 +171,7 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
                     retries=retries,
                     errorMessage=message,
                     retryBackOff=retry_back_off_ms,
-                    variables=json.dumps(variables),
+                    variables=await self.json_offloader.dumps(variables),
                 )
             )
         except grpc.aio.AioRpcError as grpc_error:
@@ -162,7 +192,7 @@ class ZeebeJobAdapter(ZeebeAdapterBase):
                     jobKey=job_key,
                     errorMessage=message,
                     errorCode=error_code,
-                    variables=json.dumps(variables),
+                    variables=await self.json_offloader.dumps(variables),
                 )
             )
         except grpc.aio.AioRpcError as grpc_error:
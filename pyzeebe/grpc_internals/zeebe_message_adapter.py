@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-import json
-
 import grpc
 
 from pyzeebe.errors import MessageAlreadyExistsError
@@ -24,7 +22,7 @@ class ZeebeMessageAdapter(ZeebeAdapterBase):
             response = await self._gateway_stub.BroadcastSignal(
                 BroadcastSignalRequest(
                     signalName=signal_name,
-                    variables=json.dumps(variables),
+                    variables=self._json_codec.dumps(variables),
                     tenantId=tenant_id,  # type: ignore[arg-type]
                 )
             )
@@ -49,7 +47,7 @@ class ZeebeMessageAdapter(ZeebeAdapterBase):
                     correlationKey=correlation_key,
                     messageId=message_id,  # type: ignore[arg-type]
                     timeToLive=time_to_live_in_milliseconds,
-                    variables=json.dumps(variables),
+                    variables=self._json_codec.dumps(variables),
                     tenantId=tenant_id,  # type: ignore[arg-type]
                 )
             )
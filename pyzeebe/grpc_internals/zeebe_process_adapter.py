@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import json
 import os
 from collections.abc import Callable, Iterable
 from typing import NoReturn
@@ -59,7 +58,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
                 CreateProcessInstanceRequest(
                     bpmnProcessId=bpmn_process_id,
                     version=version,
-                    variables=json.dumps(variables),
+                    variables=self._json_codec.dumps(variables),
                     tenantId=tenant_id,  # type: ignore[arg-type]
                 )
             )
@@ -89,7 +88,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
                     request=CreateProcessInstanceRequest(
                         bpmnProcessId=bpmn_process_id,
                         version=version,
-                        variables=json.dumps(variables),
+                        variables=self._json_codec.dumps(variables),
                         tenantId=tenant_id,  # type: ignore[arg-type]
                     ),
                     requestTimeout=timeout,
@@ -104,7 +103,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
             bpmn_process_id=response.bpmnProcessId,
             version=response.version,
             process_instance_key=response.processInstanceKey,
-            variables=json.loads(response.variables),
+            variables=self._json_codec.loads(response.variables),
             tenant_id=response.tenantId,
         )
 
@@ -227,7 +226,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
                 EvaluateDecisionRequest(
                     decisionKey=decision_key,  # type: ignore[arg-type]
                     decisionId=decision_id,  # type: ignore[arg-type]
-                    variables=json.dumps(variables),
+                    variables=self._json_codec.dumps(variables),
                     tenantId=tenant_id,  # type: ignore[arg-type]
                 )
             )
@@ -248,7 +247,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
             decision_version=response.decisionVersion,
             decision_requirements_id=response.decisionRequirementsId,
             decision_requirements_key=response.decisionRequirementsKey,
-            decision_output=json.loads(response.decisionOutput),
+            decision_output=self._json_codec.loads(response.decisionOutput),
             evaluated_decisions=[
                 self._create_evaluated_decision_from_raw(evaluated_decision)
                 for evaluated_decision in response.evaluatedDecisions
@@ -268,7 +267,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
             decision_name=response.decisionName,
             decision_version=response.decisionVersion,
             decision_type=response.decisionType,
-            decision_output=json.loads(response.decisionOutput),
+            decision_output=self._json_codec.loads(response.decisionOutput),
             matched_rules=[self._create_matched_rule_from_raw(matched_rule) for matched_rule in response.matchedRules],
             evaluated_inputs=[
                 self._create_evaluated_input_from_raw(evaluated_input) for evaluated_input in response.evaluatedInputs
@@ -294,7 +293,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
         return EvaluateDecisionResponse.EvaluatedDecision.EvaluatedDecisionInput(
             input_id=response.inputId,
             input_name=response.inputName,
-            input_value=json.loads(response.inputValue),
+            input_value=self._json_codec.loads(response.inputValue),
         )
 
     def _create_evaluated_output_from_raw(
@@ -303,7 +302,7 @@ class ZeebeProcessAdapter(ZeebeAdapterBase):
         return EvaluateDecisionResponse.EvaluatedDecision.MatchedDecisionRule.EvaluatedDecisionOutput(
             output_id=response.outputId,
             output_name=response.outputName,
-            output_value=json.loads(response.outputValue),
+            output_value=self._json_codec.loads(response.outputValue),
         )
 
 
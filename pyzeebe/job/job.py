@@ -1,17 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
 from pyzeebe.job.job_status import JobStatus
-from pyzeebe.types import Headers, Variables
+from pyzeebe.types import Headers, RawJson, Variables
 
 if TYPE_CHECKING:
     from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
+    from pyzeebe.worker.completion_dispatcher import CompletionDispatcher
+    from pyzeebe.worker.task_state import TaskState
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class Job:
+    """
+    A job activated from Zeebe. Jobs are identified by their key: two jobs with the same key are equal and have the
+    same hash, whatever their status or variables.
+    """
+
     key: int
     type: str
     process_instance_key: int
@@ -27,7 +34,7 @@ class Job:
     variables: Variables
     tenant_id: str | None = None
     status: JobStatus = JobStatus.Running
-    task_result = None
+    task_result: Any = field(default=None, init=False, repr=False)
 
     def set_task_result(self, task_result: Any) -> None:
         object.__setattr__(self, "task_result", task_result)
@@ -40,11 +47,23 @@ class Job:
             return NotImplemented
         return self.key == other.key
 
+    def __hash__(self) -> int:
+        return hash(self.key)
+
 
 class JobController:
-    def __init__(self, job: Job, zeebe_adapter: ZeebeAdapter) -> None:
+    def __init__(
+        self,
+        job: Job,
+        zeebe_adapter: ZeebeAdapter,
+        completion_dispatcher: CompletionDispatcher | None = None,
+        task_state: TaskState | None = None,
+    ) -> None:
         self._job = job
         self._zeebe_adapter = zeebe_adapter
+        self._completion_dispatcher = completion_dispatcher
+        # Knows the job's current deadline, which moves when its timeout is extended
+        self._task_state = task_state
 
     async def set_running_after_decorators_status(self) -> None:
         """
@@ -52,10 +71,17 @@ class JobController:
         """
         self._job._set_status(JobStatus.RunningAfterDecorators)
 
-    async def set_success_status(self, variables: Variables | None = None) -> None:
+    async def set_success_status(self, variables: Variables | RawJson | None = None) -> None:
         """
         Success status means that the job has been completed as intended.
 
+        If the worker sends completions in the background (see max_pending_completions of
+        :py:class:`ZeebeWorker`), this returns once the completion is handed over and errors are only logged.
+
+        Args:
+            variables (dict | str | bytes): Variables to complete the job with. A str or bytes must be an encoded
+                JSON object, it's sent to Zeebe as it is.
+
         Raises:
             ZeebeBackPressureError: If Zeebe is currently in back pressure (too many requests)
             ZeebeGatewayUnavailableError: If the Zeebe gateway is unavailable
@@ -63,7 +89,11 @@ class JobController:
 
         """
         self._job._set_status(JobStatus.Completed)
-        await self._zeebe_adapter.complete_job(job_key=self._job.key, variables=variables or {})
+        if self._completion_dispatcher:
+            deadline = self._task_state.get_deadline(self._job) if self._task_state else self._job.deadline
+            await self._completion_dispatcher.complete_job(self._job, variables or {}, deadline=deadline)
+        else:
+            await self._zeebe_adapter.complete_job(job_key=self._job.key, variables=variables or {})
 
     async def set_failure_status(
         self,
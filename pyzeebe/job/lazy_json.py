@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from collections.abc import Callable, Iterator, Mapping
+from typing import Any
+
+JsonLoads = Callable[[str], Any]
+
+EMPTY_JSON_OBJECTS = ("", "{}")
+
+
+class LazyJsonMapping(Mapping[str, Any]):
+    """
+    A read only mapping decoded from a JSON object on first access.
+
+    Jobs keep their variables and custom headers as received from Zeebe, so jobs waiting in a queue don't hold
+    decoded copies and handlers that never read them don't pay for decoding.
+    """
+
+    __slots__ = ("_raw", "_loads", "_decoded")
+
+    def __init__(self, raw: str, loads: JsonLoads = json.loads) -> None:
+        self._raw = raw
+        self._loads = loads
+        self._decoded: Mapping[str, Any] | None = {} if raw in EMPTY_JSON_OBJECTS else None
+
+    @property
+    def raw(self) -> str:
+        """The JSON object as received from Zeebe."""
+        return self._raw
+
+    @property
+    def is_decoded(self) -> bool:
+        return self._decoded is not None
+
+    def decode(self) -> Mapping[str, Any]:
+        """The decoded JSON object. It's shared, so it must not be modified."""
+        if self._decoded is None:
+            self._decoded = self._loads(self._raw)
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        return self.decode()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.decode())
+
+    def __len__(self) -> int:
+        return len(self.decode())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self.decode()
+
+    def __repr__(self) -> str:
+        if self._decoded is None:
+            return f"{self.__class__.__name__}({self._raw!r})"
+        return repr(self._decoded)
+
+
+class LazyJsonCache:
+    """
+    A bounded LRU of :py:class:`LazyJsonMapping` by their JSON, so equal JSON objects are decoded at most once and
+    share one mapping. Meant for values that repeat across jobs, like the custom headers of a BPMN element.
+    """
+
+    def __init__(self, loads: JsonLoads = json.loads, max_size: int = 1024) -> None:
+        self._loads = loads
+        self.max_size = max_size
+        self._mappings: OrderedDict[str, LazyJsonMapping] = OrderedDict()
+
+    def get(self, raw: str) -> LazyJsonMapping:
+        mapping = self._mappings.get(raw)
+        if mapping is not None:
+            self._mappings.move_to_end(raw)
+            return mapping
+        mapping = LazyJsonMapping(raw, self._loads)
+        self._mappings[raw] = mapping
+        if len(self._mappings) > self.max_size:
+            self._mappings.popitem(last=False)
+        return mapping
+
+    def __len__(self) -> int:
+        return len(self._mappings)
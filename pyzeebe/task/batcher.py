@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any
+
+from pyzeebe.job.job import Job
+
+logger = logging.getLogger(__name__)
+
+BatchRunner = Callable[[list[Job]], Awaitable[Sequence[Any]]]
+
+
+class JobBatcher:
+    """
+    Collects jobs until max_batch jobs are waiting or max_wait_ms passed since the first one, then runs them with a
+    single call. Every job gets its own result, or its own exception raised from :py:meth:`submit`.
+    """
+
+    def __init__(self, run_batch: BatchRunner, max_batch: int, max_wait_ms: int) -> None:
+        self.run_batch = run_batch
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._waiting: list[tuple[Job, asyncio.Future[Any]]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._running: set[asyncio.Task[None]] = set()
+
+    async def submit(self, job: Job) -> Any:
+        loop = asyncio.get_running_loop()
+        result: asyncio.Future[Any] = loop.create_future()
+        self._waiting.append((job, result))
+        if len(self._waiting) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait_ms / 1000, self._flush)
+        return await result
+
+    def _flush(self) -> None:
+        if self._timer:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._waiting = self._waiting, []
+        if not batch:
+            return
+        running = asyncio.create_task(self._run(batch))
+        self._running.add(running)
+        running.add_done_callback(self._running.discard)
+
+    async def _run(self, batch: list[tuple[Job, asyncio.Future[Any]]]) -> None:
+        logger.debug("Running batch of %s jobs", len(batch))
+        results: Sequence[Any]
+        try:
+            results = await self.run_batch([job for job, _ in batch])
+            if len(results) != len(batch):
+                raise ValueError(f"Batch function returned {len(results)} results for {len(batch)} jobs")
+        except Exception as error:
+            results = [error] * len(batch)
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
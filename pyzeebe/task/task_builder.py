@@ -2,23 +2,39 @@ from __future__ import annotations
 
 import functools
 import inspect
+import json
 import logging
-from collections.abc import Sequence
+from collections.abc import Awaitable, Callable, Sequence
 from typing import Any, TypeVar
 
 from typing_extensions import ParamSpec
 
 from pyzeebe import Job
-from pyzeebe.function_tools import DictFunction, Function
-from pyzeebe.function_tools.async_tools import asyncify, is_async_function
+from pyzeebe.errors import SettingsError
+from pyzeebe.function_tools import DictFunction, Function, ModelParameter
+from pyzeebe.function_tools.async_tools import asyncify, is_async_function, is_inline
 from pyzeebe.function_tools.dict_tools import convert_to_dict_function
-from pyzeebe.function_tools.parameter_tools import get_job_parameter_name
+from pyzeebe.function_tools.model_tools import load_model
+from pyzeebe.function_tools.parameter_tools import (
+    get_annotations,
+    get_job_parameter_name,
+    get_model_parameter,
+    get_variables_parameter,
+    receives_job_list,
+)
 from pyzeebe.job.job import JobController
+from pyzeebe.job.lazy_json import LazyJsonMapping
+from pyzeebe.task.batcher import BatchRunner, JobBatcher
 from pyzeebe.task.exception_handler import default_exception_handler
 from pyzeebe.task.task import Task
 from pyzeebe.task.task_config import TaskConfig
-from pyzeebe.task.types import AsyncTaskDecorator, DecoratorRunner, JobHandler
-from pyzeebe.types import Variables
+from pyzeebe.task.types import (
+    ArgumentBinder,
+    AsyncTaskDecorator,
+    DecoratorRunner,
+    JobHandler,
+)
+from pyzeebe.types import RawJson, Variables
 
 P = ParamSpec("P")
 R = TypeVar("R")
@@ -27,25 +43,96 @@ logger = logging.getLogger(__name__)
 
 
 def build_task(task_function: Function[..., Any], task_config: TaskConfig) -> Task:
+    if task_config.max_batch:
+        return Task(task_function, build_batch_job_handler(task_function, task_config), task_config)
     task_config.job_parameter_name = get_job_parameter_name(task_function)
+    if task_config.raw_variables:
+        task_config.raw_variables_parameter = get_raw_variables_parameter(task_function, task_config)
+    if task_config.typed_variables:
+        task_config.model_parameter = get_typed_variables_parameter(task_function, task_config)
+    if task_config.execution_mode == "process":
+        validate_process_task_function(task_function, task_config)
     return Task(task_function, build_job_handler(task_function, task_config), task_config)
 
 
+def get_raw_variables_parameter(task_function: Function[..., Any], task_config: TaskConfig) -> tuple[str, Any] | None:
+    parameter = get_variables_parameter(task_function)
+    if parameter is None and not only_job_is_required_in_task_function(task_function):
+        raise SettingsError(
+            f"Task {task_config.type} receives raw variables, its function must have one parameter besides the Job"
+        )
+    return parameter
+
+
+def get_typed_variables_parameter(task_function: Function[..., Any], task_config: TaskConfig) -> ModelParameter:
+    parameter = get_model_parameter(task_function)
+    if parameter is None:
+        raise SettingsError(
+            f"Task {task_config.type} receives typed variables, its function must have one parameter besides the Job, "
+            "annotated with a dataclass, pydantic model or msgspec struct"
+        )
+    return parameter
+
+
+def validate_process_task_function(task_function: Function[..., Any], task_config: TaskConfig) -> None:
+    if is_async_function(task_function):
+        raise SettingsError(f"Task {task_config.type} runs in a process pool, its function must not be async")
+    if task_config.job_parameter_name:
+        raise SettingsError(f"Task {task_config.type} runs in a process pool, its function can't receive the Job")
+    if is_inline(task_function):
+        raise SettingsError(f"Task {task_config.type} runs in a process pool, its function can't run inline")
+
+
 def build_job_handler(task_function: Function[..., Any], task_config: TaskConfig) -> JobHandler:
     prepared_task_function = prepare_task_function(task_function, task_config)
+    bind_arguments = create_argument_binder(prepared_task_function, task_config)
+
+    async def run_task(job: Job, job_controller: JobController) -> tuple[Variables, bool]:
+        return await run_original_task_function(
+            prepared_task_function, bind_arguments, task_config, job, job_controller
+        )
+
+    return create_job_handler(task_function, run_task, task_config)
+
 
+def build_batch_job_handler(batch_function: Function[..., Any], task_config: TaskConfig) -> JobHandler:
+    if not task_config.max_batch:
+        raise SettingsError(f"Task {task_config.type} has no max_batch")
+    if len(inspect.signature(batch_function).parameters) != 1:
+        raise SettingsError(f"Batch function of task {task_config.type} must receive exactly one parameter")
+    batcher = JobBatcher(
+        prepare_batch_function(batch_function, task_config), task_config.max_batch, task_config.max_batch_wait_ms
+    )
+
+    async def run_task(job: Job, job_controller: JobController) -> tuple[Variables, bool]:
+        try:
+            return await batcher.submit(job), True
+        except Exception as e:
+            logger.debug("Failed job: %s. Error: %s.", job, e)
+            exception_handler = task_config.exception_handler or default_exception_handler
+            await exception_handler(e, job, job_controller)
+            return job.variables, False
+
+    return create_job_handler(batch_function, run_task, task_config)
+
+
+def create_job_handler(
+    task_function: Function[..., Any],
+    run_task: Callable[[Job, JobController], Awaitable[tuple[Variables, bool]]],
+    task_config: TaskConfig,
+) -> JobHandler:
     before_decorator_runner = create_decorator_runner(task_config.before)
     after_decorator_runner = create_decorator_runner(task_config.after)
 
     @functools.wraps(task_function)
     async def job_handler(job: Job, job_controller: JobController) -> Job:
-        job = await before_decorator_runner(job)
-        return_variables, succeeded = await run_original_task_function(
-            prepared_task_function, task_config, job, job_controller
-        )
+        if before_decorator_runner:
+            job = await before_decorator_runner(job)
+        return_variables, succeeded = await run_task(job, job_controller)
         job.set_task_result(return_variables)
         await job_controller.set_running_after_decorators_status()
-        job = await after_decorator_runner(job)
+        if after_decorator_runner:
+            job = await after_decorator_runner(job)
         if succeeded:
             await job_controller.set_success_status(variables=return_variables)
         return job
@@ -55,7 +142,7 @@ def build_job_handler(task_function: Function[..., Any], task_config: TaskConfig
 
 def prepare_task_function(task_function: Function[P, R], task_config: TaskConfig) -> DictFunction[P]:
     if not is_async_function(task_function):
-        task_function = asyncify(task_function)
+        task_function = asyncify(task_function, lambda: task_config.executor)
 
     if task_config.single_value:
         return convert_to_dict_function(task_function, task_config.variable_name)
@@ -63,28 +150,37 @@ def prepare_task_function(task_function: Function[P, R], task_config: TaskConfig
     return task_function  # type: ignore[return-value]
 
 
+def prepare_batch_function(batch_function: Function[..., Any], task_config: TaskConfig) -> BatchRunner:
+    if not is_async_function(batch_function):
+        batch_function = asyncify(batch_function, lambda: task_config.executor)
+    receives_jobs = receives_job_list(batch_function)
+    bind_variables = create_variables_binder(batch_function, task_config)
+
+    async def run_batch(jobs: list[Job]) -> list[Any]:
+        batch = jobs if receives_jobs else [bind_variables(job) for job in jobs]
+        results = await batch_function(batch)
+        return [convert_batch_result(result, task_config) for result in results]
+
+    return run_batch
+
+
+def convert_batch_result(result: Any, task_config: TaskConfig) -> Any:
+    if isinstance(result, Exception):
+        return result
+    if task_config.single_value:
+        return {task_config.variable_name: result}
+    return result or {}
+
+
 async def run_original_task_function(
-    task_function: DictFunction[...], task_config: TaskConfig, job: Job, job_controller: JobController
+    task_function: DictFunction[...],
+    bind_arguments: ArgumentBinder,
+    task_config: TaskConfig,
+    job: Job,
+    job_controller: JobController,
 ) -> tuple[Variables, bool]:
     try:
-        if task_config.variables_to_fetch is None:
-            variables: dict[str, Any] = {}
-        elif task_wants_all_variables(task_config):
-            if only_job_is_required_in_task_function(task_function):
-                variables = {}
-            else:
-                variables = {**job.variables}
-        else:
-            variables = {
-                k: v
-                for k, v in job.variables.items()
-                if k in task_config.variables_to_fetch or k == task_config.job_parameter_name
-            }
-
-        if task_config.job_parameter_name:
-            variables[task_config.job_parameter_name] = job
-
-        returned_value = await task_function(**variables)
+        returned_value = await task_function(**await bind_job_arguments(bind_arguments, task_config, job))
 
         if returned_value is None:
             returned_value = {}
@@ -97,16 +193,92 @@ async def run_original_task_function(
         return job.variables, False
 
 
-def only_job_is_required_in_task_function(task_function: DictFunction[...]) -> bool:
-    function_signature = inspect.signature(task_function)
-    return all(param.annotation == Job for param in function_signature.parameters.values())
+async def bind_job_arguments(bind_arguments: ArgumentBinder, task_config: TaskConfig, job: Job) -> dict[str, Any]:
+    offloader = task_config.json_offloader
+    if offloader and not task_config.raw_variables and offloader.is_large(job.variables):
+        return await offloader.decode(bind_arguments, job)
+    return bind_arguments(job)
+
+
+def create_argument_binder(task_function: Function[..., Any], task_config: TaskConfig) -> ArgumentBinder:
+    """Decide once per task which variables are passed to the task function and which parameter gets the job."""
+    bind_variables = create_variables_binder(task_function, task_config)
+    job_parameter_name = task_config.job_parameter_name
+    if not job_parameter_name:
+        return bind_variables
+
+    def bind_arguments(job: Job) -> dict[str, Any]:
+        arguments = bind_variables(job)
+        arguments[job_parameter_name] = job
+        return arguments
+
+    return bind_arguments
+
+
+def create_variables_binder(task_function: Function[..., Any], task_config: TaskConfig) -> ArgumentBinder:
+    if task_config.raw_variables_parameter:
+        raw_parameter_name, annotation = task_config.raw_variables_parameter
+        as_bytes = annotation in (bytes, "bytes")
+        return lambda job: {raw_parameter_name: get_raw_variables(job, as_bytes)}
+
+    if task_config.model_parameter:
+        model_parameter_name, model_type = task_config.model_parameter
+        return lambda job: {model_parameter_name: load_model(job.variables, model_type)}
+
+    if task_config.variables_to_fetch is None:
+        return lambda job: {}
+
+    if task_wants_all_variables(task_config):
+        if only_job_is_required_in_task_function(task_function):
+            return lambda job: {}
+        return lambda job: {**get_decoded_variables(job)}
+
+    names = tuple(
+        dict.fromkeys(name for name in task_config.variables_to_fetch if name != task_config.job_parameter_name)
+    )
+
+    def bind_variables(job: Job) -> dict[str, Any]:
+        variables = get_decoded_variables(job)
+        return {name: variables[name] for name in names if name in variables}
+
+    return bind_variables
+
+
+def get_raw_variables(job: Job, as_bytes: bool) -> RawJson:
+    """The job's variables as the JSON object received from Zeebe."""
+    if isinstance(job.variables, LazyJsonMapping):
+        raw = job.variables.raw or "{}"
+    else:
+        raw = json.dumps(dict(job.variables))
+    return raw.encode() if as_bytes else raw
+
+
+def get_decoded_variables(job: Job) -> Variables:
+    if isinstance(job.variables, LazyJsonMapping):
+        return job.variables.decode()
+    return job.variables
+
+
+def only_job_is_required_in_task_function(task_function: Function[..., Any]) -> bool:
+    return all(annotation == Job for annotation in get_annotations(task_function).values())
 
 
 def task_wants_all_variables(task_config: TaskConfig) -> bool:
     return task_config.variables_to_fetch == []
 
 
-def create_decorator_runner(decorators: Sequence[AsyncTaskDecorator]) -> DecoratorRunner:
+def create_decorator_runner(decorators: Sequence[AsyncTaskDecorator]) -> DecoratorRunner | None:
+    """Returns None when there are no decorators, so the job handler doesn't have to await anything."""
+    if not decorators:
+        return None
+    if len(decorators) == 1:
+        decorator = decorators[0]
+
+        async def single_decorator_runner(job: Job) -> Job:
+            return await run_decorator(decorator, job)
+
+        return single_decorator_runner
+
     async def decorator_runner(job: Job) -> Job:
         for decorator in decorators:
             job = await run_decorator(decorator, job)
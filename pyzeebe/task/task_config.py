@@ -1,11 +1,21 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import Executor
+from typing import Any
 
-from pyzeebe.errors import NoVariableNameGivenError
-from pyzeebe.function_tools import async_tools
+from pyzeebe.codec.offload import JsonOffloader
+from pyzeebe.errors import NoVariableNameGivenError, SettingsError
+from pyzeebe.function_tools import ModelParameter, async_tools
 from pyzeebe.task.exception_handler import ExceptionHandler
-from pyzeebe.task.types import AsyncTaskDecorator, TaskDecorator
+from pyzeebe.task.thread_pool import TaskThreadPool
+from pyzeebe.task.types import (
+    AsyncTaskDecorator,
+    ExecutionMode,
+    JobScheduling,
+    TaskDecorator,
+    TimeoutPolicy,
+)
 
 
 class TaskConfig:
@@ -24,9 +34,33 @@ class TaskConfig:
         variable_name: str,
         before: list[TaskDecorator],
         after: list[TaskDecorator],
+        concurrent_activations: int = 1,
+        scheduling: JobScheduling = "fifo",
+        auto_extend_timeout: bool = False,
+        execution_mode: ExecutionMode = "thread",
+        executor: Executor | None = None,
+        max_threads: int | None = None,
+        max_batch: int | None = None,
+        max_batch_wait_ms: int = 20,
+        raw_variables: bool = False,
+        typed_variables: bool = False,
+        on_timeout: TimeoutPolicy = "ignore",
+        liveness_probe_ms: int | None = None,
+        weight: float = 1.0,
+        min_share: int = 1,
     ) -> None:
-        if single_value and not variable_name:
-            raise NoVariableNameGivenError(type)
+        _validate_variables(type, single_value, variable_name, max_batch, raw_variables, typed_variables)
+        _validate_limits(
+            type,
+            concurrent_activations,
+            max_threads,
+            max_batch,
+            max_batch_wait_ms,
+            liveness_probe_ms,
+            weight,
+            min_share,
+        )
+        _validate_executor(type, execution_mode, executor, max_threads, max_batch)
 
         self.type = type
         self.exception_handler = exception_handler
@@ -36,9 +70,33 @@ class TaskConfig:
         self.variables_to_fetch = variables_to_fetch
         self.single_value = single_value
         self.variable_name = variable_name
-        self.before = async_tools.asyncify_all_functions(before)
-        self.after = async_tools.asyncify_all_functions(after)
+        self.max_threads = max_threads
+        # Executor of sync task functions and decorators, the process pool is provided by the worker
+        self.executor = executor or (TaskThreadPool(type, max_threads) if max_threads else None)
+        self.before = async_tools.asyncify_all_functions(before, self._get_decorator_executor)
+        self.after = async_tools.asyncify_all_functions(after, self._get_decorator_executor)
+        self.concurrent_activations = concurrent_activations
+        self.scheduling = scheduling
+        self.auto_extend_timeout = auto_extend_timeout
+        self.execution_mode = execution_mode
+        self.max_batch = max_batch
+        self.max_batch_wait_ms = max_batch_wait_ms
+        self.raw_variables = raw_variables
+        self.typed_variables = typed_variables
+        self.on_timeout = on_timeout
+        self.liveness_probe_ms = liveness_probe_ms
+        self.weight = weight
+        self.min_share = min_share
         self.job_parameter_name: str | None = None
+        self.model_parameter: ModelParameter | None = None
+        # Name and annotation of the parameter that receives the raw variables
+        self.raw_variables_parameter: tuple[str, Any] | None = None
+        # Provided by the worker, decodes the variables of large jobs in a thread
+        self.json_offloader: JsonOffloader | None = None
+
+    def _get_decorator_executor(self) -> Executor | None:
+        # Decorators receive the job, which can't be sent to another process
+        return self.executor if self.execution_mode == "thread" else None
 
     def __repr__(self) -> str:
         return (
@@ -46,5 +104,74 @@ class TaskConfig:
             f"timeout_ms={self.timeout_ms}, max_jobs_to_activate={self.max_jobs_to_activate}, "
             f"max_running_jobs={self.max_running_jobs}, variables_to_fetch={self.variables_to_fetch},"
             f"single_value={self.single_value}, variable_name={self.variable_name},"
-            f"before={self.before}, after={self.after})"
+            f"before={self.before}, after={self.after}, concurrent_activations={self.concurrent_activations}, "
+            f"scheduling={self.scheduling}, auto_extend_timeout={self.auto_extend_timeout}, "
+            f"execution_mode={self.execution_mode}, executor={self.executor}, max_batch={self.max_batch}, "
+            f"max_batch_wait_ms={self.max_batch_wait_ms}, raw_variables={self.raw_variables}, "
+            f"typed_variables={self.typed_variables}, "
+            f"on_timeout={self.on_timeout}, liveness_probe_ms={self.liveness_probe_ms}, "
+            f"weight={self.weight}, min_share={self.min_share})"
         )
+
+
+def _validate_variables(
+    type: str,
+    single_value: bool,
+    variable_name: str,
+    max_batch: int | None,
+    raw_variables: bool,
+    typed_variables: bool,
+) -> None:
+    if single_value and not variable_name:
+        raise NoVariableNameGivenError(type)
+    if max_batch and raw_variables:
+        raise SettingsError(f"Batch task {type} can't receive raw variables")
+    if max_batch and typed_variables:
+        raise SettingsError(f"Batch task {type} can't receive typed variables")
+    if raw_variables and typed_variables:
+        raise SettingsError(f"Task {type} can't receive both raw and typed variables")
+
+
+def _validate_limits(
+    type: str,
+    concurrent_activations: int,
+    max_threads: int | None,
+    max_batch: int | None,
+    max_batch_wait_ms: int,
+    liveness_probe_ms: int | None,
+    weight: float,
+    min_share: int,
+) -> None:
+    if concurrent_activations < 1:
+        raise SettingsError(f"concurrent_activations of task {type} must be at least 1")
+    if max_threads is not None and max_threads < 1:
+        raise SettingsError(f"max_threads of task {type} must be at least 1")
+    if max_batch is not None and max_batch < 1:
+        raise SettingsError(f"max_batch of task {type} must be at least 1")
+    if max_batch_wait_ms < 0:
+        raise SettingsError(f"max_batch_wait_ms of task {type} can't be negative")
+    if liveness_probe_ms is not None and liveness_probe_ms < 1:
+        raise SettingsError(f"liveness_probe_ms of task {type} must be at least 1")
+    if weight <= 0:
+        raise SettingsError(f"weight of task {type} must be positive")
+    if min_share < 0:
+        raise SettingsError(f"min_share of task {type} can't be negative")
+
+
+def _validate_executor(
+    type: str,
+    execution_mode: ExecutionMode,
+    executor: Executor | None,
+    max_threads: int | None,
+    max_batch: int | None,
+) -> None:
+    if max_batch and execution_mode == "process":
+        raise SettingsError(f"Batch task {type} can't run in the worker's process pool")
+    # A copy of a config, like the one a router makes to add its decorators, keeps the pool of the task
+    own_thread_pool = (
+        isinstance(executor, TaskThreadPool) and executor.task_type == type and executor.max_threads == max_threads
+    )
+    if executor and max_threads and not own_thread_pool:
+        raise SettingsError(f"Task {type} can't have both an executor and max_threads")
+    if execution_mode == "process" and (executor or max_threads):
+        raise SettingsError(f"Task {type} runs in the worker's process pool, it can't have an executor")
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Callable
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, TypeVar
+
+from typing_extensions import ParamSpec
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+logger = logging.getLogger(__name__)
+
+
+class TaskThreadPool(ThreadPoolExecutor):
+    """A thread pool dedicated to one task type, which reports when all of its threads are busy."""
+
+    def __init__(self, task_type: str, max_threads: int) -> None:
+        super().__init__(max_workers=max_threads, thread_name_prefix=f"pyzeebe-{task_type}")
+        self.task_type = task_type
+        self.max_threads = max_threads
+        self._in_flight = 0
+        self._saturated = False
+        self._lock = threading.Lock()
+
+    def submit(self, fn: Callable[P, R], /, *args: P.args, **kwargs: P.kwargs) -> Future[R]:
+        with self._lock:
+            self._in_flight += 1
+            if self._in_flight > self.max_threads and not self._saturated:
+                self._saturated = True
+                logger.warning(
+                    "All %s threads of task %s are busy, calls are queued. Consider raising max_threads.",
+                    self.max_threads,
+                    self.task_type,
+                )
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(self._on_done)
+        return future
+
+    def _on_done(self, _: Future[Any]) -> None:
+        with self._lock:
+            self._in_flight -= 1
+            if self._saturated and self._in_flight < self.max_threads:
+                self._saturated = False
+                logger.info("Thread pool of task %s is no longer saturated", self.task_type)
+
+    @property
+    def in_flight(self) -> int:
+        """Calls that are running or waiting for a free thread."""
+        return self._in_flight
+
+    @property
+    def queued(self) -> int:
+        """Calls that are waiting for a free thread."""
+        return max(0, self._in_flight - self.max_threads)
+
+    @property
+    def saturation(self) -> float:
+        """Share of busy threads, above 1.0 when calls are queued."""
+        return self._in_flight / self.max_threads
@@ -1,12 +1,23 @@
-from collections.abc import Awaitable, Callable
-from typing import Union
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, Literal, TypeVar, Union
 
 from pyzeebe import Job
 from pyzeebe.job.job import JobController
 
 DecoratorRunner = Callable[[Job], Awaitable[Job]]
 JobHandler = Callable[[Job, JobController], Awaitable[Job]]
+ArgumentBinder = Callable[[Job], dict[str, Any]]
 
 SyncTaskDecorator = Callable[[Job], Job]
 AsyncTaskDecorator = Callable[[Job], Awaitable[Job]]
 TaskDecorator = Union[SyncTaskDecorator, AsyncTaskDecorator]
+
+T = TypeVar("T")
+
+SyncBatchFunction = Callable[[list[T]], Sequence[Any]]
+AsyncBatchFunction = Callable[[list[T]], Awaitable[Sequence[Any]]]
+BatchFunction = Union[SyncBatchFunction[T], AsyncBatchFunction[T]]
+
+JobScheduling = Literal["fifo", "deadline", "priority"]
+ExecutionMode = Literal["thread", "process"]
+TimeoutPolicy = Literal["ignore", "cancel", "fail"]
@@ -9,3 +9,5 @@ ChannelArgumentType: TypeAlias = Sequence[tuple[str, Any]]
 JsonType: TypeAlias = Union[Mapping[str, "JsonType"], Sequence["JsonType"], str, int, float, bool, None]
 JsonDictType: TypeAlias = Mapping[str, JsonType]
 Variables: TypeAlias = JsonDictType
+# A JSON object that is already encoded, sent to Zeebe as it is
+RawJson: TypeAlias = Union[str, bytes]
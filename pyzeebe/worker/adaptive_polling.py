@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import math
+
+DEFAULT_MIN_REQUEST_TIMEOUT = 1000
+DEFAULT_MAX_REQUEST_TIMEOUT = 20000
+
+
+class AdaptivePollingStrategy:
+    """
+    Tunes the batch size and long polling timeout of a job poller from the observed load.
+
+    Under heavy load (activation requests come back full) the poller asks for as many jobs as it can run
+    and uses short long polls. When idle (requests come back empty) it asks for few jobs and keeps the
+    request open for a long time, so idle task types cost the gateway as little as possible.
+    """
+
+    def __init__(
+        self,
+        min_request_timeout: int = DEFAULT_MIN_REQUEST_TIMEOUT,
+        max_request_timeout: int = DEFAULT_MAX_REQUEST_TIMEOUT,
+        smoothing: float = 0.3,
+    ) -> None:
+        """
+        Args:
+            min_request_timeout (int): Long polling timeout in milliseconds used under heavy load.
+            max_request_timeout (int): Long polling timeout in milliseconds used when no jobs arrive.
+            smoothing (float): Weight of the newest observation in the moving averages (0 < smoothing <= 1).
+        """
+        if not 0 < smoothing <= 1:
+            raise ValueError("smoothing must be in the range (0, 1]")
+        if not 0 < min_request_timeout <= max_request_timeout:
+            raise ValueError("min_request_timeout must be positive and not greater than max_request_timeout")
+
+        self.min_request_timeout = min_request_timeout
+        self.max_request_timeout = max_request_timeout
+        self.smoothing = smoothing
+        self.arrival_rate = 0.0
+        self.fill_ratio = 0.0
+        self.saturated = False
+
+    def record_activation(self, requested: int, received: int, duration: float) -> None:
+        """
+        Record the outcome of an activation request.
+
+        Args:
+            requested (int): Amount of jobs that were requested.
+            received (int): Amount of jobs that were activated.
+            duration (float): Duration of the request in seconds.
+        """
+        if requested <= 0:
+            return
+        self.arrival_rate = self._average(self.arrival_rate, received / max(duration, 1e-3))
+        self.fill_ratio = self._average(self.fill_ratio, min(received / requested, 1.0))
+        self.saturated = received >= requested
+
+    def max_jobs_to_activate(self, available: int, handler_latency: float) -> int:
+        """
+        Args:
+            available (int): Upper bound of jobs that can be activated right now.
+            handler_latency (float): Average duration of a job in seconds.
+
+        Returns:
+            int: Amount of jobs to request in the next activation request.
+        """
+        if available <= 0:
+            return 0
+        if self.saturated:
+            return available
+        # Enough jobs to keep the task busy until the next request comes back
+        expected = math.ceil(self.arrival_rate * (handler_latency + self.min_request_timeout / 1000))
+        return max(1, min(expected, available))
+
+    def request_timeout(self) -> int:
+        """
+        Returns:
+            int: Long polling timeout in milliseconds for the next activation request.
+        """
+        spread = self.max_request_timeout - self.min_request_timeout
+        return self.min_request_timeout + round(spread * (1 - self.fill_ratio))
+
+    def _average(self, current: float, observation: float) -> float:
+        return current + self.smoothing * (observation - current)
+
+    def __repr__(self) -> str:
+        return (
+            f"AdaptivePollingStrategy(min_request_timeout={self.min_request_timeout}, "
+            f"max_request_timeout={self.max_request_timeout}, arrival_rate={self.arrival_rate:.2f}, "
+            f"fill_ratio={self.fill_ratio:.2f})"
+        )
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from contextlib import nullcontext
+
+from pyzeebe.errors import (
+    JobAlreadyDeactivatedError,
+    JobNotFoundError,
+    SettingsError,
+    ZeebeBackPressureError,
+    ZeebeDeadlineExceeded,
+    ZeebeGatewayUnavailableError,
+    ZeebeInternalError,
+)
+from pyzeebe.grpc_internals.zeebe_adapter_base import uncounted_retries
+from pyzeebe.grpc_internals.zeebe_job_adapter import ZeebeJobAdapter
+from pyzeebe.job.job import Job
+from pyzeebe.types import RawJson, Variables
+from pyzeebe.worker.job_lease import now_ms
+
+logger = logging.getLogger(__name__)
+
+MIN_RETRY_DELAY = 0.05
+MAX_RETRY_DELAY = 5.0
+
+
+class CompletionDispatcher:
+    """
+    Sends job completions to Zeebe in the background, so a job frees its slot as soon as its result is known
+    instead of after the CompleteJob round trip.
+    """
+
+    def __init__(self, zeebe_adapter: ZeebeJobAdapter, max_pending: int) -> None:
+        if max_pending < 1:
+            raise SettingsError("max_pending_completions must be at least 1")
+        self.zeebe_adapter = zeebe_adapter
+        self.max_pending = max_pending
+        self._slots = asyncio.Semaphore(max_pending)
+        self._pending: set[asyncio.Task[None]] = set()
+
+    @property
+    def pending(self) -> int:
+        """Completions that were not yet acknowledged by Zeebe."""
+        return len(self._pending)
+
+    async def complete_job(self, job: Job, variables: Variables | RawJson, deadline: int | None = None) -> None:
+        """
+        Hand the completion over. Waits only while max_pending completions are in flight.
+
+        Args:
+            job (Job): The job to complete.
+            variables (dict | str | bytes): Variables to complete the job with.
+            deadline (int | None): The job's current deadline (epoch milliseconds), if its timeout was extended since
+                it was activated. Retries stop once it passed. Default: the deadline the job was activated with.
+        """
+        await self._slots.acquire()
+        delivery = asyncio.create_task(self._deliver(job, variables, job.deadline if deadline is None else deadline))
+        self._pending.add(delivery)
+        delivery.add_done_callback(self._pending.discard)
+
+    async def _deliver(self, job: Job, variables: Variables | RawJson, deadline: int) -> None:
+        retry_delay = MIN_RETRY_DELAY
+        attempt = 0
+        try:
+            while True:
+                try:
+                    # Only the first failure counts towards the adapter's max_connection_retries
+                    with uncounted_retries() if attempt else nullcontext():
+                        await self.zeebe_adapter.complete_job(job_key=job.key, variables=variables)
+                    return
+                except (JobNotFoundError, JobAlreadyDeactivatedError) as error:
+                    logger.warning("Job %s could not be completed. Exception: %s", job.key, repr(error))
+                    return
+                except (
+                    ZeebeBackPressureError,
+                    ZeebeGatewayUnavailableError,
+                    ZeebeInternalError,
+                    ZeebeDeadlineExceeded,
+                ) as error:
+                    # Once the job's deadline passed Zeebe hands it to another worker, the completion would be rejected
+                    if now_ms() + retry_delay * 1000 >= deadline:
+                        logger.warning(
+                            "Failed to complete job %s before its deadline. Exception: %s", job.key, repr(error)
+                        )
+                        return
+                    logger.debug("Failed to complete job %s. Exception: %s. Retrying...", job.key, repr(error))
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, MAX_RETRY_DELAY)
+                    attempt += 1
+        except Exception:
+            logger.exception("Failed to complete job %s", job.key)
+        finally:
+            self._slots.release()
+
+    async def stop(self) -> None:
+        """Wait until all pending completions are delivered or given up."""
+        while self._pending:
+            await asyncio.wait(set(self._pending))
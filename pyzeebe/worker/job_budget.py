@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import asyncio
+import math
+from dataclasses import dataclass
+
+from pyzeebe.errors import SettingsError
+from pyzeebe.task.task_config import TaskConfig
+from pyzeebe.worker.task_state import TaskState
+
+
+@dataclass
+class TaskShare:
+    task_state: TaskState
+    max_running_jobs: int
+    weight: float
+    min_share: int
+
+    def count_used(self) -> int:
+        return self.task_state.count_active() + self.task_state.count_reserved()
+
+    def count_active(self) -> int:
+        return self.task_state.count_active()
+
+
+class JobBudget:
+    """
+    A limit on the jobs running in a worker, shared by all of its tasks on top of their own max_running_jobs.
+
+    Idle capacity can be borrowed by any task, except for the minimum shares other tasks haven't used: each task can
+    always run min_share jobs. Tasks share the rest by weight: a task running at least its weighted share of the
+    budget leaves released slots to tasks below their share that are waiting for one.
+
+    Slots reserved for the open activate jobs requests of a task only count against that task: an idle task's long
+    poll would otherwise hold its capacity for the whole request timeout. Jobs received for such requests can exceed
+    the budget until they finish.
+    """
+
+    def __init__(self, max_running_jobs: int) -> None:
+        if max_running_jobs < 1:
+            raise SettingsError("max_running_jobs of a worker must be at least 1")
+        self.max_running_jobs = max_running_jobs
+        # Shared by the task states of all tasks, any released slot may be the one a task waits for
+        self.job_released = asyncio.Event()
+        self._shares: dict[str, TaskShare] = {}
+        self._waiting: set[str] = set()
+        self._total_weight = 0.0
+
+    def add_task(self, task_config: TaskConfig, task_state: TaskState) -> None:
+        self._shares[task_config.type] = TaskShare(
+            task_state,
+            task_config.max_running_jobs,
+            task_config.weight,
+            min(task_config.min_share, task_config.max_running_jobs),
+        )
+        self._total_weight = sum(share.weight for share in self._shares.values())
+        min_shares = sum(share.min_share for share in self._shares.values())
+        if min_shares > self.max_running_jobs:
+            raise SettingsError(
+                f"The minimum shares of the worker's tasks ({min_shares}) exceed its max_running_jobs "
+                f"({self.max_running_jobs})"
+            )
+
+    def count_available(self, task_type: str) -> int:
+        """
+        Amount of jobs the task may activate right now. A task that may activate none counts as waiting for a slot
+        until it's asked again and may activate some.
+        """
+        used = {other_type: share.count_active() for other_type, share in self._shares.items()}
+        share = self._shares[task_type]
+        used[task_type] = share.count_used()
+        borrowing = used[task_type] >= self._fair_share(share)
+        kept = 0
+        for other_type, other in self._shares.items():
+            if other_type == task_type:
+                continue
+            keep = other.min_share - used[other_type]
+            if borrowing and other_type in self._waiting:
+                keep = max(keep, math.ceil(self._fair_share(other) - used[other_type]))
+            kept += max(0, min(keep, other.max_running_jobs - used[other_type]))
+        free = self.max_running_jobs - sum(used.values()) - kept
+        available = max(0, min(free, share.max_running_jobs - used[task_type]))
+        if available:
+            self._waiting.discard(task_type)
+        else:
+            self._waiting.add(task_type)
+        return available
+
+    def _fair_share(self, share: TaskShare) -> float:
+        return self.max_running_jobs * share.weight / self._total_weight
@@ -2,48 +2,253 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from collections.abc import Callable
+from typing import Any
 
-from pyzeebe.errors import JobAlreadyDeactivatedError
+from pyzeebe.errors import JobAlreadyDeactivatedError, PyZeebeError
+from pyzeebe.function_tools.async_tools import is_async_function, is_inline
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 from pyzeebe.job.job import Job, JobController
 from pyzeebe.task.task import Task
+from pyzeebe.task.thread_pool import TaskThreadPool
+from pyzeebe.worker.completion_dispatcher import CompletionDispatcher
+from pyzeebe.worker.job_lease import extend_job_timeout, now_ms, probe_job
+from pyzeebe.worker.job_queue import is_job_expired
 from pyzeebe.worker.task_state import TaskState
 
 logger = logging.getLogger(__name__)
 
 AsyncTaskCallback = Callable[["asyncio.Future[None]"], None]
 
+# Timed out handlers are stopped this long before the deadline, so the job can still be failed
+DEADLINE_MARGIN_MS = 500
+
 
 class JobExecutor:
-    def __init__(self, task: Task, jobs: asyncio.Queue[Job], task_state: TaskState, zeebe_adapter: ZeebeAdapter):
+    def __init__(
+        self,
+        task: Task,
+        jobs: asyncio.Queue[Job],
+        task_state: TaskState,
+        zeebe_adapter: ZeebeAdapter,
+        completion_dispatcher: CompletionDispatcher | None = None,
+        process_pool_size: int | None = None,
+    ):
         self.task = task
         self.jobs = jobs
         self.task_state = task_state
         self.stop_event = asyncio.Event()
+        self.drained = asyncio.Event()
         self.zeebe_adapter = zeebe_adapter
+        self.completion_dispatcher = completion_dispatcher
+        self.max_started_jobs = count_job_slots(task, process_pool_size)
+        self.started_jobs = 0
+        self.job_finished = asyncio.Event()
 
     async def execute(self) -> None:
-        while self.should_execute():
+        while not self.drained.is_set():
+            await self.wait_for_job_slot()
             job = await self.get_next_job()
-            task = asyncio.create_task(self.execute_one_job(job, JobController(job, self.zeebe_adapter)))
+            if not self.should_execute():
+                # The worker is stopping, another worker can start the job right away
+                asyncio.create_task(self.hand_back_job(job))
+                continue
+            if self.should_drop(job):
+                self.drop_job(job)
+                continue
+            job_controller = JobController(job, self.zeebe_adapter, self.completion_dispatcher, self.task_state)
+            task = asyncio.create_task(self.execute_one_job(job, job_controller))
+            self.started_jobs += 1
             task.add_done_callback(create_job_callback(self, job))
 
+    async def wait_for_job_slot(self) -> None:
+        """
+        Jobs of a sync task function wait for a thread or process of the task's pool anyway. Until one is free they
+        wait in the job queue instead, which starts them in scheduling order and drops them once their deadline passed.
+        """
+        while (
+            self.max_started_jobs is not None and self.started_jobs >= self.max_started_jobs and self.should_execute()
+        ):
+            self.job_finished.clear()
+            await self.job_finished.wait()
+
     async def get_next_job(self) -> Job:
         return await self.jobs.get()
 
     async def execute_one_job(self, job: Job, job_controller: JobController) -> None:
+        started = time.monotonic()
+        timeout_extension = self.start_timeout_extension(job)
+        liveness_probe = self.start_liveness_probe(job, timeout_extension)
         try:
-            await self.task.job_handler(job, job_controller)
+            if self.task.config.on_timeout == "ignore" and not liveness_probe:
+                await self.task.job_handler(job, job_controller)
+            else:
+                await self.run_supervised(job, job_controller, liveness_probe)
         except JobAlreadyDeactivatedError as error:
             logger.warning("Job was already deactivated. Job key: %s", error.job_key)
+        finally:
+            if timeout_extension:
+                timeout_extension.cancel()
+            if liveness_probe:
+                liveness_probe.cancel()
+            self.task_state.record_job_duration(time.monotonic() - started)
+
+    async def run_supervised(
+        self, job: Job, job_controller: JobController, liveness_probe: asyncio.Task[None] | None
+    ) -> None:
+        """
+        Run the job handler until it's done, the liveness probe finds that the job is no longer active or (with an
+        on_timeout policy) the job's deadline is about to pass. A probe that fails is only logged. A stopped handler is cancelled and left behind, so the
+        job's slot is freed right away. A sync task function keeps running in its thread, its result is discarded.
+        """
+        handler = asyncio.ensure_future(self.task.job_handler(job, job_controller))
+        watched: set[asyncio.Future[Any]] = {handler, liveness_probe} if liveness_probe else {handler}
+        try:
+            # The deadline moves when the job's timeout is extended
+            while (remaining := self.time_until_deadline(job)) is None or remaining > 0:
+                done, _ = await asyncio.wait(watched, timeout=remaining, return_when=asyncio.FIRST_COMPLETED)
+                if handler in done:
+                    handler.result()
+                    return
+                if liveness_probe and liveness_probe in done:
+                    watched.discard(liveness_probe)
+                    probe_error = None if liveness_probe.cancelled() else liveness_probe.exception()
+                    if probe_error or liveness_probe.cancelled():
+                        # Whether the job is still active is unknown, the handler keeps running
+                        logger.warning("Liveness probe of job %s stopped. Error: %s", job.key, repr(probe_error))
+                        continue
+                    self.stop_handler(handler)
+                    self.task_state.orphaned_jobs += 1
+                    logger.warning("Job %s of task %s is no longer active, cancelled its handler", job.key, job.type)
+                    return
+        except asyncio.CancelledError:
+            handler.cancel()
+            raise
+        self.stop_handler(handler)
+        self.task_state.timed_out_jobs += 1
+        logger.warning("Job %s of task %s reached its deadline, cancelled its handler", job.key, job.type)
+        if self.task.config.on_timeout == "fail":
+            await self.fail_timed_out_job(job, job_controller)
+
+    def stop_handler(self, handler: asyncio.Future[Job]) -> None:
+        handler.cancel()
+        handler.add_done_callback(log_late_handler_error)
+
+    def time_until_deadline(self, job: Job) -> float | None:
+        if self.task.config.on_timeout == "ignore":
+            return None
+        margin = min(DEADLINE_MARGIN_MS, self.task.config.timeout_ms / 10)
+        return (self.task_state.get_deadline(job) - margin - now_ms()) / 1000
+
+    async def fail_timed_out_job(self, job: Job, job_controller: JobController) -> None:
+        try:
+            await job_controller.set_failure_status(
+                message=f"Job handler didn't finish within the job's timeout of {self.task.config.timeout_ms} ms"
+            )
+        except PyZeebeError as error:
+            logger.warning("Failed to fail timed out job %s. Exception: %s", job.key, repr(error))
+
+    def start_timeout_extension(self, job: Job) -> asyncio.Task[None] | None:
+        if not self.task.config.auto_extend_timeout:
+            return None
+        timeout_extension = asyncio.create_task(
+            extend_job_timeout(
+                job,
+                self.zeebe_adapter,
+                self.task.config.timeout_ms,
+                self.task_state,
+                self.task.config.liveness_probe_ms,
+            )
+        )
+        timeout_extension.add_done_callback(consume_logged_error)
+        return timeout_extension
+
+    def start_liveness_probe(self, job: Job, timeout_extension: asyncio.Task[None] | None) -> asyncio.Task[None] | None:
+        if not self.task.config.liveness_probe_ms:
+            return None
+        # The timeout extension already stops once the job is no longer active
+        return timeout_extension or asyncio.create_task(
+            probe_job(job, self.zeebe_adapter, self.task.config.liveness_probe_ms, self.task_state)
+        )
+
+    def should_drop(self, job: Job) -> bool:
+        return self.task.config.scheduling != "fifo" and is_job_expired(job)
+
+    def drop_job(self, job: Job) -> None:
+        logger.warning("Deadline of job %s passed before it was started. Task: %s. Dropping job.", job.key, job.type)
+        self.jobs.task_done()
+        self.task_state.remove(job)
 
     def should_execute(self) -> bool:
         return not self.stop_event.is_set()
 
-    async def stop(self) -> None:
+    async def stop(self, drain_timeout: float | None = None) -> None:
+        """
+        Stop starting jobs. Jobs that are still queued or arrive while stopping are handed back to Zeebe, running jobs
+        are awaited for up to drain_timeout seconds.
+        """
         self.stop_event.set()
-        await self.jobs.join()
+        # Queued jobs are handed back without waiting for a free slot
+        self.job_finished.set()
+        try:
+            await asyncio.wait_for(self.jobs.join(), drain_timeout)
+        except asyncio.TimeoutError:
+            logger.warning(
+                "%s jobs of task %s were still running after %s seconds, stopped waiting for them",
+                self.task_state.count_active(),
+                self.task.type,
+                drain_timeout,
+            )
+        self.drained.set()
+
+    async def hand_back_job(self, job: Job) -> None:
+        """Fail a job that wasn't started, without using up a retry or delaying it, so another worker runs it now."""
+        try:
+            await self.zeebe_adapter.fail_job(
+                job_key=job.key,
+                retries=job.retries,
+                message="Worker stopped before starting the job",
+                retry_back_off_ms=0,
+                variables={},
+            )
+            self.task_state.handed_back_jobs += 1
+        except PyZeebeError as error:
+            logger.warning("Failed to hand back job %s. Exception: %s", job.key, repr(error))
+        finally:
+            self.jobs.task_done()
+            self.task_state.remove(job)
+
+
+def count_job_slots(task: Task, process_pool_size: int | None = None) -> int | None:
+    """
+    Amount of jobs the task can run at once before they wait for a thread or process, or None if unlimited.
+
+    Args:
+        task (Task): The task whose jobs are counted.
+        process_pool_size (int | None): Amount of processes in the worker's process pool, for a task with
+            execution_mode "process".
+    """
+    function = task.original_function
+    if task.config.max_batch or is_async_function(function) or is_inline(function):
+        return None
+    if isinstance(task.config.executor, TaskThreadPool):
+        return task.config.executor.max_threads
+    if task.config.execution_mode == "process":
+        return process_pool_size
+    return None
+
+
+def consume_logged_error(task: asyncio.Future[None]) -> None:
+    """Mark the error of a task that already logged it as retrieved, so asyncio doesn't log it again."""
+    if not task.cancelled():
+        task.exception()
+
+
+def log_late_handler_error(handler: asyncio.Future[Job]) -> None:
+    error = not handler.cancelled() and handler.exception()
+    if error:
+        logger.warning("Timed out job handler failed after its deadline. Error: %s", repr(error))
 
 
 def create_job_callback(job_executor: JobExecutor, job: Job) -> AsyncTaskCallback:
@@ -54,5 +259,7 @@ def create_job_callback(job_executor: JobExecutor, job: Job) -> AsyncTaskCallbac
 
         job_executor.jobs.task_done()
         job_executor.task_state.remove(job)
+        job_executor.started_jobs -= 1
+        job_executor.job_finished.set()
 
     return callback
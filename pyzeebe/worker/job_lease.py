@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from contextlib import nullcontext
+
+from pyzeebe.errors import (
+    JobAlreadyDeactivatedError,
+    JobNotFoundError,
+    ZeebeBackPressureError,
+    ZeebeDeadlineExceeded,
+    ZeebeGatewayUnavailableError,
+    ZeebeInternalError,
+)
+from pyzeebe.grpc_internals.zeebe_adapter_base import uncounted_retries
+from pyzeebe.grpc_internals.zeebe_job_adapter import ZeebeJobAdapter
+from pyzeebe.job.job import Job
+from pyzeebe.worker.task_state import TaskState
+
+logger = logging.getLogger(__name__)
+
+MIN_RETRY_DELAY = 0.1
+# Errors after which updating a job's timeout is retried
+TRANSIENT_ERRORS = (
+    ZeebeBackPressureError,
+    ZeebeGatewayUnavailableError,
+    ZeebeInternalError,
+    ZeebeDeadlineExceeded,
+)
+
+
+def now_ms() -> float:
+    return time.time() * 1000
+
+
+async def extend_job_timeout(
+    job: Job,
+    zeebe_adapter: ZeebeJobAdapter,
+    timeout_ms: int,
+    task_state: TaskState,
+    probe_interval_ms: int | None = None,
+) -> None:
+    """
+    Extend the timeout of a job by timeout_ms each time half of it has passed (or probe_interval_ms, if that's
+    shorter), until cancelled or until Zeebe reports that the job is no longer active. Failed extensions are retried
+    until the job's deadline, then the last error is raised.
+    """
+    deadline = float(job.deadline)
+    failures = 0
+    while True:
+        delay = max(deadline - now_ms() - timeout_ms / 2, 0)
+        await asyncio.sleep(min(delay, probe_interval_ms or delay) / 1000)
+        try:
+            # Only the first failure counts towards the adapter's max_connection_retries
+            with uncounted_retries() if failures else nullcontext():
+                await zeebe_adapter.update_job_timeout(job_key=job.key, timeout=timeout_ms)
+        except (JobNotFoundError, JobAlreadyDeactivatedError):
+            logger.debug("Job %s is no longer active, stopped extending its timeout", job.key)
+            return
+        except TRANSIENT_ERRORS as error:
+            retry_delay = max((deadline - now_ms()) / 4000, MIN_RETRY_DELAY)
+            if now_ms() + retry_delay * 1000 >= deadline:
+                # Once the deadline passed Zeebe hands the job to another worker, extending it would take it back
+                logger.warning(
+                    "Failed to extend timeout of job %s before its deadline. Exception: %s", job.key, repr(error)
+                )
+                raise
+            logger.warning("Failed to extend timeout of job %s. Exception: %s. Retrying...", job.key, repr(error))
+            failures += 1
+            await asyncio.sleep(retry_delay)
+            continue
+
+        failures = 0
+        deadline = now_ms() + timeout_ms
+        task_state.update_deadline(job, int(deadline))
+        logger.debug("Extended timeout of job %s by %s ms", job.key, timeout_ms)
+
+
+async def probe_job(job: Job, zeebe_adapter: ZeebeJobAdapter, interval_ms: int, task_state: TaskState) -> None:
+    """
+    Ask Zeebe every interval_ms whether a job is still active, until cancelled or until it isn't. The probe
+    updates the job's timeout to the time left until its current deadline, so the deadline stays where it is.
+    Zeebe doesn't know which worker a job belongs to: a job that timed out and was activated by another worker
+    still counts as active.
+    """
+    while True:
+        await asyncio.sleep(interval_ms / 1000)
+        remaining = int(task_state.get_deadline(job) - now_ms())
+        if remaining <= 0:
+            # Updating the timeout would take back a job that already timed out
+            continue
+        try:
+            await zeebe_adapter.update_job_timeout(job_key=job.key, timeout=remaining)
+        except (JobNotFoundError, JobAlreadyDeactivatedError):
+            logger.debug("Job %s is no longer active", job.key)
+            return
+        except TRANSIENT_ERRORS as error:
+            logger.warning("Failed to probe job %s. Exception: %s", job.key, repr(error))
@@ -2,6 +2,11 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import math
+import time
+from contextlib import aclosing
+
+import anyio
 
 from pyzeebe.errors import (
     ActivateJobsRequestInvalidError,
@@ -14,6 +19,8 @@ from pyzeebe.errors import (
 from pyzeebe.grpc_internals.zeebe_job_adapter import ZeebeJobAdapter
 from pyzeebe.job.job import Job
 from pyzeebe.task.task import Task
+from pyzeebe.worker.adaptive_polling import AdaptivePollingStrategy
+from pyzeebe.worker.job_budget import JobBudget
 from pyzeebe.worker.task_state import TaskState
 
 logger = logging.getLogger(__name__)
@@ -30,6 +37,8 @@ class JobPoller:
         task_state: TaskState,
         poll_retry_delay: int,
         tenant_ids: list[str] | None,
+        polling_strategy: AdaptivePollingStrategy | None = None,
+        budget: JobBudget | None = None,
     ) -> None:
         self.zeebe_adapter = zeebe_adapter
         self.task = task
@@ -39,6 +48,8 @@ class JobPoller:
         self.task_state = task_state
         self.poll_retry_delay = poll_retry_delay
         self.tenant_ids = tenant_ids
+        self.polling_strategy = polling_strategy
+        self.budget = budget
         self.stop_event = asyncio.Event()
 
     async def poll(self) -> None:
@@ -49,27 +60,35 @@ class JobPoller:
         if self.calculate_max_jobs_to_activate() > 0:
             await self.poll_once()
         else:
-            logger.warning(
-                "Maximum number of jobs running for %s. Polling again in %s seconds...",
+            logger.debug(
+                "Maximum number of jobs running for %s. Polling again when a job finishes or in %s seconds...",
                 self.task.type,
                 self.poll_retry_delay,
             )
-            await asyncio.sleep(self.poll_retry_delay)
+            with anyio.move_on_after(self.poll_retry_delay):
+                await self.task_state.wait_for_released_job()
 
     async def poll_once(self) -> None:
+        max_jobs_to_activate = self.calculate_max_jobs_to_activate()
+        started = time.monotonic()
+        received = 0
+        self.task_state.reserve(max_jobs_to_activate)
         try:
             jobs = self.zeebe_adapter.activate_jobs(
                 task_type=self.task.type,
                 worker=self.worker_name,
                 timeout=self.task.config.timeout_ms,
-                max_jobs_to_activate=self.calculate_max_jobs_to_activate(),
+                max_jobs_to_activate=max_jobs_to_activate,
                 variables_to_fetch=self.task.config.variables_to_fetch or [],
-                request_timeout=self.request_timeout,
+                request_timeout=self.calculate_request_timeout(),
                 tenant_ids=self.tenant_ids,
             )
             async for job in jobs:
-                self.task_state.add(job)
+                received += 1
+                self.task_state.add_reserved(job)
                 await self.queue.put(job)
+            if self.polling_strategy:
+                self.polling_strategy.record_activation(max_jobs_to_activate, received, time.monotonic() - started)
         except ActivateJobsRequestInvalidError:
             logger.warning("Activate job requests was invalid for task %s", self.task.type)
             raise
@@ -84,17 +103,32 @@ class JobPoller:
                 repr(error),
             )
             await asyncio.sleep(5)
+        finally:
+            self.task_state.release_reservation(max_jobs_to_activate - received)
 
     def should_poll(self) -> bool:
         return not self.stop_event.is_set() and (self.zeebe_adapter.connected or self.zeebe_adapter.retrying_connection)
 
     def calculate_max_jobs_to_activate(self) -> int:
-        worker_max_jobs = self.task.config.max_running_jobs - self.task_state.count_active()
-        return min(worker_max_jobs, self.task.config.max_jobs_to_activate)
+        worker_max_jobs = count_available(self.task, self.task_state, self.budget)
+        # Each of the task's concurrent requests gets its part of the free capacity, instead of the first taking all
+        per_request = math.ceil(
+            (worker_max_jobs + self.task_state.count_reserved()) / self.task.config.concurrent_activations
+        )
+        max_jobs_to_activate = min(worker_max_jobs, per_request, self.task.config.max_jobs_to_activate)
+        if self.polling_strategy:
+            return self.polling_strategy.max_jobs_to_activate(
+                max_jobs_to_activate, self.task_state.average_job_duration
+            )
+        return max_jobs_to_activate
+
+    def calculate_request_timeout(self) -> int:
+        if self.polling_strategy:
+            return self.polling_strategy.request_timeout()
+        return self.request_timeout
 
     async def stop(self) -> None:
         self.stop_event.set()
-        await self.queue.join()
 
 
 class JobStreamer:
@@ -107,6 +141,7 @@ class JobStreamer:
         stream_request_timeout: int,
         task_state: TaskState,
         tenant_ids: list[str] | None,
+        budget: JobBudget | None = None,
     ) -> None:
         self.zeebe_adapter = zeebe_adapter
         self.task = task
@@ -115,6 +150,7 @@ class JobStreamer:
         self.stream_request_timeout = stream_request_timeout
         self.task_state = task_state
         self.tenant_ids = tenant_ids
+        self.budget = budget
         self.stop_event = asyncio.Event()
 
     async def poll(self) -> None:
@@ -122,6 +158,13 @@ class JobStreamer:
             await self.activate_stream()
 
     async def activate_stream(self) -> None:
+        if not self.has_capacity():
+            logger.debug(
+                "Maximum number of jobs running for %s. Job stream paused until a job finishes", self.task.type
+            )
+            await self.task_state.wait_for_released_job()
+            return
+
         try:
             jobs = self.zeebe_adapter.stream_activate_jobs(
                 task_type=self.task.type,
@@ -131,9 +174,14 @@ class JobStreamer:
                 stream_request_timeout=self.stream_request_timeout,
                 tenant_ids=self.tenant_ids,
             )
-            async for job in jobs:
-                self.task_state.add(job)
-                await self.queue.put(job)
+            async with aclosing(jobs):
+                async for job in jobs:
+                    self.task_state.add(job)
+                    await self.queue.put(job)
+                    if not self.has_capacity():
+                        # Closing the stream lets Zeebe push the jobs to other workers
+                        logger.debug("Maximum number of jobs running for %s. Closing job stream", self.task.type)
+                        break
         except StreamActivateJobsRequestInvalidError:
             logger.warning("Stream job requests was invalid for task %s", self.task.type)
             raise
@@ -152,6 +200,15 @@ class JobStreamer:
     def should_poll(self) -> bool:
         return not self.stop_event.is_set() and (self.zeebe_adapter.connected or self.zeebe_adapter.retrying_connection)
 
+    def has_capacity(self) -> bool:
+        return count_available(self.task, self.task_state, self.budget) > 0
+
     async def stop(self) -> None:
         self.stop_event.set()
-        await self.queue.join()
+
+
+def count_available(task: Task, task_state: TaskState, budget: JobBudget | None) -> int:
+    """Amount of jobs a task may activate, within its own max_running_jobs and the worker's budget."""
+    if budget:
+        return budget.count_available(task.type)
+    return task.config.max_running_jobs - task_state.count_active() - task_state.count_reserved()
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from collections.abc import Callable
+from typing import Any
+
+from pyzeebe.job.job import Job
+from pyzeebe.task.task_config import TaskConfig
+
+logger = logging.getLogger(__name__)
+
+PRIORITY_HEADER = "priority"
+
+JobSortKey = Callable[[Job], tuple[int, ...]]
+
+
+class JobPriorityQueue(asyncio.Queue[Job]):
+    """A queue that returns the job with the smallest sort key first. Jobs with equal keys are returned in FIFO order."""
+
+    def __init__(self, sort_key: JobSortKey, maxsize: int = 0) -> None:
+        self._sort_key = sort_key
+        self._counter = itertools.count()
+        super().__init__(maxsize)
+
+    def _init(self, maxsize: int) -> None:
+        self._queue: list[tuple[tuple[int, ...], int, Job]] = []
+
+    def _put(self, item: Job) -> None:
+        heapq.heappush(self._queue, (self._sort_key(item), next(self._counter), item))
+
+    def _get(self) -> Job:
+        return heapq.heappop(self._queue)[2]
+
+
+def deadline_sort_key(job: Job) -> tuple[int, ...]:
+    return (job.deadline,)
+
+
+def priority_sort_key(job: Job) -> tuple[int, ...]:
+    return (-get_job_priority(job), job.deadline)
+
+
+def get_job_priority(job: Job) -> int:
+    priority: Any = job.custom_headers.get(PRIORITY_HEADER, 0)
+    try:
+        return int(priority)
+    except (TypeError, ValueError):
+        logger.warning("Invalid %s header %r on job %s, using 0", PRIORITY_HEADER, priority, job.key)
+        return 0
+
+
+def create_job_queue(task_config: TaskConfig, maxsize: int = 0) -> asyncio.Queue[Job]:
+    if task_config.scheduling == "deadline":
+        return JobPriorityQueue(deadline_sort_key, maxsize)
+    if task_config.scheduling == "priority":
+        return JobPriorityQueue(priority_sort_key, maxsize)
+    return asyncio.Queue[Job](maxsize)
+
+
+def is_job_expired(job: Job) -> bool:
+    return job.deadline <= time.time() * 1000
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import signal
+import time
+from collections.abc import Callable
+from multiprocessing.connection import wait
+from multiprocessing.process import BaseProcess
+from types import FrameType
+
+import anyio
+
+from pyzeebe.errors import SettingsError
+from pyzeebe.worker.worker import ZeebeWorker
+
+logger = logging.getLogger(__name__)
+
+WorkerFactory = Callable[[], ZeebeWorker]
+
+STOP_SIGNALS = (signal.SIGTERM, signal.SIGINT)
+
+
+class WorkerSupervisor:
+    """Runs a :py:class:`ZeebeWorker` in each of several child processes and keeps them running."""
+
+    def __init__(
+        self,
+        worker_factory: WorkerFactory,
+        processes: int | None = None,
+        restart_delay: float = 1.0,
+        start_method: str | None = None,
+        drain_timeout: float | None = None,
+    ):
+        """
+        Args:
+            worker_factory (Callable[[], ZeebeWorker]): Creates the grpc channel and the worker of a child process.
+                It's called inside the child's event loop. With the "spawn" and "forkserver" start methods it must be
+                defined at module level.
+            processes (int): Amount of worker processes. Default: number of CPUs
+            restart_delay (float): Seconds to wait before restarting a crashed worker process. Default: 1.0
+            start_method (str): multiprocessing start method of the child processes. Default: platform default
+            drain_timeout (float): Maximum seconds a stopping worker process waits for its running jobs, see
+                                   :py:meth:`ZeebeWorker.stop`. Default: wait until all running jobs are done
+
+        Raises:
+            SettingsError: When processes is smaller than 1, or restart_delay or drain_timeout is negative
+
+        """
+        if processes is not None and processes < 1:
+            raise SettingsError("A worker supervisor needs at least one process")
+        if restart_delay < 0:
+            raise SettingsError("restart_delay can't be negative")
+        if drain_timeout is not None and drain_timeout < 0:
+            raise SettingsError("drain_timeout can't be negative")
+        self.worker_factory = worker_factory
+        self.processes = processes or os.cpu_count() or 1
+        self.restart_delay = restart_delay
+        self.drain_timeout = drain_timeout
+        self._context = multiprocessing.get_context(start_method)
+        self._children: dict[int, BaseProcess] = {}
+        self._stopping = False
+
+    def run(self) -> None:
+        """
+        Start the worker processes and block until all of them exited.
+
+        A worker process that exits with a non zero code is restarted. SIGTERM and SIGINT are forwarded to the worker
+        processes as SIGTERM, which stops their worker gracefully. Must be called from the main thread.
+        """
+        previous_handlers = {signum: signal.signal(signum, self._handle_signal) for signum in STOP_SIGNALS}
+        try:
+            for slot in range(self.processes):
+                self._start_child(slot)
+            while self._children:
+                self._wait_for_exits()
+        finally:
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+        logger.info("All worker processes stopped")
+
+    def stop(self) -> None:
+        """Ask all worker processes to stop gracefully. No new worker processes are started afterwards."""
+        self._stopping = True
+        for process in list(self._children.values()):
+            if process.is_alive():
+                process.terminate()
+
+    def _handle_signal(self, signum: int, frame: FrameType | None) -> None:
+        logger.info("Received %s, stopping worker processes", signal.Signals(signum).name)
+        self.stop()
+
+    def _start_child(self, slot: int) -> None:
+        if self._stopping:
+            return
+        process = self._context.Process(  # type: ignore[attr-defined]
+            target=run_worker,
+            args=(self.worker_factory, self.drain_timeout),
+            name=f"pyzeebe-worker-{slot}",
+            daemon=False,
+        )
+        process.start()
+        self._children[slot] = process
+        logger.info("Started worker process %s (pid %s)", process.name, process.pid)
+
+    def _wait_for_exits(self) -> None:
+        wait([process.sentinel for process in self._children.values()])
+        for slot, process in list(self._children.items()):
+            if process.is_alive():
+                continue
+            process.join()
+            del self._children[slot]
+            if self._stopping or process.exitcode == 0:
+                logger.info("Worker process %s exited with code %s", process.name, process.exitcode)
+                continue
+            logger.warning(
+                "Worker process %s exited with code %s. Restarting in %s seconds",
+                process.name,
+                process.exitcode,
+                self.restart_delay,
+            )
+            time.sleep(self.restart_delay)
+            self._start_child(slot)
+
+
+def run_worker(worker_factory: WorkerFactory, drain_timeout: float | None = None) -> None:
+    """Entry point of a worker process."""
+    # Forked children inherit the supervisor's handlers, the event loop installs the worker's own handlers
+    for signum in STOP_SIGNALS:
+        signal.signal(signum, signal.SIG_DFL)
+    anyio.run(_work, worker_factory, drain_timeout)
+
+
+async def _work(worker_factory: WorkerFactory, drain_timeout: float | None = None) -> None:
+    worker = worker_factory()
+    async with anyio.create_task_group() as tg:
+        tg.start_soon(_stop_on_signal, worker, drain_timeout)
+        await worker.work()
+        tg.cancel_scope.cancel()
+
+
+async def _stop_on_signal(worker: ZeebeWorker, drain_timeout: float | None) -> None:
+    with anyio.open_signal_receiver(*STOP_SIGNALS) as signals:
+        async for signum in signals:
+            logger.info("Received %s, stopping worker", signal.Signals(signum).name)
+            await worker.stop(drain_timeout)
+            return
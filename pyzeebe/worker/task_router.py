@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable, Iterable
+from concurrent.futures import Executor
 from typing import Any, Literal, Optional, TypeVar, overload
 
 from typing_extensions import ParamSpec
@@ -12,11 +13,18 @@ from pyzeebe.task import task_builder
 from pyzeebe.task.exception_handler import ExceptionHandler
 from pyzeebe.task.task import Task
 from pyzeebe.task.task_config import TaskConfig
-from pyzeebe.task.types import TaskDecorator
+from pyzeebe.task.types import (
+    BatchFunction,
+    ExecutionMode,
+    JobScheduling,
+    TaskDecorator,
+    TimeoutPolicy,
+)
 
 P = ParamSpec("P")
 R = TypeVar("R")
 RD = TypeVar("RD", bound=Optional[dict[str, Any]])
+T = TypeVar("T")
 
 logger = logging.getLogger(__name__)
 
@@ -52,6 +60,18 @@ class ZeebeTaskRouter:
         after: list[TaskDecorator] | None = None,
         *,
         single_value: Literal[False] = False,
+        concurrent_activations: int = 1,
+        scheduling: JobScheduling = "fifo",
+        auto_extend_timeout: bool = False,
+        execution_mode: ExecutionMode = "thread",
+        executor: Executor | None = None,
+        max_threads: int | None = None,
+        raw_variables: Literal[False] = False,
+        typed_variables: bool = False,
+        on_timeout: TimeoutPolicy = "ignore",
+        liveness_probe_ms: int | None = None,
+        weight: float = 1.0,
+        min_share: int = 1,
     ) -> Callable[[Function[P, RD]], Function[P, RD]]: ...
 
     @overload
@@ -68,6 +88,45 @@ class ZeebeTaskRouter:
         *,
         single_value: Literal[True],
         variable_name: str,
+        concurrent_activations: int = 1,
+        scheduling: JobScheduling = "fifo",
+        auto_extend_timeout: bool = False,
+        execution_mode: ExecutionMode = "thread",
+        executor: Executor | None = None,
+        max_threads: int | None = None,
+        raw_variables: bool = False,
+        typed_variables: bool = False,
+        on_timeout: TimeoutPolicy = "ignore",
+        liveness_probe_ms: int | None = None,
+        weight: float = 1.0,
+        min_share: int = 1,
+    ) -> Callable[[Function[P, R]], Function[P, R]]: ...
+
+    @overload
+    def task(
+        self,
+        task_type: str,
+        exception_handler: ExceptionHandler | None = None,
+        variables_to_fetch: Iterable[str] | None = None,
+        timeout_ms: int = 10000,
+        max_jobs_to_activate: int = 32,
+        max_running_jobs: int = 32,
+        before: list[TaskDecorator] | None = None,
+        after: list[TaskDecorator] | None = None,
+        *,
+        single_value: Literal[False] = False,
+        concurrent_activations: int = 1,
+        scheduling: JobScheduling = "fifo",
+        auto_extend_timeout: bool = False,
+        execution_mode: ExecutionMode = "thread",
+        executor: Executor | None = None,
+        max_threads: int | None = None,
+        raw_variables: Literal[True],
+        typed_variables: Literal[False] = False,
+        on_timeout: TimeoutPolicy = "ignore",
+        liveness_probe_ms: int | None = None,
+        weight: float = 1.0,
+        min_share: int = 1,
     ) -> Callable[[Function[P, R]], Function[P, R]]: ...
 
     def task(
@@ -82,6 +141,18 @@ class ZeebeTaskRouter:
         after: list[TaskDecorator] | None = None,
         single_value: bool = False,
         variable_name: str | None = None,
+        concurrent_activations: int = 1,
+        scheduling: JobScheduling = "fifo",
+        auto_extend_timeout: bool = False,
+        execution_mode: ExecutionMode = "thread",
+        executor: Executor | None = None,
+        max_threads: int | None = None,
+        raw_variables: bool = False,
+        typed_variables: bool = False,
+        on_timeout: TimeoutPolicy = "ignore",
+        liveness_probe_ms: int | None = None,
+        weight: float = 1.0,
+        min_share: int = 1,
     ) -> Callable[[Function[P, R]], Function[P, R]]:
         """
         Decorator to create a task
@@ -100,10 +171,62 @@ class ZeebeTaskRouter:
                                  this to True. Default: False
             variable_name (str): If single_value then this will be the variable name given to zeebe:
                                         { <variable_name>: <function_return_value> }
+            concurrent_activations (int): Amount of activate jobs requests that may be in flight at the same time for
+                                          this task. Each request asks for an equal part of the free slots of
+                                          max_running_jobs. Default: 1
+            scheduling (JobScheduling): Order in which activated jobs are started. "fifo" starts them in activation
+                                        order. "deadline" starts the job with the earliest deadline first. "priority"
+                                        starts jobs with the highest "priority" custom header first, then by deadline.
+                                        With "deadline" and "priority" jobs whose deadline passed are dropped without
+                                        running the task. Jobs only wait in this order for a thread or process of a
+                                        sync task function with max_threads or execution_mode "process", all other
+                                        tasks start each job once it's activated. Default: "fifo"
+            auto_extend_timeout (bool): While the task runs, extend the job's timeout by timeout_ms each time half of
+                                        it has passed. This allows a short timeout_ms (fast failover when a worker
+                                        dies) for long running tasks. Default: False
+            execution_mode (ExecutionMode): Where a sync task function runs. "thread" runs it in the event loop's
+                                            default thread pool. "process" runs it in the worker's process pool, so
+                                            CPU bound tasks can use all cores. The function must be picklable (defined
+                                            at module level), its variables and return value are pickled and it can't
+                                            receive the Job. Default: "thread"
+            executor (concurrent.futures.Executor): Executor that runs the sync task function and the task's sync
+                                                    decorators, instead of the event loop's default executor.
+            max_threads (int): Run the sync task function and the task's sync decorators in a thread pool of this size
+                               dedicated to the task, so slow tasks can't starve other tasks. A warning is logged
+                               when all its threads are busy. The pool is shut down when the worker stops.
+            raw_variables (bool): Pass the job's variables to the task function's only parameter (besides the Job) as
+                                  the JSON object received from Zeebe, a str or bytes if the parameter is annotated
+                                  with bytes. All variables are fetched unless variables_to_fetch is given. For tasks
+                                  that forward variables without reading them. Default: False
+            typed_variables (bool): Pass all of the job's variables to the task function's only parameter (besides
+                                    the Job) as the dataclass, pydantic model or msgspec struct it's annotated with.
+                                    Only the model's fields are fetched unless variables_to_fetch is given. Without
+                                    it, a parameter annotated with a model receives the variable of its name.
+                                    Default: False
+            on_timeout (TimeoutPolicy): What happens when a job is still running shortly before its deadline, after
+                                        which Zeebe hands the job to another worker. "ignore" lets it run. "cancel"
+                                        cancels the task function, so the job doesn't hold a slot of max_running_jobs
+                                        any longer. "fail" also fails the job, using up one of its retries. A sync
+                                        function can't be interrupted, it keeps running in its thread and its result
+                                        is discarded. Default: "ignore"
+            liveness_probe_ms (int): While the task runs, ask Zeebe this often whether the job is still active, and
+                                     cancel the task function once it isn't (the process instance was cancelled, or
+                                     the job was completed or failed elsewhere). Saves the work whose result would be
+                                     rejected. With auto_extend_timeout the extension requests probe the job, at
+                                     least this often. Default: None (no probe)
+            weight (float): Share of the worker's max_running_jobs this task gets when tasks compete for it,
+                            relative to the weights of the other tasks. Default: 1.0
+            min_share (int): Slots of the worker's max_running_jobs kept for this task, even while other tasks
+                             borrow its idle capacity. Default: 1
 
         Raises:
             DuplicateTaskTypeError: If a task from the router already exists in the worker
             NoVariableNameGivenError: When single_value is set, but no variable_name is given
+            SettingsError: When concurrent_activations is smaller than 1, both executor and max_threads are given,
+                           execution_mode "process" is used with an executor, an async function or a function that
+                           receives the Job, raw_variables is set for a function with several parameters,
+                           typed_variables is set for a function without a model parameter or
+                           liveness_probe_ms is smaller than 1, weight isn't positive or min_share is negative
         """
         _exception_handler = exception_handler or self._exception_handler
 
@@ -114,11 +237,28 @@ class ZeebeTaskRouter:
                 timeout_ms,
                 max_jobs_to_activate,
                 max_running_jobs,
-                variables_to_fetch or parameter_tools.get_parameters_from_function(task_function),
+                variables_to_fetch
+                or (
+                    []
+                    if raw_variables
+                    else parameter_tools.get_parameters_from_function(task_function, typed_variables)
+                ),
                 single_value,
                 variable_name or "",
                 before or [],
                 after or [],
+                concurrent_activations=concurrent_activations,
+                scheduling=scheduling,
+                auto_extend_timeout=auto_extend_timeout,
+                execution_mode=execution_mode,
+                executor=executor,
+                max_threads=max_threads,
+                raw_variables=raw_variables,
+                typed_variables=typed_variables,
+                on_timeout=on_timeout,
+                liveness_probe_ms=liveness_probe_ms,
+                weight=weight,
+                min_share=min_share,
             )
             config_with_decorators = self._add_decorators_to_config(config)
 
@@ -128,6 +268,101 @@ class ZeebeTaskRouter:
 
         return task_wrapper
 
+    def batch_task(
+        self,
+        task_type: str,
+        max_batch: int = 100,
+        max_wait_ms: int = 20,
+        exception_handler: ExceptionHandler | None = None,
+        variables_to_fetch: Iterable[str] | None = None,
+        timeout_ms: int = 10000,
+        max_jobs_to_activate: int | None = None,
+        max_running_jobs: int | None = None,
+        before: list[TaskDecorator] | None = None,
+        after: list[TaskDecorator] | None = None,
+        *,
+        variable_name: str | None = None,
+        concurrent_activations: int = 1,
+        scheduling: JobScheduling = "fifo",
+        auto_extend_timeout: bool = False,
+        executor: Executor | None = None,
+        max_threads: int | None = None,
+        weight: float = 1.0,
+        min_share: int = 1,
+    ) -> Callable[[BatchFunction[T]], BatchFunction[T]]:
+        """
+        Decorator to create a task whose function handles a batch of jobs with one call
+
+        The function receives a list with the variables of each job, or the jobs themselves if its parameter is
+        annotated with ``list[Job]``. It returns a list with one result per job, in the same order: a dictionary of
+        variables (or a single value if variable_name is given) to complete the job with, or an exception to fail
+        that job through the exception handler. If the function raises, every job of the batch fails.
+
+        Args:
+            task_type (str): The task type
+            max_batch (int): Maximum amount of jobs in one batch. Default: 100
+            max_wait_ms (int): Maximum time in milliseconds a job waits for its batch to fill up. Default: 20
+            exception_handler (ExceptionHandler): Handler that will be called when a job fails.
+            variables_to_fetch (Optional[Iterable[str]]): The variables to request from Zeebe when activating jobs.
+                                                           Default: all variables
+            timeout_ms (int): Maximum duration of the task in milliseconds. Default: 10000 (10 seconds).
+            max_jobs_to_activate (int): Maximum amount of jobs the worker will activate in one request to the Zeebe
+                                        gateway. Default: max_batch
+            max_running_jobs (int): Maximum amount of jobs that will run simultaneously, including jobs waiting for
+                                    their batch. Default: max_batch
+            before (list[TaskDecorator]): All decorators which should be performed before each job.
+            after (list[TaskDecorator]): All decorators which should be performed after each job.
+            variable_name (str): If given the function returns a single value per job, which is passed to zeebe as
+                                 { <variable_name>: <value> }
+            concurrent_activations (int): Amount of activate jobs requests that may be in flight at the same time for
+                                          this task. Default: 1
+            scheduling (JobScheduling): Order in which activated jobs join a batch. Default: "fifo"
+            auto_extend_timeout (bool): Extend the timeout of jobs while their batch runs. Default: False
+            executor (concurrent.futures.Executor): Executor that runs a sync batch function and the task's sync
+                                                    decorators, instead of the event loop's default executor.
+            max_threads (int): Run a sync batch function and the task's sync decorators in a thread pool of this size
+                               dedicated to the task.
+            weight (float): Share of the worker's max_running_jobs this task gets when tasks compete for it,
+                            relative to the weights of the other tasks. Default: 1.0
+            min_share (int): Slots of the worker's max_running_jobs kept for this task. Default: 1
+
+        Raises:
+            DuplicateTaskTypeError: If a task from the router already exists in the worker
+            SettingsError: When max_batch is smaller than 1, max_wait_ms is negative or the function doesn't receive
+                           exactly one parameter
+        """
+        _exception_handler = exception_handler or self._exception_handler
+
+        def task_wrapper(batch_function: BatchFunction[T]) -> BatchFunction[T]:
+            config = TaskConfig(
+                task_type,
+                _exception_handler,
+                timeout_ms,
+                max_jobs_to_activate or max_batch,
+                max_running_jobs or max_batch,
+                variables_to_fetch or [],
+                bool(variable_name),
+                variable_name or "",
+                before or [],
+                after or [],
+                concurrent_activations=concurrent_activations,
+                scheduling=scheduling,
+                auto_extend_timeout=auto_extend_timeout,
+                executor=executor,
+                max_threads=max_threads,
+                max_batch=max_batch,
+                max_batch_wait_ms=max_wait_ms,
+                weight=weight,
+                min_share=min_share,
+            )
+            config_with_decorators = self._add_decorators_to_config(config)
+
+            task = task_builder.build_task(batch_function, config_with_decorators)
+            self._add_task(task)
+            return batch_function
+
+        return task_wrapper
+
     def _add_task(self, task: Task) -> None:
         self._is_task_duplicate(task.type)
         self.tasks.append(task)
@@ -144,6 +379,20 @@ class ZeebeTaskRouter:
             variable_name=config.variable_name,
             before=self._before + config.before,  # type: ignore
             after=config.after + self._after,  # type: ignore
+            concurrent_activations=config.concurrent_activations,
+            scheduling=config.scheduling,
+            auto_extend_timeout=config.auto_extend_timeout,
+            execution_mode=config.execution_mode,
+            executor=config.executor,
+            max_threads=config.max_threads,
+            max_batch=config.max_batch,
+            max_batch_wait_ms=config.max_batch_wait_ms,
+            raw_variables=config.raw_variables,
+            typed_variables=config.typed_variables,
+            on_timeout=config.on_timeout,
+            liveness_probe_ms=config.liveness_probe_ms,
+            weight=config.weight,
+            min_share=config.min_share,
         )
         return new_task_config
 
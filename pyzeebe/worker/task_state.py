@@ -1,22 +1,151 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
 import logging
+import time
+from dataclasses import dataclass
 
 from pyzeebe import Job
 
 logger = logging.getLogger(__name__)
 
+JOB_DURATION_SMOOTHING = 0.2
+
+
+@dataclass
+class ActiveJob:
+    key: int
+    activated_at: float
+    """monotonic time (in seconds) at which the job was added"""
+    deadline: int
+    """epoch time (in milliseconds) at which Zeebe will hand the job to another worker"""
+
 
 class TaskState:
-    def __init__(self) -> None:
-        self._active_jobs: list[int] = []
+    """
+    Keeps track of the jobs of a task from activation until they finish.
+
+    Active jobs are kept in insertion order (the first one is the oldest) and indexed by deadline in a lazily
+    cleaned heap, so adding, removing and querying jobs are all (amortized) constant or logarithmic time.
+    """
+
+    def __init__(self, job_released: asyncio.Event | None = None) -> None:
+        """
+        Args:
+            job_released (asyncio.Event): Event set when a slot is released, shared by tasks that share a budget.
+        """
+        self._active_jobs: dict[int, ActiveJob] = {}
+        self._deadlines: list[tuple[int, int]] = []
+        self._reserved = 0
+        self._job_released = job_released or asyncio.Event()
+        self.average_job_duration = 0.0
+        # Jobs whose handler was stopped because their deadline was reached
+        self.timed_out_jobs = 0
+        # Jobs whose handler was stopped because the liveness probe found the job no longer active
+        self.orphaned_jobs = 0
+        # Jobs returned to Zeebe without running them because the worker stopped
+        self.handed_back_jobs = 0
 
     def remove(self, job: Job) -> None:
-        try:
-            self._active_jobs.remove(job.key)
-        except ValueError:
+        if self._active_jobs.pop(job.key, None) is None:
             logger.warning("Could not find Job key %s when trying to remove from TaskState", job.key)
+            return
+        self._compact_deadlines()
+        self._job_released.set()
 
     def add(self, job: Job) -> None:
-        self._active_jobs.append(job.key)
+        if job.key in self._active_jobs:
+            return
+        self._active_jobs[job.key] = ActiveJob(job.key, time.monotonic(), job.deadline)
+        heapq.heappush(self._deadlines, (job.deadline, job.key))
+
+    def update_deadline(self, job: Job, deadline: int) -> None:
+        """Set a new deadline (epoch milliseconds) for an active job, e.g. after its timeout was extended."""
+        active_job = self._active_jobs.get(job.key)
+        if active_job is None or active_job.deadline == deadline:
+            return
+        active_job.deadline = deadline
+        heapq.heappush(self._deadlines, (deadline, job.key))
+
+    def get(self, job: Job) -> ActiveJob | None:
+        return self._active_jobs.get(job.key)
+
+    def get_deadline(self, job: Job) -> int:
+        """The current deadline (epoch milliseconds) of a job, which moves when its timeout is extended."""
+        active_job = self._active_jobs.get(job.key)
+        return active_job.deadline if active_job else job.deadline
 
     def count_active(self) -> int:
         return len(self._active_jobs)
+
+    def oldest_age(self) -> float:
+        """Seconds since the oldest active job was added, 0 if there are no active jobs."""
+        oldest = next(iter(self._active_jobs.values()), None)
+        if oldest is None:
+            return 0.0
+        return time.monotonic() - oldest.activated_at
+
+    def earliest_deadline(self) -> int | None:
+        """The earliest deadline (epoch milliseconds) of all active jobs."""
+        self._drop_stale_deadlines()
+        return self._deadlines[0][0] if self._deadlines else None
+
+    def jobs_near_deadline(self, within_ms: int) -> list[int]:
+        """Keys of active jobs whose deadline is less than within_ms milliseconds away (or already passed)."""
+        self._drop_stale_deadlines()
+        limit = time.time() * 1000 + within_ms
+        keys: list[int] = []
+        # Children in a heap are never smaller than their parent, so only branches below the limit are visited
+        pending = [0] if self._deadlines else []
+        while pending:
+            index = pending.pop()
+            deadline, key = self._deadlines[index]
+            if deadline > limit:
+                continue
+            if self._is_current(deadline, key):
+                keys.append(key)
+            pending.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(self._deadlines))
+        return keys
+
+    def reserve(self, amount: int) -> None:
+        """Reserve slots for jobs that were requested from Zeebe but not received yet."""
+        self._reserved += amount
+
+    def add_reserved(self, job: Job) -> None:
+        """Add a job that was received for a previously reserved slot."""
+        self._reserved = max(0, self._reserved - 1)
+        self.add(job)
+
+    def release_reservation(self, amount: int) -> None:
+        """Release reserved slots that were not filled by a job."""
+        if amount <= 0:
+            return
+        self._reserved = max(0, self._reserved - amount)
+        self._job_released.set()
+
+    def count_reserved(self) -> int:
+        return self._reserved
+
+    def record_job_duration(self, duration: float) -> None:
+        """Update the moving average of job handler durations (in seconds)."""
+        self.average_job_duration += JOB_DURATION_SMOOTHING * (duration - self.average_job_duration)
+
+    async def wait_for_released_job(self) -> None:
+        """Wait until an active job is removed, meaning a slot to run another job became free."""
+        self._job_released.clear()
+        await self._job_released.wait()
+
+    def _is_current(self, deadline: int, key: int) -> bool:
+        active_job = self._active_jobs.get(key)
+        return active_job is not None and active_job.deadline == deadline
+
+    def _drop_stale_deadlines(self) -> None:
+        while self._deadlines and not self._is_current(*self._deadlines[0]):
+            heapq.heappop(self._deadlines)
+
+    def _compact_deadlines(self) -> None:
+        # Removed jobs stay in the heap until they reach the top, rebuild it before it grows unbounded
+        if len(self._deadlines) > 2 * len(self._active_jobs) + 32:
+            self._deadlines = [(job.deadline, job.key) for job in self._active_jobs.values()]
+            heapq.heapify(self._deadlines)
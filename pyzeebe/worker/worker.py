@@ -1,20 +1,31 @@
 from __future__ import annotations
 
-import asyncio
 import logging
+import math
+import os
 import socket
+from concurrent.futures import Executor, ProcessPoolExecutor
 
 import anyio
 import grpc
 
 from pyzeebe import TaskDecorator
+from pyzeebe.codec import JsonCodec
+from pyzeebe.codec.offload import DEFAULT_OFFLOAD_THRESHOLD
 from pyzeebe.grpc_internals.types import HealthCheckResponse
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
-from pyzeebe.job.job import Job
 from pyzeebe.task import task_builder
 from pyzeebe.task.exception_handler import ExceptionHandler
+from pyzeebe.task.thread_pool import TaskThreadPool
+from pyzeebe.worker.adaptive_polling import (
+    DEFAULT_MIN_REQUEST_TIMEOUT,
+    AdaptivePollingStrategy,
+)
+from pyzeebe.worker.completion_dispatcher import CompletionDispatcher
+from pyzeebe.worker.job_budget import JobBudget
 from pyzeebe.worker.job_executor import JobExecutor
 from pyzeebe.worker.job_poller import JobPoller, JobStreamer
+from pyzeebe.worker.job_queue import create_job_queue
 from pyzeebe.worker.task_router import ZeebeTaskRouter
 from pyzeebe.worker.task_state import TaskState
 
@@ -37,6 +48,12 @@ class ZeebeWorker(ZeebeTaskRouter):
         exception_handler: ExceptionHandler | None = None,
         stream_enabled: bool = False,
         stream_request_timeout: int = 3600,
+        adaptive_polling: bool = False,
+        process_pool_size: int | None = None,
+        max_pending_completions: int | None = None,
+        json_codec: JsonCodec | None = None,
+        json_offload_threshold: int | None = DEFAULT_OFFLOAD_THRESHOLD,
+        max_running_jobs: int | None = None,
     ):
         """
         Args:
@@ -47,15 +64,34 @@ class ZeebeWorker(ZeebeTaskRouter):
             after (list[TaskDecorator]): Decorators to be performed after each task
             exception_handler (ExceptionHandler): Handler that will be called when a job fails.
             max_connection_retries (int): Amount of connection retries before worker gives up on connecting to zeebe. To setup with infinite retries use -1
-            poll_retry_delay (int): The number of seconds to wait before attempting to poll again when reaching max amount of running jobs
+            poll_retry_delay (int): The maximum number of seconds to wait for a running job to finish before attempting to poll
+                again when reaching max amount of running jobs
             tenant_ids (list[str]): A list of tenant IDs for which to activate jobs. New in Zeebe 8.3.
             stream_enabled (bool): Enables the job worker to stream jobs. It will still poll for older jobs, but streaming is favored. New in Zeebe 8.4.
             stream_request_timeout (int): If streaming is enabled, this sets the timeout on the underlying job stream.
                 It's useful to set a few hours to load-balance your streams over time. New in Zeebe 8.4.
+            adaptive_polling (bool): Tune the amount of jobs requested and the longpolling timeout of each task from
+                the observed job arrival rate and job duration. Busy tasks request large batches with short polls, idle
+                tasks request small batches with long polls. If request_timeout is set it's used as the longest poll.
+            process_pool_size (int): Amount of processes in the pool that runs tasks with execution_mode "process".
+                The pool is only started if such a task exists. Default: the number of CPUs
+            max_pending_completions (int): Send job completions in the background with up to this many requests in
+                flight, so a job frees its slot as soon as its result is known instead of after Zeebe acknowledged it.
+                Completions are retried on back pressure until the job's deadline and delivered before stop returns.
+                Default: a job keeps its slot until its completion is acknowledged
+            json_codec (JsonCodec): Codec of variables and custom headers. Default: orjson or msgspec if installed,
+                otherwise the json module
+            json_offload_threshold (int): Variables of at least this many bytes are encoded and decoded in a thread
+                instead of on the event loop. How often that happened is counted by zeebe_adapter.json_offloader.
+                None keeps all JSON work on the event loop. Default: 1 MiB
+            max_running_jobs (int): Maximum amount of jobs running in the worker at once, shared by all tasks on top
+                of their own max_running_jobs. A task can borrow the idle capacity of other tasks, except their
+                min_share. When tasks compete for it, each gets a share of it by weight.
+                Default: only the limits of the tasks apply
         """
         super().__init__(before, after, exception_handler)
         self._stop_event = anyio.Event()
-        self.zeebe_adapter = ZeebeAdapter(grpc_channel, max_connection_retries)
+        self.zeebe_adapter = ZeebeAdapter(grpc_channel, max_connection_retries, json_codec, json_offload_threshold)
         self.zeebe_adapter.add_disconnect_callback(self._stop_event.set)
         self.name = name or socket.gethostname()
         self.request_timeout = request_timeout
@@ -66,27 +102,55 @@ class ZeebeWorker(ZeebeTaskRouter):
         self._job_executors: list[JobExecutor] = []
         self._stream_enabled = stream_enabled
         self._stream_request_timeout = stream_request_timeout
+        self._adaptive_polling = adaptive_polling
+        self._process_pool_size = process_pool_size
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._max_running_jobs = max_running_jobs
+        self._budget: JobBudget | None = None
+        self._completion_dispatcher = (
+            CompletionDispatcher(self.zeebe_adapter, max_pending_completions) if max_pending_completions else None
+        )
 
     def _init_tasks(self) -> None:
         self._job_executors, self._job_pollers, self._job_streamers = [], [], []
+        self._budget = JobBudget(self._max_running_jobs) if self._max_running_jobs is not None else None
 
         for task in self.tasks:
-            jobs_queue = asyncio.Queue[Job]()
-            task_state = TaskState()
-
-            poller = JobPoller(
-                zeebe_adapter=self.zeebe_adapter,
-                task=task,
-                queue=jobs_queue,
-                worker_name=self.name,
-                request_timeout=self.request_timeout,
-                task_state=task_state,
-                poll_retry_delay=self.poll_retry_delay,
-                tenant_ids=self.tenant_ids,
-            )
-            executor = JobExecutor(task, jobs_queue, task_state, self.zeebe_adapter)
+            if task.config.execution_mode == "process":
+                task.config.executor = self._get_process_pool()
+            task.config.json_offloader = self.zeebe_adapter.json_offloader
+
+            # Jobs count as active in the task state until they finish, so pollers and streamers stop fetching
+            # once max_running_jobs is reached. The bound is a safety net against jobs pushed while closing a stream.
+            jobs_queue = create_job_queue(task.config, maxsize=task.config.max_running_jobs)
+            task_state = TaskState(self._budget.job_released if self._budget else None)
+            if self._budget:
+                self._budget.add_task(task.config, task_state)
 
-            self._job_pollers.append(poller)
+            for _ in range(task.config.concurrent_activations):
+                poller = JobPoller(
+                    zeebe_adapter=self.zeebe_adapter,
+                    task=task,
+                    queue=jobs_queue,
+                    worker_name=self.name,
+                    request_timeout=self.request_timeout,
+                    task_state=task_state,
+                    poll_retry_delay=self.poll_retry_delay,
+                    tenant_ids=self.tenant_ids,
+                    polling_strategy=self._create_polling_strategy(),
+                    budget=self._budget,
+                )
+                self._job_pollers.append(poller)
+
+            executor = JobExecutor(
+                task,
+                jobs_queue,
+                task_state,
+                self.zeebe_adapter,
+                self._completion_dispatcher,
+                # The process pool's default size
+                self._process_pool_size or os.cpu_count(),
+            )
             self._job_executors.append(executor)
 
             if self._stream_enabled:
@@ -98,9 +162,36 @@ class ZeebeWorker(ZeebeTaskRouter):
                     stream_request_timeout=self._stream_request_timeout,
                     task_state=task_state,
                     tenant_ids=self.tenant_ids,
+                    budget=self._budget,
                 )
                 self._job_streamers.append(streamer)
 
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self._process_pool_size)
+        return self._process_pool
+
+    async def _shutdown_process_pool(self, deadline: float = math.inf) -> None:
+        if self._process_pool is None:
+            return
+        process_pool, self._process_pool = self._process_pool, None
+        await shutdown_executor(process_pool, deadline)
+
+    async def _shutdown_task_thread_pools(self, deadline: float = math.inf) -> None:
+        for task in self.tasks:
+            if isinstance(task.config.executor, TaskThreadPool):
+                await shutdown_executor(task.config.executor, deadline)
+
+    def _create_polling_strategy(self) -> AdaptivePollingStrategy | None:
+        if not self._adaptive_polling:
+            return None
+        if self.request_timeout > 0:
+            return AdaptivePollingStrategy(
+                min_request_timeout=min(DEFAULT_MIN_REQUEST_TIMEOUT, self.request_timeout),
+                max_request_timeout=self.request_timeout,
+            )
+        return AdaptivePollingStrategy()
+
     async def work(self) -> None:
         """
         Start the worker. The worker will poll zeebe for jobs of each task in a different asyncio task.
@@ -111,6 +202,7 @@ class ZeebeWorker(ZeebeTaskRouter):
             ZeebeGatewayUnavailableError: If the Zeebe gateway is unavailable
             ZeebeInternalError: If Zeebe experiences an internal error
             UnknownGrpcStatusCodeError: If Zeebe returns an unexpected status code
+            SettingsError: If max_running_jobs is smaller than 1 or the min_share of the tasks add up to more than it
 
         """
         self._init_tasks()
@@ -130,12 +222,24 @@ class ZeebeWorker(ZeebeTaskRouter):
 
             tg.cancel_scope.cancel()
 
+        await self._shutdown_process_pool()
         logger.info("Zeebe worker was stopped")
 
-    async def stop(self) -> None:
+    async def stop(self, drain_timeout: float | None = None) -> None:
         """
         Stop the worker. This will emit a signal asking tasks to complete the current task and stop polling for new.
+        Jobs that were activated but not started yet are handed back to Zeebe right away, with unchanged retries and
+        no backoff, so another worker picks them up. Once the running jobs are done and their completions are
+        delivered, the process pool and the thread pools created for tasks with max_threads are shut down.
+
+        Args:
+            drain_timeout (float): Maximum seconds to wait for running jobs, pending completions and the shutdown of
+                                   the pools, together. Once it passed, calls still queued in the pools are cancelled
+                                   and running ones are left behind. Keep it below the time the process gets to stop,
+                                   like the termination grace period of a Kubernetes pod.
+                                   Default: wait until all running jobs are done
         """
+        deadline = math.inf if drain_timeout is None else anyio.current_time() + drain_timeout
         async with anyio.create_task_group() as tg:
             for poller in self._job_pollers:
                 tg.start_soon(poller.stop)
@@ -144,8 +248,18 @@ class ZeebeWorker(ZeebeTaskRouter):
                 tg.start_soon(streamer.stop)
 
             for executor in self._job_executors:
-                tg.start_soon(executor.stop)
+                tg.start_soon(executor.stop, drain_timeout)
 
+        if self._completion_dispatcher:
+            with anyio.CancelScope(deadline=deadline) as scope:
+                await self._completion_dispatcher.stop()
+            if scope.cancelled_caught:
+                logger.warning(
+                    "%s completions were still pending when the drain timeout passed, stopped waiting for them",
+                    self._completion_dispatcher.pending,
+                )
+        await self._shutdown_process_pool(deadline)
+        await self._shutdown_task_thread_pools(deadline)
         self._stop_event.set()
 
     def include_router(self, *routers: ZeebeTaskRouter) -> None:
@@ -165,3 +279,15 @@ class ZeebeWorker(ZeebeTaskRouter):
     async def healthcheck(self) -> HealthCheckResponse:
         """Ping Zeebe Gateway using GRPC Health Checking Protocol."""
         return await self.zeebe_adapter.healthcheck()
+
+
+async def shutdown_executor(executor: Executor, deadline: float = math.inf) -> None:
+    """
+    Shut an executor down, waiting for its calls until the deadline (in :func:`anyio.current_time`). After that the
+    queued calls are cancelled and the running ones are left to finish on their own.
+    """
+    with anyio.CancelScope(deadline=deadline) as scope:
+        await anyio.to_thread.run_sync(executor.shutdown, abandon_on_cancel=True)
+    if scope.cancelled_caught:
+        logger.warning("Stopped waiting for the calls running in %s", executor)
+        executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,64 @@
+from dataclasses import dataclass
+
+import pytest
+
+from pyzeebe.codec import json_codec
+from pyzeebe.codec.json_codec import (
+    JsonCodec,
+    MsgspecJsonCodec,
+    OrjsonCodec,
+    StdlibJsonCodec,
+    get_default_codec,
+)
+
+
+@dataclass
+class Order:
+    amount: int
+
+
+AVAILABLE_CODECS = [StdlibJsonCodec()]
+if json_codec.HAS_ORJSON:
+    AVAILABLE_CODECS.append(OrjsonCodec())
+if json_codec.HAS_MSGSPEC:
+    AVAILABLE_CODECS.append(MsgspecJsonCodec())
+
+
+@pytest.mark.parametrize("codec", AVAILABLE_CODECS, ids=lambda codec: codec.name)
+class TestCodecs:
+    def test_round_trip(self, codec: JsonCodec):
+        value = {"str": "ü", "int": 1, "float": 1.5, "bool": True, "none": None, "list": [1, {"a": "b"}]}
+
+        assert codec.loads(codec.dumps(value)) == value
+
+    def test_dumps_returns_str(self, codec: JsonCodec):
+        assert isinstance(codec.dumps({}), str)
+
+    def test_loads_bytes(self, codec: JsonCodec):
+        assert codec.loads(b'{"x": 1}') == {"x": 1}
+
+    def test_encodes_dataclass(self, codec: JsonCodec):
+        assert codec.loads(codec.dumps({"order": Order(amount=1)})) == {"order": {"amount": 1}}
+
+    def test_raises_on_unserializable_value(self, codec: JsonCodec):
+        with pytest.raises(TypeError):
+            codec.dumps({"x": object()})
+
+
+class TestGetDefaultCodec:
+    def test_falls_back_to_stdlib(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(json_codec, "HAS_ORJSON", False)
+        monkeypatch.setattr(json_codec, "HAS_MSGSPEC", False)
+
+        assert isinstance(get_default_codec(), StdlibJsonCodec)
+
+    @pytest.mark.skipif(not json_codec.HAS_ORJSON, reason="orjson is not installed")
+    def test_prefers_orjson(self):
+        assert isinstance(get_default_codec(), OrjsonCodec)
+
+
+def test_missing_library_raises_import_error(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(json_codec, "HAS_MSGSPEC", False)
+
+    with pytest.raises(ImportError):
+        MsgspecJsonCodec()
@@ -0,0 +1,112 @@
+import json
+import threading
+from dataclasses import dataclass
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyzeebe.codec import StdlibJsonCodec
+from pyzeebe.codec.offload import (
+    JsonOffloader,
+    _SizeEstimate,
+    dumps_in_chunks,
+    estimate_size,
+    exceeds_size,
+)
+from pyzeebe.errors import SettingsError
+from pyzeebe.job.lazy_json import LazyJsonMapping
+
+
+@dataclass
+class Document:
+    content: str
+
+
+class TestExceedsSize:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {"document": "x" * 1000},
+            {"items": list(range(1000))},
+            [{"x": 1}] * 100,
+            LazyJsonMapping(json.dumps({"document": "x" * 1000})),
+            Document("x" * 1000),
+        ],
+    )
+    def test_large_value(self, value):
+        assert exceeds_size(value, 1000)
+
+    @pytest.mark.parametrize("value", [{}, {"x": 1, "y": "small"}, [1, 2, 3], None, LazyJsonMapping("{}")])
+    def test_small_value(self, value):
+        assert not exceeds_size(value, 1000)
+
+
+class TestEstimateSize:
+    @pytest.mark.parametrize(
+        "value",
+        [
+            {f"key-{index}": {"id": index, "name": f"name-{index}"} for index in range(5000)},
+            {"rows": [[{"name": f"name-{index}"} for index in range(100)] for _ in range(100)]},
+        ],
+    )
+    def test_visits_at_most_budget_values(self, value):
+        size = _SizeEstimate.size
+
+        with patch.object(_SizeEstimate, "size", autospec=True, side_effect=size) as size_mock:
+            estimate = estimate_size(value, 10**9, budget=100)
+
+        assert size_mock.call_count <= 100
+        assert len(json.dumps(value)) / 2 < estimate < len(json.dumps(value)) * 2
+
+
+@pytest.mark.parametrize(
+    "value",
+    [{"items": list(range(2500)), "nested": {"x": [1, 2]}}, list(range(2500)), {}, [], {1: "non str key"}, "x"],
+)
+def test_dumps_in_chunks(value):
+    assert json.loads(dumps_in_chunks(value, json.dumps)) == json.loads(json.dumps(value))
+
+
+@pytest.mark.anyio
+class TestJsonOffloader:
+    async def test_encodes_small_payload_on_event_loop(self):
+        codec = MagicMock(wraps=StdlibJsonCodec())
+        codec.dumps.side_effect = lambda value: str(threading.get_ident())
+        offloader = JsonOffloader(codec, threshold=1000)
+
+        assert await offloader.dumps({"x": 1}) == str(threading.get_ident())
+        assert offloader.offloaded_encodes == 0
+
+    async def test_encodes_large_payload_in_thread(self):
+        codec = MagicMock(wraps=StdlibJsonCodec())
+        codec.dumps.side_effect = lambda value: str(threading.get_ident())
+        offloader = JsonOffloader(codec, threshold=1000)
+
+        assert await offloader.dumps({"document": "x" * 1000}) != str(threading.get_ident())
+        assert offloader.offloaded_encodes == 1
+
+    async def test_never_offloads_without_threshold(self):
+        offloader = JsonOffloader(StdlibJsonCodec(), threshold=None)
+
+        assert await offloader.dumps({"document": "x" * 1000})
+        assert not offloader.is_large(LazyJsonMapping(json.dumps({"document": "x" * 1000})))
+        assert offloader.offloaded_encodes == 0
+
+    def test_large_variables(self):
+        offloader = JsonOffloader(StdlibJsonCodec(), threshold=1000)
+        variables = LazyJsonMapping(json.dumps({"document": "x" * 1000}))
+
+        assert offloader.is_large(variables)
+        variables.decode()
+        assert not offloader.is_large(variables)
+        assert not offloader.is_large({"document": "x" * 1000})
+
+    async def test_decodes_in_thread(self):
+        offloader = JsonOffloader(StdlibJsonCodec(), threshold=1000)
+
+        assert await offloader.decode(threading.get_ident) != threading.get_ident()
+        assert offloader.offloaded_decodes == 1
+
+    def test_rejects_negative_threshold(self):
+        with pytest.raises(SettingsError):
+            JsonOffloader(StdlibJsonCodec(), threshold=-1)
@@ -1,4 +1,5 @@
 import inspect
+import threading
 
 import pytest
 
@@ -26,6 +27,26 @@ class TestAsyncify:
         assert await async_function(x=1, y=1, z=1) == 3
 
 
+@pytest.mark.anyio
+class TestInline:
+    async def test_inline_function_runs_on_event_loop_thread(self):
+        async_function = async_tools.asyncify(async_tools.inline(lambda: threading.get_ident()))
+
+        assert await async_function() == threading.get_ident()
+
+    async def test_function_runs_in_executor_by_default(self):
+        async_function = async_tools.asyncify(threading.get_ident)
+
+        assert await async_function() != threading.get_ident()
+
+    def test_is_inline(self):
+        def function():
+            pass
+
+        assert not async_tools.is_inline(function)
+        assert async_tools.is_inline(async_tools.inline(function))
+
+
 class TestAsyncifyAllFunctions:
     def sync_function(self):
         return
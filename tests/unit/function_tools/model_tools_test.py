@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+import msgspec
+import pydantic
+import pytest
+
+from pyzeebe.function_tools import model_tools, parameter_tools
+from pyzeebe.job.job import Job
+from pyzeebe.job.lazy_json import LazyJsonMapping
+
+
+@dataclass
+class DataclassOrder:
+    order_id: str
+    amount: int
+
+
+class PydanticOrder(pydantic.BaseModel):
+    order_id: str = pydantic.Field(alias="orderId")
+    amount: int
+
+
+class MsgspecOrder(msgspec.Struct):
+    order_id: str
+    amount: int
+
+
+def dataclass_task(order: DataclassOrder):
+    pass
+
+
+def model_and_job_task(order: DataclassOrder, job: Job):
+    pass
+
+
+def two_param_task(order: DataclassOrder, x: int):
+    pass
+
+
+class TestGetModelParameter:
+    def test_returns_model_parameter(self):
+        assert parameter_tools.get_model_parameter(dataclass_task) == ("order", DataclassOrder)
+
+    def test_ignores_job_parameter(self):
+        assert parameter_tools.get_model_parameter(model_and_job_task) == ("order", DataclassOrder)
+
+    def test_model_must_be_only_parameter(self):
+        assert parameter_tools.get_model_parameter(two_param_task) is None
+
+    def test_fetches_model_fields(self):
+        assert parameter_tools.get_parameters_from_function(dataclass_task, typed_variables=True) == [
+            "order_id",
+            "amount",
+        ]
+
+    def test_fetches_variable_of_parameter_without_typed_variables(self):
+        assert parameter_tools.get_parameters_from_function(dataclass_task) == ["order"]
+
+
+@pytest.mark.parametrize(
+    "model_type,fields",
+    [
+        (DataclassOrder, ["order_id", "amount"]),
+        (PydanticOrder, ["orderId", "amount"]),
+        (MsgspecOrder, ["order_id", "amount"]),
+    ],
+)
+def test_get_model_fields(model_type: type, fields: list[str]):
+    assert model_tools.get_model_fields(model_type) == fields
+
+
+class TestLoadModel:
+    @pytest.mark.parametrize(
+        "variables",
+        [
+            LazyJsonMapping('{"order_id": "a", "amount": 1, "other": true}'),
+            {"order_id": "a", "amount": 1, "other": True},
+        ],
+    )
+    @pytest.mark.parametrize("model_type", [DataclassOrder, MsgspecOrder])
+    def test_loads_model(self, variables, model_type: type):
+        assert model_tools.load_model(variables, model_type) == model_type(order_id="a", amount=1)
+
+    def test_decodes_msgspec_model_without_decoding_variables(self):
+        variables = LazyJsonMapping('{"order_id": "a", "amount": 1}')
+
+        model_tools.load_model(variables, MsgspecOrder)
+
+        assert not variables.is_decoded
+
+    def test_decodes_pydantic_model_with_alias(self):
+        variables = LazyJsonMapping('{"orderId": "a", "amount": 1}')
+
+        assert model_tools.load_model(variables, PydanticOrder) == PydanticOrder(orderId="a", amount=1)
+
+    @pytest.mark.parametrize("model_type", [PydanticOrder, MsgspecOrder])
+    def test_validates_model(self, model_type: type):
+        with pytest.raises((pydantic.ValidationError, msgspec.ValidationError)):
+            model_tools.load_model(LazyJsonMapping('{"orderId": "a", "order_id": "a", "amount": "x"}'), model_type)
+
+
+class TestEncodeModel:
+    @pytest.mark.parametrize(
+        "model,expected",
+        [
+            (DataclassOrder(order_id="a", amount=1), {"order_id": "a", "amount": 1}),
+            (PydanticOrder(orderId="a", amount=1), {"orderId": "a", "amount": 1}),
+            (MsgspecOrder(order_id="a", amount=1), {"order_id": "a", "amount": 1}),
+        ],
+    )
+    def test_encodes_model(self, model, expected: dict):
+        assert model_tools.encode_model(model) == expected
+
+    def test_raises_on_other_objects(self):
+        with pytest.raises(TypeError):
+            model_tools.encode_model(object())
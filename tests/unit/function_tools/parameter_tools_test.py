@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import typing
 from collections.abc import Callable
 
 import pytest
 
 from pyzeebe.function_tools import parameter_tools
+from pyzeebe.job.job import Job
 from tests.unit.utils import dummy_functions
 
 
@@ -35,6 +37,13 @@ class TestGetFunctionParameters:
     def test_get_params(self, fn: Callable, expected: list[str] | None):
         assert parameter_tools.get_parameters_from_function(fn) == expected
 
+    def test_string_job_annotation_is_not_a_variable(self):
+        # This module uses from __future__ import annotations, so the annotation is the string "Job"
+        def with_job_parameter_and_param(job: Job, x: int) -> None:
+            pass
+
+        assert parameter_tools.get_parameters_from_function(with_job_parameter_and_param) == ["x"]
+
 
 class TestGetJobParameter:
     def test_returns_none_when_there_are_no_parameters_annotated_with_job(self):
@@ -51,3 +60,38 @@ class TestGetJobParameter:
         job_parameter = parameter_tools.get_job_parameter_name(dummy_functions.with_multiple_job_parameters)
 
         assert job_parameter == "job"
+
+    def test_returns_parameter_name_when_annotated_with_string(self):
+        def with_job_parameter(x: int, job: Job) -> None:
+            pass
+
+        job_parameter = parameter_tools.get_job_parameter_name(with_job_parameter)
+
+        assert job_parameter == "job"
+
+
+def batch_of_jobs(jobs: list[Job]) -> None:
+    pass
+
+
+def typing_batch_of_jobs(jobs: typing.List[Job]) -> None:
+    pass
+
+
+def batch_of_variables(batch: list[dict]) -> None:
+    pass
+
+
+class TestReceivesJobList:
+    @pytest.mark.parametrize(
+        "fn,expected",
+        [
+            # Annotations of functions in this module are strings (from __future__ import annotations)
+            (batch_of_jobs, True),
+            (typing_batch_of_jobs, True),
+            (batch_of_variables, False),
+            (dummy_functions.one_param, False),
+        ],
+    )
+    def test_receives_job_list(self, fn: Callable, expected: bool):
+        assert parameter_tools.receives_job_list(fn) == expected
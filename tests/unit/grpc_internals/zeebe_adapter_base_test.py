@@ -10,7 +10,10 @@ from pyzeebe.errors import (
     ZeebeInternalError,
 )
 from pyzeebe.errors.zeebe_errors import UnknownGrpcStatusCodeError
-from pyzeebe.grpc_internals.zeebe_adapter_base import ZeebeAdapterBase
+from pyzeebe.grpc_internals.zeebe_adapter_base import (
+    ZeebeAdapterBase,
+    uncounted_retries,
+)
 
 
 @pytest.mark.anyio
@@ -126,3 +129,14 @@ class TestHandleRpcError:
         assert zeebe_adapter.connected is False
         zeebe_adapter._channel.close.assert_awaited_once()
         on_disconnect_callback.assert_called_once()
+
+    async def test_uncounted_retries_keep_channel_open(self, zeebe_adapter: ZeebeAdapterBase):
+        error = grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, None, None)
+
+        zeebe_adapter._channel.close = AsyncMock()
+        zeebe_adapter._max_connection_retries = 1
+        with uncounted_retries(), pytest.raises(ZeebeGatewayUnavailableError):
+            await zeebe_adapter._handle_grpc_error(error)
+
+        assert zeebe_adapter.connected is True
+        assert zeebe_adapter._current_connection_retries == 0
@@ -1,8 +1,12 @@
+from dataclasses import replace
 from random import randint
+from unittest.mock import AsyncMock, MagicMock
 from uuid import uuid4
 
+import grpc
 import pytest
 
+from pyzeebe.codec import StdlibJsonCodec
 from pyzeebe.errors import (
     ActivateJobsRequestInvalidError,
     JobAlreadyDeactivatedError,
@@ -17,6 +21,7 @@ from pyzeebe.grpc_internals.types import (
 )
 from pyzeebe.grpc_internals.zeebe_job_adapter import ZeebeJobAdapter
 from pyzeebe.job.job import Job
+from pyzeebe.job.lazy_json import LazyJsonMapping
 from pyzeebe.task.task import Task
 from tests.unit.utils.gateway_mock import GatewayMock
 from tests.unit.utils.random_utils import RANDOM_RANGE, random_job
@@ -70,6 +75,37 @@ class TestActivateJobs:
 
         assert len([job async for job in jobs]) == active_jobs_count
 
+    async def test_variables_are_decoded_on_access(self, grpc_servicer: GatewayMock, task: Task):
+        job = random_job(task, variables={"x": 1})
+        grpc_servicer.active_jobs[job.key] = job
+
+        activated_job = [job async for job in self.activate_jobs(task_type=task.type)][0]
+
+        assert isinstance(activated_job.variables, LazyJsonMapping)
+        assert not activated_job.variables.is_decoded
+        assert activated_job.variables == {"x": 1}
+
+    async def test_variables_are_decoded_with_codec(self, grpc_servicer: GatewayMock, task: Task):
+        job = random_job(task, variables={"x": 1})
+        grpc_servicer.active_jobs[job.key] = job
+        codec = MagicMock(wraps=StdlibJsonCodec())
+        self.zeebe_job_adapter._json_codec = codec
+
+        activated_job = [job async for job in self.activate_jobs(task_type=task.type)][0]
+
+        assert activated_job.variables == {"x": 1}
+        codec.loads.assert_called()
+
+    async def test_jobs_share_equal_custom_headers(self, grpc_servicer: GatewayMock, task: Task):
+        for _ in range(2):
+            job = replace(random_job(task), custom_headers={"header": "value"})
+            grpc_servicer.active_jobs[job.key] = job
+
+        first, second = [job async for job in self.activate_jobs(task_type=task.type, max_jobs_to_activate=2)]
+
+        assert first.custom_headers == {"header": "value"}
+        assert first.custom_headers is second.custom_headers
+
     async def test_raises_on_invalid_worker(self):
         with pytest.raises(ActivateJobsRequestInvalidError):
             jobs = self.activate_jobs(worker=None)
@@ -122,6 +158,20 @@ class TestStreamActivateJobs:
 
         assert len([job async for job in jobs]) == active_jobs_count
 
+    async def test_closing_generator_cancels_stream(self, task: Task):
+        call = MagicMock()
+        call.__aiter__.return_value = [MagicMock()]
+        call.code = AsyncMock(return_value=grpc.StatusCode.CANCELLED)
+        self.zeebe_job_adapter._gateway_stub = MagicMock(StreamActivatedJobs=MagicMock(return_value=call))
+        self.zeebe_job_adapter._create_job_from_raw_job = MagicMock()
+
+        jobs = self.stream_activate_jobs(task_type=task.type)
+        await jobs.__anext__()
+        await jobs.aclose()
+
+        call.cancel.assert_called_once()
+        call.code.assert_awaited_once()
+
     async def test_raises_on_invalid_worker(self):
         with pytest.raises(StreamActivateJobsRequestInvalidError):
             jobs = self.stream_activate_jobs(worker=None)
@@ -149,6 +199,15 @@ class TestCompleteJob:
         with pytest.raises(JobNotFoundError):
             await zeebe_adapter.complete_job(random_job_key(), {})
 
+    @pytest.mark.parametrize("variables", ['{"x": 1}', b'{"x": 1}'])
+    async def test_sends_encoded_variables_as_they_are(self, zeebe_adapter: ZeebeJobAdapter, variables):
+        zeebe_adapter._gateway_stub = AsyncMock()
+
+        await zeebe_adapter.complete_job(random_job_key(), variables)
+
+        request = zeebe_adapter._gateway_stub.CompleteJob.call_args.args[0]
+        assert request.variables == '{"x": 1}'
+
     async def test_raises_on_already_completed_job(self, zeebe_adapter: ZeebeJobAdapter, first_active_job: Job):
         await zeebe_adapter.complete_job(first_active_job.key, {})
 
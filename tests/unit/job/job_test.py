@@ -1,9 +1,34 @@
+from dataclasses import replace
 from unittest.mock import AsyncMock
 from uuid import uuid4
 
 import pytest
 
 from pyzeebe import Job, JobController, JobStatus
+from pyzeebe.worker.task_state import TaskState
+from tests.unit.utils.random_utils import random_job
+
+
+class TestJob:
+    def test_jobs_with_same_key_are_equal(self, job: Job):
+        same_job = replace(job, variables={"x": 1}, status=JobStatus.Completed)
+
+        assert same_job == job
+        assert hash(same_job) == hash(job)
+
+    def test_can_be_used_in_sets(self, job: Job):
+        jobs = {job, replace(job, variables={"y": 2}), random_job()}
+
+        assert len(jobs) == 2
+        assert job in jobs
+
+    def test_has_no_instance_dict(self, job: Job):
+        assert not hasattr(job, "__dict__")
+
+    def test_task_result_can_be_set(self, job: Job):
+        job.set_task_result({"x": 1})
+
+        assert job.task_result == {"x": 1}
 
 
 @pytest.mark.anyio
@@ -24,6 +49,25 @@ class TestSetSuccessStatus:
 
         assert job.status == JobStatus.Completed
 
+    async def test_hands_completion_to_dispatcher(self, job: Job):
+        zeebe_adapter, completion_dispatcher = AsyncMock(), AsyncMock()
+        job_controller = JobController(job, zeebe_adapter, completion_dispatcher)
+
+        await job_controller.set_success_status({"x": 1})
+
+        completion_dispatcher.complete_job.assert_awaited_once_with(job, {"x": 1}, deadline=job.deadline)
+        zeebe_adapter.complete_job.assert_not_called()
+
+    async def test_hands_extended_deadline_to_dispatcher(self, job: Job):
+        completion_dispatcher, task_state = AsyncMock(), TaskState()
+        task_state.add(job)
+        task_state.update_deadline(job, job.deadline + 60_000)
+        job_controller = JobController(job, AsyncMock(), completion_dispatcher, task_state)
+
+        await job_controller.set_success_status({"x": 1})
+
+        completion_dispatcher.complete_job.assert_awaited_once_with(job, {"x": 1}, deadline=job.deadline + 60_000)
+
 
 @pytest.mark.anyio
 class TestSetErrorStatus:
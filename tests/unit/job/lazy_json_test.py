@@ -0,0 +1,76 @@
+import json
+from unittest.mock import Mock
+
+import pytest
+
+from pyzeebe.job.lazy_json import LazyJsonCache, LazyJsonMapping
+
+
+def test_decodes_on_first_access():
+    loads = Mock(side_effect=json.loads)
+    mapping = LazyJsonMapping('{"x": 1}', loads)
+
+    assert not mapping.is_decoded
+    assert mapping["x"] == 1
+    assert dict(mapping) == {"x": 1}
+    loads.assert_called_once_with('{"x": 1}')
+
+
+@pytest.mark.parametrize("raw", ["", "{}"])
+def test_empty_object_is_never_decoded(raw: str):
+    loads = Mock()
+    mapping = LazyJsonMapping(raw, loads)
+
+    assert len(mapping) == 0
+    loads.assert_not_called()
+
+
+def test_equals_dict():
+    assert LazyJsonMapping('{"x": 1}') == {"x": 1}
+
+
+def test_is_read_only():
+    mapping = LazyJsonMapping('{"x": 1}')
+
+    with pytest.raises(TypeError):
+        mapping["x"] = 2  # type: ignore[index]
+
+
+def test_repr_does_not_decode():
+    mapping = LazyJsonMapping('{"x": 1}')
+
+    assert '{"x": 1}' in repr(mapping)
+    assert not mapping.is_decoded
+
+
+def test_keeps_raw_json():
+    assert LazyJsonMapping('{"x": 1}').raw == '{"x": 1}'
+
+
+class TestLazyJsonCache:
+    def test_equal_json_shares_mapping(self):
+        cache = LazyJsonCache()
+
+        assert cache.get('{"x": 1}') is cache.get('{"x": 1}')
+        assert cache.get('{"x": 1}') is not cache.get('{"x": 2}')
+
+    def test_decodes_once(self):
+        loads = Mock(side_effect=json.loads)
+        cache = LazyJsonCache(loads)
+
+        for _ in range(3):
+            assert cache.get('{"x": 1}')["x"] == 1
+
+        loads.assert_called_once()
+
+    def test_evicts_least_recently_used(self):
+        cache = LazyJsonCache(max_size=2)
+        first = cache.get('{"x": 1}')
+        second = cache.get('{"x": 2}')
+        cache.get('{"x": 1}')
+
+        cache.get('{"x": 3}')
+
+        assert len(cache) == 2
+        assert cache.get('{"x": 1}') is first
+        assert cache.get('{"x": 2}') is not second
@@ -0,0 +1,65 @@
+import asyncio
+from dataclasses import replace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from pyzeebe.job.job import Job
+from pyzeebe.task.batcher import JobBatcher
+
+
+@pytest.fixture
+def jobs(job: Job) -> list[Job]:
+    return [replace(job, key=key) for key in range(3)]
+
+
+@pytest.mark.anyio
+class TestJobBatcher:
+    async def test_runs_full_batch_without_waiting(self, jobs: list[Job]):
+        run_batch = AsyncMock(side_effect=lambda batch: [job.key for job in batch])
+        batcher = JobBatcher(run_batch, max_batch=3, max_wait_ms=10_000)
+
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(job) for job in jobs)), timeout=1)
+
+        assert results == [0, 1, 2]
+        run_batch.assert_awaited_once_with(jobs)
+
+    async def test_runs_partial_batch_after_max_wait(self, jobs: list[Job]):
+        run_batch = AsyncMock(side_effect=lambda batch: [job.key for job in batch])
+        batcher = JobBatcher(run_batch, max_batch=10, max_wait_ms=5)
+
+        results = await asyncio.wait_for(asyncio.gather(*(batcher.submit(job) for job in jobs[:2])), timeout=1)
+
+        assert results == [0, 1]
+        run_batch.assert_awaited_once_with(jobs[:2])
+
+    async def test_splits_jobs_into_batches(self, jobs: list[Job]):
+        run_batch = AsyncMock(side_effect=lambda batch: [job.key for job in batch])
+        batcher = JobBatcher(run_batch, max_batch=2, max_wait_ms=5)
+
+        await asyncio.wait_for(asyncio.gather(*(batcher.submit(job) for job in jobs)), timeout=1)
+
+        assert [call.args[0] for call in run_batch.await_args_list] == [jobs[:2], jobs[2:]]
+
+    async def test_raises_per_job_exception(self, jobs: list[Job]):
+        error = ValueError()
+        batcher = JobBatcher(AsyncMock(return_value=[{}, error]), max_batch=2, max_wait_ms=5)
+
+        results = await asyncio.gather(*(batcher.submit(job) for job in jobs[:2]), return_exceptions=True)
+
+        assert results == [{}, error]
+
+    async def test_batch_exception_fails_every_job(self, jobs: list[Job]):
+        error = ValueError()
+        batcher = JobBatcher(AsyncMock(side_effect=error), max_batch=2, max_wait_ms=5)
+
+        results = await asyncio.gather(*(batcher.submit(job) for job in jobs[:2]), return_exceptions=True)
+
+        assert results == [error, error]
+
+    async def test_wrong_amount_of_results_fails_every_job(self, jobs: list[Job]):
+        batcher = JobBatcher(AsyncMock(return_value=[{}]), max_batch=2, max_wait_ms=5)
+
+        results = await asyncio.gather(*(batcher.submit(job) for job in jobs[:2]), return_exceptions=True)
+
+        assert all(isinstance(result, ValueError) for result in results)
@@ -1,13 +1,22 @@
 import copy
+import json
+import os
+import threading
 from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
 
 import pytest
 
-from pyzeebe import Job, JobController, TaskDecorator
+from pyzeebe import Job, JobController, TaskDecorator, inline
+from pyzeebe.codec import JsonOffloader, StdlibJsonCodec
+from pyzeebe.errors import SettingsError
 from pyzeebe.job.job_status import JobStatus
+from pyzeebe.job.lazy_json import LazyJsonMapping
 from pyzeebe.task import task_builder
 from pyzeebe.task.task import Task
 from pyzeebe.task.task_config import TaskConfig
+from tests.unit.utils import dummy_functions
 from tests.unit.utils.random_utils import random_job
 
 
@@ -74,6 +83,47 @@ class TestBuildTask:
         assert "job" not in job.variables
 
 
+class TestProcessExecutionMode:
+    @pytest.fixture
+    def process_task_config(self, task_config: TaskConfig):
+        task_config.execution_mode = "process"
+        return task_config
+
+    def test_rejects_async_function(self, process_task_config: TaskConfig):
+        async def async_function():
+            pass
+
+        with pytest.raises(SettingsError):
+            task_builder.build_task(async_function, process_task_config)
+
+    def test_rejects_job_parameter(self, process_task_config: TaskConfig):
+        with pytest.raises(SettingsError):
+            task_builder.build_task(dummy_functions.job_param, process_task_config)
+
+    def test_rejects_inline_function(self, process_task_config: TaskConfig):
+        @inline
+        def inline_function():
+            return {}
+
+        with pytest.raises(SettingsError):
+            task_builder.build_task(inline_function, process_task_config)
+
+    @pytest.mark.anyio
+    async def test_runs_function_in_configured_executor(
+        self, process_task_config: TaskConfig, mocked_job_controller: JobController
+    ):
+        process_task_config.variables_to_fetch = ["x"]
+        task = task_builder.build_task(dummy_functions.process_id, process_task_config)
+
+        with ProcessPoolExecutor(max_workers=1) as process_pool:
+            process_task_config.executor = process_pool
+            await task.job_handler(random_job(variables={"x": 1}), mocked_job_controller)
+
+        variables = mocked_job_controller.set_success_status.call_args.kwargs["variables"]
+        assert variables["x"] == 1
+        assert variables["pid"] != os.getpid()
+
+
 class TestBuildJobHandler:
     def test_returned_task_is_callable(self, original_task_function: Callable, task_config: TaskConfig):
         task = task_builder.build_job_handler(original_task_function, task_config)
@@ -339,3 +389,262 @@ class TestBuildJobHandler:
 
     def function_with_job_parameter(x: int, job: Job):
         return {"received_job": job}
+
+
+@pytest.mark.anyio
+class TestBatchTask:
+    @pytest.fixture
+    def batch_task_config(self, task_config: TaskConfig):
+        task_config.max_batch = 1
+        return task_config
+
+    async def test_function_receives_variables(
+        self, batch_task_config: TaskConfig, job: Job, mocked_job_controller: JobController
+    ):
+        def double(batch: list[dict]) -> list[dict]:
+            return [{"y": variables["x"] * 2} for variables in batch]
+
+        task = task_builder.build_task(double, batch_task_config)
+        job = replace(job, variables={"x": 2})
+
+        await task.job_handler(job, mocked_job_controller)
+
+        mocked_job_controller.set_success_status.assert_awaited_once_with(variables={"y": 4})
+
+    async def test_function_receives_jobs(
+        self, batch_task_config: TaskConfig, job: Job, mocked_job_controller: JobController
+    ):
+        async def keys(jobs: list[Job]) -> list[dict]:
+            return [{"key": job.key} for job in jobs]
+
+        task = task_builder.build_task(keys, batch_task_config)
+
+        await task.job_handler(job, mocked_job_controller)
+
+        mocked_job_controller.set_success_status.assert_awaited_once_with(variables={"key": job.key})
+
+    async def test_single_values(self, batch_task_config: TaskConfig, job: Job, mocked_job_controller: JobController):
+        batch_task_config.single_value = True
+        batch_task_config.variable_name = "score"
+
+        task = task_builder.build_task(lambda batch: [0.5] * len(batch), batch_task_config)
+
+        await task.job_handler(job, mocked_job_controller)
+
+        mocked_job_controller.set_success_status.assert_awaited_once_with(variables={"score": 0.5})
+
+    async def test_exception_result_calls_exception_handler(
+        self, batch_task_config: TaskConfig, job: Job, mocked_job_controller: JobController
+    ):
+        error = ValueError()
+        task = task_builder.build_task(lambda batch: [error], batch_task_config)
+
+        await task.job_handler(job, mocked_job_controller)
+
+        batch_task_config.exception_handler.assert_awaited_once_with(error, job, mocked_job_controller)
+        mocked_job_controller.set_success_status.assert_not_called()
+
+    def test_function_must_receive_one_parameter(self, batch_task_config: TaskConfig):
+        with pytest.raises(SettingsError):
+            task_builder.build_task(lambda: [], batch_task_config)
+
+
+@pytest.mark.anyio
+class TestModelParameter:
+    async def test_task_receives_model(self, task_config: TaskConfig, job: Job, mocked_job_controller: JobController):
+        def double(order: dummy_functions.Order) -> dummy_functions.Order:
+            return dummy_functions.Order(amount=order.amount * 2)
+
+        task_config.typed_variables = True
+        task = task_builder.build_task(double, task_config)
+
+        await task.job_handler(replace(job, variables={"amount": 2, "other": 1}), mocked_job_controller)
+
+        mocked_job_controller.set_success_status.assert_awaited_once_with(variables=dummy_functions.Order(amount=4))
+
+    async def test_task_receives_variable_of_parameter_name_by_default(
+        self, task_config: TaskConfig, job: Job, mocked_job_controller: JobController
+    ):
+        received = []
+
+        def receive(order: dummy_functions.Order) -> dict:
+            received.append(order)
+            return {}
+
+        task_config.variables_to_fetch = ["order"]
+        task = task_builder.build_task(receive, task_config)
+
+        await task.job_handler(replace(job, variables={"order": {"amount": 2}, "amount": 1}), mocked_job_controller)
+
+        assert received == [{"amount": 2}]
+
+    def test_typed_variables_need_model_parameter(self, task_config: TaskConfig):
+        task_config.typed_variables = True
+
+        with pytest.raises(SettingsError):
+            task_builder.build_task(dummy_functions.one_param, task_config)
+
+
+class TestCreateArgumentBinder:
+    def test_binds_only_fetched_variables(self, task_config: TaskConfig, job: Job):
+        task_config.variables_to_fetch = ["x", "missing"]
+
+        bind_arguments = task_builder.create_argument_binder(dummy_functions.one_param, task_config)
+
+        assert bind_arguments(replace(job, variables={"x": 1, "y": 2})) == {"x": 1}
+
+    def test_binds_job(self, task_config: TaskConfig, job: Job):
+        task_config.variables_to_fetch = ["x"]
+        task_config.job_parameter_name = "job"
+
+        bind_arguments = task_builder.create_argument_binder(dummy_functions.with_job_parameter_and_param, task_config)
+
+        assert bind_arguments(replace(job, variables={"x": 1})) == {"x": 1, "job": job}
+
+    def test_binds_all_variables(self, task_config: TaskConfig, job: Job):
+        task_config.variables_to_fetch = []
+
+        bind_arguments = task_builder.create_argument_binder(dummy_functions.kwargs_param, task_config)
+
+        assert bind_arguments(replace(job, variables=LazyJsonMapping('{"x": 1, "y": 2}'))) == {"x": 1, "y": 2}
+
+    def test_inspects_task_function_once(self, task_config: TaskConfig, job: Job, mocker):
+        signature = mocker.spy(task_builder.inspect, "signature")
+        bind_arguments = task_builder.create_argument_binder(dummy_functions.with_job_parameter, task_config)
+        calls = signature.call_count
+
+        for _ in range(3):
+            bind_arguments(job)
+
+        assert signature.call_count == calls
+
+
+@pytest.mark.anyio
+class TestRawVariables:
+    @pytest.fixture
+    def raw_task_config(self, task_config: TaskConfig):
+        task_config.raw_variables = True
+        task_config.variables_to_fetch = []
+        return task_config
+
+    @pytest.fixture
+    def raw_job(self, job: Job):
+        return replace(job, variables=LazyJsonMapping('{"x": 1}'))
+
+    async def test_receives_raw_variables(
+        self, raw_task_config: TaskConfig, raw_job: Job, mocked_job_controller: JobController
+    ):
+        def forward(variables: str) -> dict:
+            return {"received": variables}
+
+        task = task_builder.build_task(forward, raw_task_config)
+        await task.job_handler(raw_job, mocked_job_controller)
+
+        mocked_job_controller.set_success_status.assert_awaited_once_with(variables={"received": '{"x": 1}'})
+        assert not raw_job.variables.is_decoded
+
+    async def test_returns_raw_variables(
+        self, raw_task_config: TaskConfig, raw_job: Job, mocked_job_controller: JobController
+    ):
+        async def forward(variables: bytes, job: Job) -> bytes:
+            return variables
+
+        task = task_builder.build_task(forward, raw_task_config)
+        await task.job_handler(raw_job, mocked_job_controller)
+
+        mocked_job_controller.set_success_status.assert_awaited_once_with(variables=b'{"x": 1}')
+
+    async def test_encodes_decoded_variables(self, raw_task_config: TaskConfig, job: Job):
+        def forward(variables: str):
+            pass
+
+        task_builder.build_task(forward, raw_task_config)
+        bind_arguments = task_builder.create_argument_binder(forward, raw_task_config)
+
+        assert bind_arguments(replace(job, variables={"x": 1})) == {"variables": '{"x": 1}'}
+
+    def test_rejects_several_parameters(self, raw_task_config: TaskConfig):
+        with pytest.raises(SettingsError):
+            task_builder.build_task(dummy_functions.multiple_params, raw_task_config)
+
+
+@pytest.mark.anyio
+class TestBindJobArguments:
+    async def test_large_variables_are_decoded_in_thread(
+        self, task_config: TaskConfig, job: Job, mocked_job_controller: JobController
+    ):
+        task_config.variables_to_fetch = ["x"]
+        task_config.json_offloader = JsonOffloader(StdlibJsonCodec(), threshold=10)
+        task = task_builder.build_task(dummy_functions.one_param, task_config)
+
+        await task.job_handler(
+            replace(job, variables=LazyJsonMapping(json.dumps({"x": 1, "document": "x" * 10}))), mocked_job_controller
+        )
+
+        mocked_job_controller.set_success_status.assert_awaited_once()
+        assert task_config.json_offloader.offloaded_decodes == 1
+
+    async def test_small_variables_are_decoded_on_event_loop(self, task_config: TaskConfig, job: Job):
+        task_config.json_offloader = JsonOffloader(StdlibJsonCodec(), threshold=1000)
+
+        arguments = await task_builder.bind_job_arguments(
+            lambda job: dict(job.variables), task_config, replace(job, variables=LazyJsonMapping('{"x": 1}'))
+        )
+
+        assert arguments == {"x": 1}
+        assert task_config.json_offloader.offloaded_decodes == 0
+
+
+@pytest.mark.anyio
+class TestCreateDecoratorRunner:
+    def test_no_decorators(self):
+        assert task_builder.create_decorator_runner([]) is None
+
+    async def test_runs_decorators_in_order(self, job: Job):
+        calls = []
+
+        async def first(job: Job) -> Job:
+            calls.append("first")
+            return job
+
+        async def second(job: Job) -> Job:
+            calls.append("second")
+            return job
+
+        decorator_runner = task_builder.create_decorator_runner([first, second])
+
+        assert decorator_runner
+        assert await decorator_runner(job) == job
+        assert calls == ["first", "second"]
+
+    async def test_inline_decorator_runs_on_event_loop_thread(
+        self, task_config: TaskConfig, job: Job, mocked_job_controller: JobController
+    ):
+        threads = []
+
+        @inline
+        def log_job(job: Job) -> Job:
+            threads.append(threading.get_ident())
+            return job
+
+        task_config = replace_decorators(task_config, before=[log_job], after=[log_job])
+        job_handler = task_builder.build_job_handler(dummy_functions.no_param, task_config)
+
+        await job_handler(job, mocked_job_controller)
+
+        assert threads == [threading.get_ident()] * 2
+
+
+def replace_decorators(task_config: TaskConfig, before: list[TaskDecorator], after: list[TaskDecorator]) -> TaskConfig:
+    return TaskConfig(
+        task_config.type,
+        task_config.exception_handler,
+        task_config.timeout_ms,
+        task_config.max_jobs_to_activate,
+        task_config.max_running_jobs,
+        task_config.variables_to_fetch,
+        task_config.single_value,
+        task_config.variable_name,
+        before,
+        after,
+    )
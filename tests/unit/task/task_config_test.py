@@ -1,5 +1,12 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pyzeebe.errors import SettingsError
 from pyzeebe.job.job import Job
 from pyzeebe.task.task_config import TaskConfig
+from pyzeebe.task.thread_pool import TaskThreadPool
 from tests.unit.utils.function_tools import functions_are_all_async
 
 
@@ -46,3 +53,60 @@ class TestConstructor:
         )
 
         assert functions_are_all_async(task_config.after)
+
+    def test_concurrent_activations_must_be_positive(self, task_type: str):
+        with pytest.raises(SettingsError):
+            TaskConfig(task_type, None, 10000, 32, 32, [], False, "", [], [], concurrent_activations=0)
+
+    def test_liveness_probe_interval_must_be_positive(self, task_type: str):
+        with pytest.raises(SettingsError):
+            TaskConfig(task_type, None, 10000, 32, 32, [], False, "", [], [], liveness_probe_ms=0)
+
+    @pytest.mark.parametrize("settings", [{"weight": 0}, {"min_share": -1}])
+    def test_invalid_budget_settings(self, task_type: str, settings: dict):
+        with pytest.raises(SettingsError):
+            TaskConfig(task_type, None, 10000, 32, 32, [], False, "", [], [], **settings)
+
+    def test_max_threads_creates_dedicated_thread_pool(self, task_type: str):
+        task_config = TaskConfig(task_type, None, 10000, 32, 32, [], False, "", [], [], max_threads=2)
+
+        assert isinstance(task_config.executor, TaskThreadPool)
+        assert task_config.executor.max_threads == 2
+
+    def test_copy_keeps_thread_pool_of_task(self, task_type: str):
+        task_config = TaskConfig(task_type, None, 10000, 32, 32, [], False, "", [], [], max_threads=2)
+
+        copy = TaskConfig(
+            task_type, None, 10000, 32, 32, [], False, "", [], [], executor=task_config.executor, max_threads=2
+        )
+
+        assert copy.executor is task_config.executor
+        assert copy.max_threads == 2
+
+    @pytest.mark.parametrize(
+        "settings",
+        [
+            {"max_threads": 0},
+            {"max_threads": 2, "executor": ThreadPoolExecutor()},
+            {"max_threads": 2, "executor": TaskThreadPool("other_task", 2)},
+            {"max_threads": 2, "execution_mode": "process"},
+            {"executor": ThreadPoolExecutor(), "execution_mode": "process"},
+        ],
+    )
+    def test_invalid_executor_settings(self, task_type: str, settings: dict):
+        with pytest.raises(SettingsError):
+            TaskConfig(task_type, None, 10000, 32, 32, [], False, "", [], [], **settings)
+
+    @pytest.mark.anyio
+    async def test_sync_decorators_run_in_task_executor(self, task_type: str):
+        thread_names: list[str] = []
+
+        def decorator(job: Job) -> Job:
+            thread_names.append(threading.current_thread().name)
+            return job
+
+        task_config = TaskConfig(task_type, None, 10000, 32, 32, [], False, "", [decorator], [], max_threads=1)
+
+        await task_config.before[0](None)
+
+        assert thread_names[0].startswith(f"pyzeebe-{task_type}")
@@ -0,0 +1,47 @@
+import logging
+import threading
+
+import pytest
+
+from pyzeebe.task.thread_pool import TaskThreadPool
+
+
+@pytest.fixture
+def thread_pool():
+    pool = TaskThreadPool("task", max_threads=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_runs_calls_in_named_threads(thread_pool: TaskThreadPool):
+    future = thread_pool.submit(lambda: threading.current_thread().name)
+
+    assert future.result().startswith("pyzeebe-task")
+
+
+def test_tracks_in_flight_calls(thread_pool: TaskThreadPool):
+    release = threading.Event()
+
+    futures = [thread_pool.submit(release.wait) for _ in range(3)]
+
+    assert thread_pool.in_flight == 3
+    assert thread_pool.queued == 2
+    assert thread_pool.saturation == 3
+
+    release.set()
+    for future in futures:
+        future.result()
+    assert thread_pool.in_flight == 0
+
+
+def test_warns_once_when_saturated(thread_pool: TaskThreadPool, caplog: pytest.LogCaptureFixture):
+    release = threading.Event()
+
+    with caplog.at_level(logging.WARNING):
+        futures = [thread_pool.submit(release.wait) for _ in range(3)]
+    release.set()
+    for future in futures:
+        future.result()
+
+    assert len(caplog.records) == 1
+    assert "task" in caplog.records[0].getMessage()
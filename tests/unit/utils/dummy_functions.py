@@ -1,3 +1,6 @@
+import os
+from dataclasses import dataclass
+
 from pyzeebe.job.job import Job
 
 
@@ -55,3 +58,16 @@ lambda_multiple_params = lambda x, y, z: None
 lambda_one_keyword_param = lambda x=0: None
 lambda_multiple_keyword_params = lambda x=0, y=0, z=0: None
 lambda_positional_and_keyword_params = lambda x, y=0: None
+
+
+def job_param(job: Job):
+    pass
+
+
+def process_id(x):
+    return {"x": x, "pid": os.getpid()}
+
+
+@dataclass
+class Order:
+    amount: int
@@ -0,0 +1,68 @@
+import pytest
+
+from pyzeebe.worker.adaptive_polling import AdaptivePollingStrategy
+
+
+@pytest.fixture
+def strategy() -> AdaptivePollingStrategy:
+    return AdaptivePollingStrategy(min_request_timeout=1000, max_request_timeout=20000, smoothing=1)
+
+
+class TestMaxJobsToActivate:
+    def test_requests_one_job_when_idle(self, strategy: AdaptivePollingStrategy):
+        strategy.record_activation(requested=32, received=0, duration=20)
+
+        assert strategy.max_jobs_to_activate(32, handler_latency=0.1) == 1
+
+    def test_requests_all_available_jobs_when_saturated(self, strategy: AdaptivePollingStrategy):
+        strategy.record_activation(requested=4, received=4, duration=0.01)
+
+        assert strategy.max_jobs_to_activate(32, handler_latency=0.1) == 32
+
+    def test_follows_arrival_rate(self, strategy: AdaptivePollingStrategy):
+        strategy.record_activation(requested=32, received=5, duration=1)
+
+        assert strategy.max_jobs_to_activate(32, handler_latency=1) == 10
+
+    def test_never_exceeds_available_jobs(self, strategy: AdaptivePollingStrategy):
+        strategy.record_activation(requested=32, received=30, duration=0.01)
+
+        assert strategy.max_jobs_to_activate(8, handler_latency=1) == 8
+
+    def test_returns_zero_when_nothing_is_available(self, strategy: AdaptivePollingStrategy):
+        strategy.record_activation(requested=4, received=4, duration=0.01)
+
+        assert strategy.max_jobs_to_activate(0, handler_latency=1) == 0
+
+
+class TestRequestTimeout:
+    def test_long_poll_when_idle(self, strategy: AdaptivePollingStrategy):
+        strategy.record_activation(requested=32, received=0, duration=20)
+
+        assert strategy.request_timeout() == 20000
+
+    def test_short_poll_when_saturated(self, strategy: AdaptivePollingStrategy):
+        strategy.record_activation(requested=32, received=32, duration=0.01)
+
+        assert strategy.request_timeout() == 1000
+
+    def test_starts_with_long_poll(self):
+        assert AdaptivePollingStrategy(max_request_timeout=5000).request_timeout() == 5000
+
+    def test_observations_are_smoothed(self):
+        strategy = AdaptivePollingStrategy(min_request_timeout=1000, max_request_timeout=3000, smoothing=0.5)
+
+        strategy.record_activation(requested=32, received=32, duration=0.01)
+
+        assert strategy.request_timeout() == 2000
+
+
+class TestInit:
+    @pytest.mark.parametrize("smoothing", [0, 1.5])
+    def test_rejects_invalid_smoothing(self, smoothing: float):
+        with pytest.raises(ValueError):
+            AdaptivePollingStrategy(smoothing=smoothing)
+
+    def test_rejects_invalid_timeouts(self):
+        with pytest.raises(ValueError):
+            AdaptivePollingStrategy(min_request_timeout=2000, max_request_timeout=1000)
@@ -0,0 +1,126 @@
+import asyncio
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+import grpc
+import pytest
+
+from pyzeebe.errors import JobNotFoundError, SettingsError, ZeebeBackPressureError
+from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
+from pyzeebe.job.job import Job
+from pyzeebe.worker.completion_dispatcher import CompletionDispatcher
+from pyzeebe.worker.job_lease import now_ms
+
+
+@pytest.fixture
+def zeebe_adapter() -> AsyncMock:
+    return AsyncMock()
+
+
+@pytest.fixture
+def active_job(job: Job) -> Job:
+    return replace(job, deadline=int(now_ms()) + 10_000)
+
+
+def test_needs_at_least_one_pending_completion(zeebe_adapter: AsyncMock):
+    with pytest.raises(SettingsError):
+        CompletionDispatcher(zeebe_adapter, max_pending=0)
+
+
+@pytest.mark.anyio
+class TestCompleteJob:
+    async def test_returns_before_completion_is_acknowledged(self, zeebe_adapter: AsyncMock, active_job: Job):
+        acknowledged = asyncio.Event()
+
+        async def complete_job(**kwargs) -> None:
+            await acknowledged.wait()
+
+        zeebe_adapter.complete_job.side_effect = complete_job
+        dispatcher = CompletionDispatcher(zeebe_adapter, max_pending=2)
+
+        await dispatcher.complete_job(active_job, {"x": 1})
+
+        assert dispatcher.pending == 1
+        acknowledged.set()
+        await dispatcher.stop()
+        zeebe_adapter.complete_job.assert_awaited_once_with(job_key=active_job.key, variables={"x": 1})
+        assert dispatcher.pending == 0
+
+    async def test_waits_while_max_pending_completions_are_in_flight(self, zeebe_adapter: AsyncMock, active_job: Job):
+        acknowledged = asyncio.Event()
+
+        async def complete_job(**kwargs) -> None:
+            await acknowledged.wait()
+
+        zeebe_adapter.complete_job.side_effect = complete_job
+        dispatcher = CompletionDispatcher(zeebe_adapter, max_pending=1)
+        await dispatcher.complete_job(active_job, {})
+
+        second = asyncio.create_task(dispatcher.complete_job(replace(active_job, key=active_job.key + 1), {}))
+        await asyncio.sleep(0)
+        assert not second.done()
+
+        acknowledged.set()
+        await asyncio.wait_for(second, timeout=1)
+        await dispatcher.stop()
+
+    async def test_retries_on_back_pressure(self, zeebe_adapter: AsyncMock, active_job: Job):
+        zeebe_adapter.complete_job.side_effect = [ZeebeBackPressureError(MagicMock()), None]
+        dispatcher = CompletionDispatcher(zeebe_adapter, max_pending=1)
+
+        await dispatcher.complete_job(active_job, {})
+        await asyncio.wait_for(dispatcher.stop(), timeout=1)
+
+        assert zeebe_adapter.complete_job.await_count == 2
+
+    async def test_gives_up_at_job_deadline(self, zeebe_adapter: AsyncMock, job: Job):
+        zeebe_adapter.complete_job.side_effect = ZeebeBackPressureError(MagicMock())
+        dispatcher = CompletionDispatcher(zeebe_adapter, max_pending=1)
+
+        await dispatcher.complete_job(replace(job, deadline=int(now_ms())), {})
+        await asyncio.wait_for(dispatcher.stop(), timeout=1)
+
+        zeebe_adapter.complete_job.assert_awaited_once()
+
+    async def test_retries_until_extended_deadline(self, zeebe_adapter: AsyncMock, job: Job):
+        zeebe_adapter.complete_job.side_effect = [ZeebeBackPressureError(MagicMock()), None]
+        dispatcher = CompletionDispatcher(zeebe_adapter, max_pending=1)
+        # The deadline the job was activated with passed, but its timeout was extended
+        extended_job = replace(job, deadline=int(now_ms()))
+
+        await dispatcher.complete_job(extended_job, {}, deadline=int(now_ms()) + 10_000)
+        await asyncio.wait_for(dispatcher.stop(), timeout=1)
+
+        assert zeebe_adapter.complete_job.await_count == 2
+
+    async def test_does_not_retry_deactivated_job(self, zeebe_adapter: AsyncMock, active_job: Job):
+        zeebe_adapter.complete_job.side_effect = JobNotFoundError(active_job.key)
+        dispatcher = CompletionDispatcher(zeebe_adapter, max_pending=1)
+
+        await dispatcher.complete_job(active_job, {})
+        await asyncio.wait_for(dispatcher.stop(), timeout=1)
+
+        zeebe_adapter.complete_job.assert_awaited_once()
+
+    async def test_retries_dont_use_up_connection_retries(self, aio_grpc_channel_mock, active_job: Job):
+        zeebe_adapter = ZeebeAdapter(aio_grpc_channel_mock, max_connection_retries=5)
+        unavailable = grpc.aio.AioRpcError(grpc.StatusCode.UNAVAILABLE, None, None)
+        calls = 0
+
+        async def complete_job(request):
+            nonlocal calls
+            calls += 1
+            # A short outage: the first five attempts of each completion fail
+            if calls <= 20:
+                raise unavailable
+
+        zeebe_adapter._gateway_stub = MagicMock(CompleteJob=complete_job)
+        dispatcher = CompletionDispatcher(zeebe_adapter, max_pending=4)
+
+        for index in range(4):
+            await dispatcher.complete_job(replace(active_job, key=active_job.key + index), {})
+        await asyncio.wait_for(dispatcher.stop(), timeout=5)
+
+        assert calls == 24
+        assert zeebe_adapter.connected
+        assert zeebe_adapter._current_connection_retries == 4
@@ -0,0 +1,127 @@
+import pytest
+
+from pyzeebe.errors import SettingsError
+from pyzeebe.job.job import Job
+from pyzeebe.task.task_config import TaskConfig
+from pyzeebe.worker.job_budget import JobBudget
+from pyzeebe.worker.task_state import TaskState
+from tests.unit.utils.random_utils import random_job
+
+
+def create_task_config(task_type: str, max_running_jobs: int = 32, **settings) -> TaskConfig:
+    return TaskConfig(task_type, None, 10000, 32, max_running_jobs, [], False, "", [], [], **settings)
+
+
+def run_jobs(task_state: TaskState, amount: int) -> list[Job]:
+    jobs = [random_job() for _ in range(amount)]
+    for job in jobs:
+        task_state.add(job)
+    return jobs
+
+
+@pytest.fixture
+def budget() -> JobBudget:
+    return JobBudget(10)
+
+
+@pytest.fixture
+def hot(budget: JobBudget) -> TaskState:
+    task_state = TaskState(budget.job_released)
+    budget.add_task(create_task_config("hot"), task_state)
+    return task_state
+
+
+@pytest.fixture
+def rare(budget: JobBudget) -> TaskState:
+    task_state = TaskState(budget.job_released)
+    budget.add_task(create_task_config("rare"), task_state)
+    return task_state
+
+
+class TestCountAvailable:
+    def test_borrows_idle_capacity(self, budget: JobBudget, hot: TaskState, rare: TaskState):
+        assert budget.count_available("hot") == 9
+
+    def test_keeps_min_share_of_other_tasks(self, budget: JobBudget, hot: TaskState, rare: TaskState):
+        run_jobs(hot, 9)
+
+        assert budget.count_available("hot") == 0
+        assert budget.count_available("rare") == 1
+
+    def test_reserved_slots_only_count_for_their_task(self, budget: JobBudget, hot: TaskState, rare: TaskState):
+        hot.reserve(5)
+
+        assert budget.count_available("hot") == 4
+        assert budget.count_available("rare") == 9
+
+    def test_long_polls_of_idle_tasks_leave_capacity_to_hot_task(self):
+        budget = JobBudget(64)
+        task_states = {task_type: TaskState(budget.job_released) for task_type in ("idle", "rare", "hot")}
+        for task_type, task_state in task_states.items():
+            budget.add_task(create_task_config(task_type), task_state)
+
+        # The idle tasks' polls stay open for the whole request timeout
+        task_states["idle"].reserve(budget.count_available("idle"))
+        task_states["rare"].reserve(budget.count_available("rare"))
+
+        assert budget.count_available("hot") == 32
+        run_jobs(task_states["hot"], 16)
+        assert budget.count_available("hot") == 16
+
+    def test_respects_max_running_jobs_of_task(self, budget: JobBudget):
+        budget.add_task(create_task_config("limited", max_running_jobs=4), TaskState())
+
+        assert budget.count_available("limited") == 4
+
+    def test_leaves_released_slots_to_waiting_task_below_its_share(
+        self, budget: JobBudget, hot: TaskState, rare: TaskState
+    ):
+        hot_jobs = run_jobs(hot, 9)
+        run_jobs(rare, 1)
+        assert budget.count_available("rare") == 0
+
+        hot.remove(hot_jobs[0])
+
+        assert budget.count_available("hot") == 0
+        assert budget.count_available("rare") == 1
+
+    def test_shares_by_weight(self, budget: JobBudget, hot: TaskState):
+        heavy = TaskState(budget.job_released)
+        budget.add_task(create_task_config("heavy", weight=4), heavy)
+        run_jobs(hot, 2)
+        heavy_jobs = run_jobs(heavy, 7)
+        assert budget.count_available("hot") == 1
+        run_jobs(hot, 1)
+        assert budget.count_available("heavy") == 0
+
+        heavy.remove(heavy_jobs[0])
+
+        # hot is above its share of 2 slots, heavy is below its share of 8
+        assert budget.count_available("hot") == 0
+        assert budget.count_available("heavy") == 1
+
+
+class TestSettings:
+    def test_max_running_jobs_must_be_positive(self):
+        with pytest.raises(SettingsError):
+            JobBudget(0)
+
+    def test_min_shares_must_fit(self, budget: JobBudget):
+        budget.add_task(create_task_config("first", min_share=6), TaskState())
+
+        with pytest.raises(SettingsError):
+            budget.add_task(create_task_config("second", min_share=5), TaskState())
+
+    def test_min_share_is_limited_to_max_running_jobs_of_task(self, budget: JobBudget):
+        budget.add_task(create_task_config("first", max_running_jobs=2, min_share=20), TaskState())
+        budget.add_task(create_task_config("second", min_share=8), TaskState())
+
+
+@pytest.mark.anyio
+async def test_shared_event_signals_released_slots(budget: JobBudget, hot: TaskState, rare: TaskState):
+    job = random_job()
+    hot.add(job)
+
+    hot.remove(job)
+
+    assert budget.job_released.is_set()
@@ -1,13 +1,23 @@
 import asyncio
 import json
+import time
+from dataclasses import replace
 from unittest.mock import AsyncMock, Mock
 
 import pytest
 
+from pyzeebe.errors import JobNotFoundError, UnknownGrpcStatusCodeError
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 from pyzeebe.job.job import Job, JobController
 from pyzeebe.task.task import Task
-from pyzeebe.worker.job_executor import JobExecutor, create_job_callback
+from pyzeebe.task.thread_pool import TaskThreadPool
+from pyzeebe.worker.job_executor import (
+    JobExecutor,
+    count_job_slots,
+    create_job_callback,
+)
+from pyzeebe.worker.job_lease import now_ms
+from pyzeebe.worker.job_queue import create_job_queue
 from pyzeebe.worker.task_state import TaskState
 
 
@@ -36,6 +46,324 @@ class TestExecuteOneJob:
         await job_executor.execute_one_job(job_from_task, job_controller)
         await job_executor.execute_one_job(job_from_task, job_controller)
 
+    async def test_no_timeout_extension_by_default(self, job_executor: JobExecutor, job_from_task: Job):
+        assert job_executor.start_timeout_extension(job_from_task) is None
+
+    async def test_timeout_extension_is_stopped_with_job(
+        self, job_executor: JobExecutor, job_from_task: Job, job_controller: JobController
+    ):
+        job_executor.task.config.auto_extend_timeout = True
+        extensions = []
+        start_timeout_extension = job_executor.start_timeout_extension
+
+        def track_extension(job: Job):
+            extensions.append(start_timeout_extension(job))
+            return extensions[-1]
+
+        job_executor.start_timeout_extension = track_extension
+
+        await job_executor.execute_one_job(job_from_task, job_controller)
+        await asyncio.sleep(0)
+
+        assert extensions[0].cancelled()
+
+    async def test_records_job_duration(
+        self, job_executor: JobExecutor, job_from_task: Job, job_controller: JobController
+    ):
+        job_executor.task_state.record_job_duration = Mock()
+
+        await job_executor.execute_one_job(job_from_task, job_controller)
+
+        job_executor.task_state.record_job_duration.assert_called_once()
+
+
+@pytest.mark.anyio
+class TestRunUntilDeadline:
+    @pytest.fixture
+    def slow_handler(self, task: Task) -> asyncio.Event:
+        cancelled = asyncio.Event()
+
+        async def job_handler(job: Job, job_controller: JobController):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task.job_handler = job_handler
+        return cancelled
+
+    @pytest.fixture(autouse=True)
+    def short_timeout(self, task: Task):
+        task.config.timeout_ms = 100
+
+    @staticmethod
+    def job_due_in(job: Job, milliseconds: int) -> Job:
+        return replace(job, deadline=now_ms() + milliseconds)
+
+    async def test_ignores_deadline_by_default(self, job_executor: JobExecutor, job_from_task: Job):
+        job_executor.run_supervised = AsyncMock()
+
+        await job_executor.execute_one_job(job_from_task, JobController(job_from_task, AsyncMock()))
+
+        job_executor.run_supervised.assert_not_called()
+
+    async def test_cancels_handler_at_deadline(
+        self, job_executor: JobExecutor, job_from_task: Job, slow_handler: asyncio.Event
+    ):
+        job_executor.task.config.on_timeout = "cancel"
+        job = self.job_due_in(job_from_task, 50)
+        job_controller = JobController(job, AsyncMock())
+
+        await asyncio.wait_for(job_executor.execute_one_job(job, job_controller), timeout=1)
+        await asyncio.sleep(0)
+
+        assert slow_handler.is_set()
+        assert job_executor.task_state.timed_out_jobs == 1
+        job_controller._zeebe_adapter.fail_job.assert_not_called()
+
+    async def test_fails_job_at_deadline(
+        self, job_executor: JobExecutor, job_from_task: Job, slow_handler: asyncio.Event
+    ):
+        job_executor.task.config.on_timeout = "fail"
+        job = self.job_due_in(job_from_task, 50)
+        job_controller = JobController(job, AsyncMock())
+
+        await asyncio.wait_for(job_executor.execute_one_job(job, job_controller), timeout=1)
+
+        job_controller._zeebe_adapter.fail_job.assert_awaited_once()
+        assert job_controller._zeebe_adapter.fail_job.call_args.kwargs["job_key"] == job.key
+
+    async def test_waits_for_extended_deadline(self, job_executor: JobExecutor, job_from_task: Job, task: Task):
+        job_executor.task.config.on_timeout = "cancel"
+        job = self.job_due_in(job_from_task, 50)
+        job_executor.task_state.add(job)
+
+        async def job_handler(job: Job, job_controller: JobController):
+            job_executor.task_state.update_deadline(job, now_ms() + 10_000)
+            await asyncio.sleep(0.1)
+
+        task.job_handler = job_handler
+
+        await job_executor.execute_one_job(job, JobController(job, AsyncMock()))
+
+        assert job_executor.task_state.timed_out_jobs == 0
+
+    async def test_raises_handler_error(self, job_executor: JobExecutor, job_from_task: Job, task: Task):
+        job_executor.task.config.on_timeout = "cancel"
+        job = self.job_due_in(job_from_task, 10_000)
+        task.job_handler = AsyncMock(side_effect=ValueError())
+
+        with pytest.raises(ValueError):
+            await job_executor.execute_one_job(job, JobController(job, AsyncMock()))
+
+    async def test_cancels_handler_when_cancelled(
+        self, job_executor: JobExecutor, job_from_task: Job, slow_handler: asyncio.Event
+    ):
+        job_executor.task.config.on_timeout = "cancel"
+        job = self.job_due_in(job_from_task, 10_000)
+        execution = asyncio.create_task(job_executor.execute_one_job(job, JobController(job, AsyncMock())))
+        await asyncio.sleep(0.01)
+
+        execution.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await execution
+
+        assert slow_handler.is_set()
+        assert job_executor.task_state.timed_out_jobs == 0
+
+
+@pytest.mark.anyio
+class TestLivenessProbe:
+    @pytest.fixture
+    def slow_handler(self, task: Task) -> asyncio.Event:
+        cancelled = asyncio.Event()
+
+        async def job_handler(job: Job, job_controller: JobController):
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        task.job_handler = job_handler
+        return cancelled
+
+    async def test_no_probe_by_default(self, job_executor: JobExecutor, job_from_task: Job):
+        assert job_executor.start_liveness_probe(job_from_task, None) is None
+
+    async def test_timeout_extension_probes_job(self, job_executor: JobExecutor, job_from_task: Job):
+        job_executor.task.config.liveness_probe_ms = 10
+        timeout_extension = Mock()
+
+        assert job_executor.start_liveness_probe(job_from_task, timeout_extension) is timeout_extension
+
+    async def test_cancels_handler_of_inactive_job(
+        self, job_executor: JobExecutor, job_from_task: Job, slow_handler: asyncio.Event
+    ):
+        job_executor.task.config.liveness_probe_ms = 10
+        job = replace(job_from_task, deadline=now_ms() + 10_000)
+        job_executor.zeebe_adapter.update_job_timeout = AsyncMock(side_effect=JobNotFoundError(job.key))
+
+        await asyncio.wait_for(job_executor.execute_one_job(job, JobController(job, AsyncMock())), timeout=1)
+        await asyncio.sleep(0)
+
+        assert slow_handler.is_set()
+        assert job_executor.task_state.orphaned_jobs == 1
+
+    async def test_keeps_handler_running_when_probe_fails(
+        self, job_executor: JobExecutor, job_from_task: Job, task: Task
+    ):
+        job_executor.task.config.liveness_probe_ms = 10
+        job = replace(job_from_task, deadline=now_ms() + 10_000)
+        job_executor.zeebe_adapter.update_job_timeout = AsyncMock(side_effect=UnknownGrpcStatusCodeError(Mock()))
+
+        async def job_handler(job: Job, job_controller: JobController):
+            await asyncio.sleep(0.05)
+
+        task.job_handler = Mock(side_effect=job_handler)
+
+        await asyncio.wait_for(job_executor.execute_one_job(job, JobController(job, AsyncMock())), timeout=1)
+
+        assert job_executor.task_state.orphaned_jobs == 0
+        task.job_handler.assert_called_once()
+
+    async def test_probe_is_stopped_with_job(self, job_executor: JobExecutor, job_from_task: Job):
+        job_executor.task.config.liveness_probe_ms = 10
+        probes = []
+        start_liveness_probe = job_executor.start_liveness_probe
+
+        def track_probe(job: Job, timeout_extension):
+            probes.append(start_liveness_probe(job, timeout_extension))
+            return probes[-1]
+
+        job_executor.start_liveness_probe = track_probe
+
+        await job_executor.execute_one_job(job_from_task, JobController(job_from_task, AsyncMock()))
+        await asyncio.sleep(0)
+
+        assert probes[0].cancelled()
+        assert job_executor.task_state.orphaned_jobs == 0
+
+
+@pytest.mark.anyio
+class TestDropExpiredJobs:
+    async def test_fifo_executor_does_not_drop_expired_jobs(self, job_executor: JobExecutor, job_from_task: Job):
+        assert not job_executor.should_drop(replace(job_from_task, deadline=0))
+
+    async def test_drops_expired_jobs_with_deadline_scheduling(self, job_executor: JobExecutor, job_from_task: Job):
+        job_executor.task.config.scheduling = "deadline"
+
+        assert job_executor.should_drop(replace(job_from_task, deadline=0))
+        assert not job_executor.should_drop(replace(job_from_task, deadline=int(time.time() * 1000) + 60_000))
+
+    async def test_dropped_job_is_not_executed(self, job_executor: JobExecutor, job_from_task: Job, task: Task):
+        job_executor.task.config.scheduling = "deadline"
+        expired_job = replace(job_from_task, deadline=0)
+        job_executor.task_state.add(expired_job)
+        await job_executor.jobs.put(expired_job)
+
+        execution = asyncio.create_task(job_executor.execute())
+        await job_executor.jobs.join()
+        execution.cancel()
+
+        task.job_handler.assert_not_called()
+        assert job_executor.task_state.count_active() == 0
+
+
+class TestCountJobSlots:
+    def test_threads_of_task_thread_pool(self, task: Task):
+        task.config.executor = TaskThreadPool(task.type, 3)
+
+        assert count_job_slots(task) == 3
+
+    def test_processes_of_worker_process_pool(self, task: Task):
+        task.config.execution_mode = "process"
+
+        assert count_job_slots(task, process_pool_size=4) == 4
+
+    def test_unlimited_with_default_executor(self, task: Task):
+        assert count_job_slots(task) is None
+
+    def test_unlimited_for_async_function(self, task: Task):
+        async def async_function():
+            pass
+
+        task.original_function = async_function
+        task.config.executor = TaskThreadPool(task.type, 3)
+
+        assert count_job_slots(task) is None
+
+
+@pytest.mark.anyio
+class TestJobSlots:
+    @pytest.fixture
+    def job_executor(self, task: Task, task_state: TaskState, zeebe_adapter: ZeebeAdapter) -> JobExecutor:
+        task.config.scheduling = "deadline"
+        task.config.executor = TaskThreadPool(task.type, 1)
+        return JobExecutor(task, create_job_queue(task.config), task_state, zeebe_adapter)
+
+    @pytest.fixture
+    def release(self) -> asyncio.Event:
+        return asyncio.Event()
+
+    @pytest.fixture
+    def started_jobs(self, task: Task, release: asyncio.Event) -> list[Job]:
+        started: list[Job] = []
+
+        async def job_handler(job: Job, job_controller: JobController):
+            started.append(job)
+            await release.wait()
+            release.clear()
+
+        task.job_handler = Mock(side_effect=job_handler)
+        return started
+
+    async def put_job(self, job_executor: JobExecutor, job: Job) -> None:
+        job_executor.task_state.add(job)
+        await job_executor.jobs.put(job)
+
+    async def test_starts_queued_jobs_in_scheduling_order(
+        self, job_executor: JobExecutor, job_from_task: Job, release: asyncio.Event, started_jobs: list[Job]
+    ):
+        running = replace(job_from_task, key=1, deadline=now_ms() + 90_000)
+        late = replace(job_from_task, key=2, deadline=now_ms() + 60_000)
+        early = replace(job_from_task, key=3, deadline=now_ms() + 30_000)
+        await self.put_job(job_executor, running)
+        execution = asyncio.create_task(job_executor.execute())
+        await asyncio.sleep(0.01)
+
+        await self.put_job(job_executor, late)
+        await self.put_job(job_executor, early)
+        await asyncio.sleep(0.01)
+        assert started_jobs == [running]
+
+        for _ in range(3):
+            release.set()
+            await asyncio.sleep(0.01)
+        await asyncio.wait_for(job_executor.jobs.join(), timeout=1)
+        execution.cancel()
+
+        assert started_jobs == [running, early, late]
+
+    async def test_hands_back_queued_jobs_without_waiting_for_slot(
+        self, job_executor: JobExecutor, job_from_task: Job, started_jobs: list[Job]
+    ):
+        job_executor.zeebe_adapter.fail_job = AsyncMock()
+        running = replace(job_from_task, key=1, deadline=now_ms() + 60_000)
+        queued = replace(job_from_task, key=2, deadline=now_ms() + 60_000)
+        await self.put_job(job_executor, running)
+        execution = asyncio.create_task(job_executor.execute())
+        await asyncio.sleep(0.01)
+        await self.put_job(job_executor, queued)
+
+        await job_executor.stop(drain_timeout=0.1)
+        execution.cancel()
+
+        assert started_jobs == [running]
+        job_executor.zeebe_adapter.fail_job.assert_awaited_once()
+        assert job_executor.task_state.handed_back_jobs == 1
+
 
 @pytest.mark.anyio
 class TestGetNextJob:
@@ -63,6 +391,56 @@ class TestStop:
 
         await job_executor.execute()  # Implicitly test that execute returns immediately
 
+    async def test_hands_back_jobs_that_werent_started(self, job_executor: JobExecutor, job_from_task: Job, task: Task):
+        job_executor.zeebe_adapter.fail_job = AsyncMock()
+        job_executor.task_state.add(job_from_task)
+        await job_executor.jobs.put(job_from_task)
+        job_executor.stop_event.set()
+
+        execution = asyncio.create_task(job_executor.execute())
+        await asyncio.wait_for(job_executor.jobs.join(), timeout=1)
+        execution.cancel()
+
+        task.job_handler.assert_not_called()
+        job_executor.zeebe_adapter.fail_job.assert_awaited_once_with(
+            job_key=job_from_task.key,
+            retries=job_from_task.retries,
+            message="Worker stopped before starting the job",
+            retry_back_off_ms=0,
+            variables={},
+        )
+        assert job_executor.task_state.handed_back_jobs == 1
+        assert job_executor.task_state.count_active() == 0
+
+    async def test_releases_job_when_hand_back_fails(self, job_executor: JobExecutor, job_from_task: Job):
+        job_executor.zeebe_adapter.fail_job = AsyncMock(side_effect=JobNotFoundError(job_from_task.key))
+        job_executor.task_state.add(job_from_task)
+        await job_executor.jobs.put(job_from_task)
+        await job_executor.jobs.get()
+
+        await job_executor.hand_back_job(job_from_task)
+
+        assert job_executor.task_state.handed_back_jobs == 0
+        assert job_executor.task_state.count_active() == 0
+        await asyncio.wait_for(job_executor.jobs.join(), timeout=1)
+
+    async def test_stops_waiting_for_running_jobs_after_drain_timeout(
+        self, job_executor: JobExecutor, job_from_task: Job, task: Task
+    ):
+        async def job_handler(job: Job, job_controller: JobController):
+            await asyncio.sleep(10)
+
+        task.job_handler = Mock(side_effect=job_handler)
+        await job_executor.jobs.put(job_from_task)
+        execution = asyncio.create_task(job_executor.execute())
+        await asyncio.sleep(0.01)
+
+        await asyncio.wait_for(job_executor.stop(drain_timeout=0.01), timeout=1)
+
+        assert job_executor.drained.is_set()
+        task.job_handler.assert_called_once()
+        execution.cancel()
+
 
 @pytest.mark.anyio
 class TestCreateJobCallback:
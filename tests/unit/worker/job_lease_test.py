@@ -0,0 +1,123 @@
+import asyncio
+from dataclasses import replace
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from pyzeebe.errors import JobNotFoundError, ZeebeBackPressureError
+from pyzeebe.grpc_internals import zeebe_adapter_base
+from pyzeebe.job.job import Job
+from pyzeebe.worker.job_lease import extend_job_timeout, now_ms, probe_job
+from pyzeebe.worker.task_state import TaskState
+
+
+@pytest.fixture
+def expiring_job(job: Job) -> Job:
+    return replace(job, deadline=int(now_ms()) + 20)
+
+
+@pytest.mark.anyio
+class TestExtendJobTimeout:
+    async def test_extends_timeout_before_deadline(self, expiring_job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+        task_state.add(expiring_job)
+
+        extension = asyncio.create_task(extend_job_timeout(expiring_job, zeebe_adapter, 20, task_state))
+        await asyncio.sleep(0.05)
+        extension.cancel()
+
+        zeebe_adapter.update_job_timeout.assert_awaited_with(job_key=expiring_job.key, timeout=20)
+        assert zeebe_adapter.update_job_timeout.await_count >= 2
+        assert task_state.get(expiring_job).deadline > expiring_job.deadline
+
+    async def test_stops_when_job_is_not_found(self, expiring_job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+        zeebe_adapter.update_job_timeout.side_effect = JobNotFoundError(expiring_job.key)
+
+        await asyncio.wait_for(extend_job_timeout(expiring_job, zeebe_adapter, 20, task_state), timeout=1)
+
+        zeebe_adapter.update_job_timeout.assert_awaited_once()
+
+    async def test_retries_on_back_pressure(self, job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+        zeebe_adapter.update_job_timeout.side_effect = [
+            ZeebeBackPressureError(MagicMock()),
+            JobNotFoundError(job.key),
+        ]
+        job = replace(job, deadline=int(now_ms()) + 400)
+
+        await asyncio.wait_for(extend_job_timeout(job, zeebe_adapter, 800, task_state), timeout=1)
+
+        assert zeebe_adapter.update_job_timeout.await_count == 2
+
+    async def test_retries_dont_use_up_connection_retries(self, job: Job, task_state: TaskState):
+        counted = []
+
+        async def update_job_timeout(job_key: int, timeout: int) -> None:
+            counted.append(zeebe_adapter_base._counts_connection_retries.get())
+            if len(counted) < 3:
+                raise ZeebeBackPressureError(MagicMock())
+            raise JobNotFoundError(job_key)
+
+        zeebe_adapter = AsyncMock(update_job_timeout=update_job_timeout)
+        job = replace(job, deadline=int(now_ms()) + 800)
+
+        await asyncio.wait_for(extend_job_timeout(job, zeebe_adapter, 1600, task_state), timeout=1)
+
+        assert counted == [True, False, False]
+
+    async def test_gives_up_at_deadline(self, expiring_job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+        zeebe_adapter.update_job_timeout.side_effect = ZeebeBackPressureError(MagicMock())
+
+        with pytest.raises(ZeebeBackPressureError):
+            await asyncio.wait_for(extend_job_timeout(expiring_job, zeebe_adapter, 20, task_state), timeout=1)
+
+        zeebe_adapter.update_job_timeout.assert_awaited_once()
+        assert task_state.get_deadline(expiring_job) == expiring_job.deadline
+
+    async def test_extends_timeout_at_probe_interval(self, job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+        zeebe_adapter.update_job_timeout.side_effect = JobNotFoundError(job.key)
+        job = replace(job, deadline=int(now_ms()) + 60_000)
+
+        await asyncio.wait_for(extend_job_timeout(job, zeebe_adapter, 60_000, task_state, 10), timeout=1)
+
+        zeebe_adapter.update_job_timeout.assert_awaited_once()
+
+
+@pytest.mark.anyio
+class TestProbeJob:
+    async def test_keeps_deadline(self, job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+        zeebe_adapter.update_job_timeout.side_effect = [None, JobNotFoundError(job.key)]
+        job = replace(job, deadline=int(now_ms()) + 60_000)
+
+        await asyncio.wait_for(probe_job(job, zeebe_adapter, 10, task_state), timeout=1)
+
+        assert zeebe_adapter.update_job_timeout.await_count == 2
+        timeout = zeebe_adapter.update_job_timeout.call_args.kwargs["timeout"]
+        assert 59_000 < timeout <= 60_000
+
+    async def test_continues_on_back_pressure(self, job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+        zeebe_adapter.update_job_timeout.side_effect = [
+            ZeebeBackPressureError(MagicMock()),
+            JobNotFoundError(job.key),
+        ]
+        job = replace(job, deadline=int(now_ms()) + 60_000)
+
+        await asyncio.wait_for(probe_job(job, zeebe_adapter, 10, task_state), timeout=1)
+
+        assert zeebe_adapter.update_job_timeout.await_count == 2
+
+    async def test_doesnt_take_back_timed_out_job(self, expiring_job: Job, task_state: TaskState):
+        zeebe_adapter = AsyncMock()
+
+        probe = asyncio.create_task(probe_job(expiring_job, zeebe_adapter, 10, task_state))
+        await asyncio.sleep(0.05)
+        probe.cancel()
+
+        assert zeebe_adapter.update_job_timeout.await_count <= 1
+        for call in zeebe_adapter.update_job_timeout.call_args_list:
+            assert call.kwargs["timeout"] > 0
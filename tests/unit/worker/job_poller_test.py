@@ -1,11 +1,15 @@
 import asyncio
+import logging
 import re
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from pyzeebe.grpc_internals.zeebe_adapter import ZeebeAdapter
 from pyzeebe.job.job import Job
 from pyzeebe.task.task import Task
+from pyzeebe.worker.adaptive_polling import AdaptivePollingStrategy
+from pyzeebe.worker.job_budget import JobBudget
 from pyzeebe.worker.job_poller import JobPoller, JobStreamer
 from pyzeebe.worker.task_state import TaskState
 from tests.unit.utils.gateway_mock import GatewayMock
@@ -50,6 +54,24 @@ class TestPollOnce:
 
         assert job_poller.task_state.count_active() == 1
 
+    async def test_unfilled_reservation_is_released(self, job_poller: JobPoller, job_from_task: Job, grpc_servicer):
+        grpc_servicer.active_jobs[job_from_task.key] = job_from_task
+
+        await job_poller.poll_once()
+
+        assert job_poller.task_state.count_reserved() == 0
+
+    async def test_activation_is_recorded_by_polling_strategy(
+        self, job_poller: JobPoller, job_from_task: Job, grpc_servicer: GatewayMock
+    ):
+        grpc_servicer.active_jobs[job_from_task.key] = job_from_task
+        job_poller.polling_strategy = AdaptivePollingStrategy(smoothing=1)
+
+        await job_poller.poll_once()
+
+        assert job_poller.polling_strategy.saturated
+        assert job_poller.polling_strategy.arrival_rate > 0
+
 
 @pytest.mark.anyio
 class TestShouldPoll:
@@ -70,6 +92,11 @@ class TestShouldPoll:
 
         assert not job_poller.should_poll()
 
+    async def test_stop_leaves_queued_jobs_to_executor(self, job_poller: JobPoller, job_from_task: Job):
+        await job_poller.queue.put(job_from_task)
+
+        await asyncio.wait_for(job_poller.stop(), timeout=1)
+
 
 @pytest.mark.anyio
 class TestStreamShouldPoll:
@@ -90,6 +117,15 @@ class TestStreamShouldPoll:
 
         assert not job_stream_poller.should_poll()
 
+    async def test_has_no_capacity_when_worker_budget_is_used(self, job_stream_poller: JobStreamer):
+        job_stream_poller.budget = JobBudget(1)
+        job_stream_poller.budget.add_task(job_stream_poller.task.config, job_stream_poller.task_state)
+        assert job_stream_poller.has_capacity()
+
+        job_stream_poller.task_state.add(random_job())
+
+        assert not job_stream_poller.has_capacity()
+
 
 @pytest.mark.anyio
 class TestMaxJobsToActivate:
@@ -109,6 +145,53 @@ class TestMaxJobsToActivate:
 
         assert max_jobs_to_activate == 0
 
+    async def test_reserved_slots_are_not_requested_again(self, job_poller: JobPoller):
+        job_poller.task.config.max_running_jobs = 10
+        job_poller.task.config.max_jobs_to_activate = 10
+        job_poller.task_state.reserve(4)
+
+        assert job_poller.calculate_max_jobs_to_activate() == 6
+
+    async def test_requests_jobs_within_worker_budget(self, job_poller: JobPoller):
+        job_poller.budget = JobBudget(5)
+        job_poller.budget.add_task(job_poller.task.config, job_poller.task_state)
+        job_poller.task_state.reserve(2)
+
+        assert job_poller.calculate_max_jobs_to_activate() == 3
+
+    async def test_splits_free_slots_between_concurrent_requests(self, job_poller: JobPoller):
+        job_poller.task.config.concurrent_activations = 4
+
+        assert job_poller.calculate_max_jobs_to_activate() == 8
+        job_poller.task_state.reserve(8)
+        assert job_poller.calculate_max_jobs_to_activate() == 8
+
+    async def test_concurrent_requests_overlap(
+        self, zeebe_adapter: ZeebeAdapter, task: Task, queue: asyncio.Queue, task_state: TaskState
+    ):
+        task.config.concurrent_activations = 4
+        in_flight = 0
+        peak = 0
+
+        async def activate_jobs(**kwargs):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.05)
+            in_flight -= 1
+            return
+            yield
+
+        zeebe_adapter.activate_jobs = activate_jobs
+        pollers = [JobPoller(zeebe_adapter, task, queue, "test_worker", 100, task_state, 0, None) for _ in range(4)]
+        polls = [asyncio.create_task(poller.poll()) for poller in pollers]
+        await asyncio.sleep(0.03)
+        for poller in pollers:
+            await poller.stop()
+        await asyncio.wait_for(asyncio.gather(*polls), timeout=1)
+
+        assert peak == 4
+
     calculate_max_jobs_to_activate_cases = dict(
         max_running_jobs_minus_active_decides=(4, 10, 12, 6),
         max_running_jobs_minus_active_decides_2=(4, 12, 10, 8),
@@ -142,15 +225,58 @@ class TestMaxJobsToActivate:
         assert max_jobs_to_activate == expected
 
 
+@pytest.mark.anyio
+class TestAdaptivePolling:
+    async def test_max_jobs_to_activate_is_limited_by_strategy(self, job_poller: JobPoller):
+        job_poller.polling_strategy = AdaptivePollingStrategy()
+
+        assert job_poller.calculate_max_jobs_to_activate() == 1
+
+    async def test_strategy_cannot_exceed_free_slots(self, job_poller: JobPoller):
+        job_poller.polling_strategy = AdaptivePollingStrategy(smoothing=1)
+        job_poller.polling_strategy.record_activation(requested=1, received=1, duration=0.01)
+        job_poller.task.config.max_running_jobs = 3
+
+        assert job_poller.calculate_max_jobs_to_activate() == 3
+
+    async def test_request_timeout_is_static_without_strategy(self, job_poller: JobPoller):
+        assert job_poller.calculate_request_timeout() == job_poller.request_timeout
+
+    async def test_request_timeout_is_taken_from_strategy(self, job_poller: JobPoller):
+        job_poller.polling_strategy = AdaptivePollingStrategy(max_request_timeout=5000)
+
+        assert job_poller.calculate_request_timeout() == 5000
+
+
 @pytest.mark.anyio
 class TestActivateMaxJobs:
-    async def test_writes_warning_log_when_no_jobs_to_activate(self, job_poller: JobPoller, caplog):
+    async def test_writes_debug_log_when_no_jobs_to_activate(self, job_poller: JobPoller, caplog):
+        caplog.set_level(logging.DEBUG)
         job_poller.poll_retry_delay = 0
         job_poller.task.config.max_running_jobs = 0
 
         await job_poller.activate_max_jobs()
 
-        assert re.search("Maximum number of jobs running for .*. Polling again in 0 seconds...", caplog.text)
+        assert re.search(
+            "Maximum number of jobs running for .*. Polling again when a job finishes or in 0 seconds...", caplog.text
+        )
+
+    async def test_waits_until_a_job_is_released(self, job_poller: JobPoller):
+        job_poller.poll_retry_delay = 60
+        job_poller.task.config.max_running_jobs = 1
+        job = random_job()
+        job_poller.task_state.add(job)
+
+        waiter = asyncio.create_task(job_poller.activate_max_jobs())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        job_poller.poll_once = AsyncMock()
+        job_poller.task_state.remove(job)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        job_poller.poll_once.assert_not_called()
+        assert job_poller.calculate_max_jobs_to_activate() == 1
 
     async def test_puts_job_in_queue_with_one_available_job(
         self, job_poller: JobPoller, queue: asyncio.Queue, job_from_task: Job, grpc_servicer: GatewayMock
@@ -174,3 +300,38 @@ class TestActivateStream:
 
         job: Job = queue.get_nowait()
         assert job.key == job_from_task.key
+
+    async def test_closes_stream_when_max_running_jobs_is_reached(
+        self, job_stream_poller: JobStreamer, queue: asyncio.Queue, task: Task
+    ):
+        job_stream_poller.task.config.max_running_jobs = 1
+        streamed_jobs = []
+
+        async def stream_activate_jobs(**kwargs):
+            for _ in range(3):
+                job = random_job(task)
+                streamed_jobs.append(job)
+                yield job
+
+        job_stream_poller.zeebe_adapter.stream_activate_jobs = stream_activate_jobs
+
+        await job_stream_poller.activate_stream()
+
+        assert len(streamed_jobs) == 1
+        assert queue.qsize() == 1
+        assert job_stream_poller.task_state.count_active() == 1
+
+    async def test_waits_for_capacity_before_opening_stream(self, job_stream_poller: JobStreamer):
+        job_stream_poller.task.config.max_running_jobs = 1
+        job = random_job()
+        job_stream_poller.task_state.add(job)
+        job_stream_poller.zeebe_adapter.stream_activate_jobs = Mock()
+
+        waiter = asyncio.create_task(job_stream_poller.activate_stream())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        job_stream_poller.task_state.remove(job)
+        await asyncio.wait_for(waiter, timeout=1)
+
+        job_stream_poller.zeebe_adapter.stream_activate_jobs.assert_not_called()
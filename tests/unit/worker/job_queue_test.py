@@ -0,0 +1,93 @@
+import time
+from dataclasses import replace
+
+import pytest
+
+from pyzeebe.job.job import Job
+from pyzeebe.task.task_config import TaskConfig
+from pyzeebe.worker.job_queue import (
+    JobPriorityQueue,
+    create_job_queue,
+    deadline_sort_key,
+    get_job_priority,
+    is_job_expired,
+    priority_sort_key,
+)
+from tests.unit.utils.random_utils import random_job
+
+
+def job_with(deadline: int = 0, priority: str | None = None) -> Job:
+    headers = {"priority": priority} if priority is not None else {}
+    return replace(random_job(), deadline=deadline, custom_headers=headers)
+
+
+@pytest.mark.anyio
+class TestJobPriorityQueue:
+    async def test_returns_earliest_deadline_first(self):
+        queue = JobPriorityQueue(deadline_sort_key)
+        late, early = job_with(deadline=2000), job_with(deadline=1000)
+
+        await queue.put(late)
+        await queue.put(early)
+
+        assert await queue.get() == early
+        assert await queue.get() == late
+
+    async def test_returns_highest_priority_first(self):
+        queue = JobPriorityQueue(priority_sort_key)
+        low, high = job_with(deadline=1000, priority="1"), job_with(deadline=2000, priority="10")
+
+        await queue.put(low)
+        await queue.put(high)
+
+        assert await queue.get() == high
+
+    async def test_keeps_fifo_order_for_equal_keys(self):
+        queue = JobPriorityQueue(deadline_sort_key)
+        first, second = job_with(deadline=1000), job_with(deadline=1000)
+
+        await queue.put(first)
+        await queue.put(second)
+
+        assert await queue.get() == first
+
+    async def test_respects_maxsize(self):
+        queue = JobPriorityQueue(deadline_sort_key, maxsize=1)
+
+        await queue.put(job_with())
+
+        assert queue.full()
+        assert queue.qsize() == 1
+
+
+class TestGetJobPriority:
+    def test_defaults_to_zero(self):
+        assert get_job_priority(job_with()) == 0
+
+    def test_parses_header(self):
+        assert get_job_priority(job_with(priority="5")) == 5
+
+    def test_invalid_header_is_zero(self):
+        assert get_job_priority(job_with(priority="high")) == 0
+
+
+class TestCreateJobQueue:
+    @pytest.mark.parametrize("scheduling", ["deadline", "priority"])
+    def test_creates_priority_queue(self, task_config: TaskConfig, scheduling: str):
+        task_config.scheduling = scheduling
+
+        assert isinstance(create_job_queue(task_config), JobPriorityQueue)
+
+    def test_creates_fifo_queue_by_default(self, task_config: TaskConfig):
+        queue = create_job_queue(task_config, maxsize=3)
+
+        assert not isinstance(queue, JobPriorityQueue)
+        assert queue.maxsize == 3
+
+
+class TestIsJobExpired:
+    def test_passed_deadline_is_expired(self):
+        assert is_job_expired(job_with(deadline=int(time.time() * 1000) - 1))
+
+    def test_future_deadline_is_not_expired(self):
+        assert not is_job_expired(job_with(deadline=int(time.time() * 1000) + 60_000))
@@ -0,0 +1,101 @@
+import os
+import signal
+from unittest.mock import MagicMock
+
+import anyio
+import pytest
+
+from pyzeebe.errors import SettingsError
+from pyzeebe.worker import supervisor
+from pyzeebe.worker.supervisor import WorkerSupervisor
+
+
+def fake_process(exitcode: int | None) -> MagicMock:
+    process = MagicMock(exitcode=exitcode)
+    process.is_alive.return_value = exitcode is None
+    return process
+
+
+@pytest.fixture
+def worker_supervisor(mocker):
+    mocker.patch.object(supervisor, "wait")
+    mocker.patch.object(supervisor.time, "sleep")
+    worker_supervisor = WorkerSupervisor(MagicMock(), processes=2, restart_delay=0)
+    worker_supervisor._start_child = MagicMock()
+    return worker_supervisor
+
+
+class TestConstructor:
+    def test_defaults_to_one_process_per_cpu(self):
+        assert WorkerSupervisor(MagicMock()).processes == (os.cpu_count() or 1)
+
+    @pytest.mark.parametrize("settings", [{"processes": 0}, {"restart_delay": -1}, {"drain_timeout": -1}])
+    def test_invalid_settings(self, settings: dict):
+        with pytest.raises(SettingsError):
+            WorkerSupervisor(MagicMock(), **settings)
+
+
+class TestWaitForExits:
+    def test_restarts_crashed_process(self, worker_supervisor: WorkerSupervisor):
+        worker_supervisor._children = {0: fake_process(None), 1: fake_process(1)}
+
+        worker_supervisor._wait_for_exits()
+
+        assert list(worker_supervisor._children) == [0]
+        worker_supervisor._start_child.assert_called_once_with(1)
+
+    def test_does_not_restart_cleanly_exited_process(self, worker_supervisor: WorkerSupervisor):
+        worker_supervisor._children = {0: fake_process(0)}
+
+        worker_supervisor._wait_for_exits()
+
+        assert worker_supervisor._children == {}
+        worker_supervisor._start_child.assert_not_called()
+
+    def test_does_not_restart_while_stopping(self, worker_supervisor: WorkerSupervisor):
+        worker_supervisor._children = {0: fake_process(-signal.SIGTERM)}
+        worker_supervisor._stopping = True
+
+        worker_supervisor._wait_for_exits()
+
+        worker_supervisor._start_child.assert_not_called()
+
+
+class TestStop:
+    def test_terminates_running_processes(self, worker_supervisor: WorkerSupervisor):
+        running, exited = fake_process(None), fake_process(1)
+        worker_supervisor._children = {0: running, 1: exited}
+
+        worker_supervisor.stop()
+
+        running.terminate.assert_called_once()
+        exited.terminate.assert_not_called()
+
+    def test_no_process_started_after_stop(self):
+        worker_supervisor = WorkerSupervisor(MagicMock(), processes=1)
+        worker_supervisor._context = MagicMock()
+
+        worker_supervisor.stop()
+        worker_supervisor._start_child(0)
+
+        worker_supervisor._context.Process.assert_not_called()
+
+
+@pytest.mark.anyio
+class TestWorkerProcess:
+    async def test_sigterm_stops_worker(self):
+        stopped = anyio.Event()
+        worker = MagicMock()
+        worker.work.side_effect = stopped.wait
+
+        async def stop(drain_timeout: float | None) -> None:
+            stopped.set()
+
+        worker.stop.side_effect = stop
+
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(supervisor._work, lambda: worker, 30)
+            await anyio.sleep(0.01)
+            os.kill(os.getpid(), signal.SIGTERM)
+
+        worker.stop.assert_called_once_with(30)
@@ -8,7 +8,9 @@ from pyzeebe.errors import BusinessError, DuplicateTaskTypeError, TaskNotFoundEr
 from pyzeebe.job.job import Job, JobController
 from pyzeebe.task.exception_handler import ExceptionHandler, default_exception_handler
 from pyzeebe.task.task import Task
+from pyzeebe.task.thread_pool import TaskThreadPool
 from pyzeebe.worker.task_router import ZeebeTaskRouter
+from tests.unit.utils import dummy_functions
 from tests.unit.utils.random_utils import randint
 
 
@@ -30,6 +32,14 @@ def test_task_inherits_exception_handler(router: ZeebeTaskRouter, task: Task):
     assert found_handler == str
 
 
+def test_task_keeps_concurrent_activations(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type, concurrent_activations=4)
+    def dummy_function():
+        pass
+
+    assert router.get_task(task_type).config.concurrent_activations == 4
+
+
 def test_get_fake_task(router: ZeebeTaskRouter):
     with pytest.raises(TaskNotFoundError):
         router.get_task(str(uuid4()))
@@ -148,3 +158,80 @@ async def test_default_exception_handler_warns_of_job_failure(job: Job, mocked_j
         exception = BusinessError("custom-error-code")
         await default_exception_handler(exception, job, mocked_job_controller)
         logging_mock.assert_called()
+
+
+def test_batch_task_defaults_running_jobs_to_batch_size(router: ZeebeTaskRouter, task_type: str):
+    @router.batch_task(task_type, max_batch=50, max_wait_ms=5)
+    def dummy_function(batch: list[dict]) -> list[dict]:
+        return batch
+
+    config = router.get_task(task_type).config
+    assert config.max_batch == 50
+    assert config.max_batch_wait_ms == 5
+    assert config.max_running_jobs == 50
+    assert config.max_jobs_to_activate == 50
+
+
+def test_raw_variables_task_fetches_all_variables(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type, raw_variables=True)
+    def forward(variables: bytes) -> bytes:
+        return variables
+
+    config = router.get_task(task_type).config
+    assert config.raw_variables
+    assert config.variables_to_fetch == []
+
+
+def test_typed_variables_task_fetches_model_fields(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type, typed_variables=True)
+    def create_invoice(order: dummy_functions.Order) -> dict:
+        return {}
+
+    config = router.get_task(task_type).config
+    assert config.typed_variables
+    assert config.variables_to_fetch == ["amount"]
+
+
+def test_model_parameter_fetches_variable_of_its_name(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type)
+    def create_invoice(order: dummy_functions.Order) -> dict:
+        return {}
+
+    assert router.get_task(task_type).config.variables_to_fetch == ["order"]
+
+
+def test_task_keeps_thread_pool(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type, max_threads=4)
+    def blocking_task():
+        pass
+
+    config = router.get_task(task_type).config
+    assert config.max_threads == 4
+    assert isinstance(config.executor, TaskThreadPool)
+    assert config.executor.max_threads == 4
+
+
+def test_task_keeps_timeout_policy(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type, on_timeout="fail")
+    async def slow_task():
+        pass
+
+    assert router.get_task(task_type).config.on_timeout == "fail"
+
+
+def test_task_keeps_liveness_probe(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type, liveness_probe_ms=1000)
+    async def long_task():
+        pass
+
+    assert router.get_task(task_type).config.liveness_probe_ms == 1000
+
+
+def test_task_keeps_budget_settings(router: ZeebeTaskRouter, task_type: str):
+    @router.task(task_type, weight=2.5, min_share=4)
+    async def weighted_task():
+        pass
+
+    config = router.get_task(task_type).config
+    assert config.weight == 2.5
+    assert config.min_share == 4
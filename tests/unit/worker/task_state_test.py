@@ -1,7 +1,12 @@
+import asyncio
+import time
+from dataclasses import replace
+
 import pytest
 
 from pyzeebe.job.job import Job
 from pyzeebe.worker.task_state import TaskState
+from tests.unit.utils.random_utils import random_job
 
 
 @pytest.fixture
@@ -32,3 +37,154 @@ def test_remove_non_existing_job_dont_withdraw_from_active_jobs(task_state: Task
 def test_add_already_activated_job_does_not_raise_an_error(task_state: TaskState, job_from_task: Job):
     task_state.add(job_from_task)
     task_state.add(job_from_task)
+
+
+def test_add_already_activated_job_counts_once(task_state: TaskState, job_from_task: Job):
+    task_state.add(job_from_task)
+    task_state.add(job_from_task)
+
+    assert task_state.count_active() == 1
+
+
+def test_get_returns_activation_info(task_state: TaskState, job_from_task: Job):
+    task_state.add(job_from_task)
+
+    active_job = task_state.get(job_from_task)
+
+    assert active_job.key == job_from_task.key
+    assert active_job.deadline == job_from_task.deadline
+
+
+def test_oldest_age_without_jobs(task_state: TaskState):
+    assert task_state.oldest_age() == 0
+
+
+def test_oldest_age_follows_first_added_job(task_state: TaskState):
+    first, second = random_job(), random_job()
+    task_state.add(first)
+    task_state.add(second)
+    task_state.get(first).activated_at -= 10
+
+    assert task_state.oldest_age() >= 10
+
+    task_state.remove(first)
+
+    assert task_state.oldest_age() < 10
+
+
+def test_earliest_deadline(task_state: TaskState):
+    early, late = with_deadline(1000), with_deadline(2000)
+    task_state.add(late)
+    task_state.add(early)
+
+    assert task_state.earliest_deadline() == 1000
+
+    task_state.remove(early)
+
+    assert task_state.earliest_deadline() == 2000
+
+
+def test_earliest_deadline_without_jobs(task_state: TaskState):
+    assert task_state.earliest_deadline() is None
+
+
+def test_jobs_near_deadline(task_state: TaskState):
+    now = now_ms()
+    expired, soon, later = with_deadline(now - 1000), with_deadline(now + 500), with_deadline(now + 60_000)
+    for job in (later, soon, expired):
+        task_state.add(job)
+
+    assert sorted(task_state.jobs_near_deadline(1000)) == sorted([expired.key, soon.key])
+
+
+def test_jobs_near_deadline_ignores_removed_jobs(task_state: TaskState):
+    job = with_deadline(now_ms())
+    task_state.add(job)
+    task_state.remove(job)
+
+    assert task_state.jobs_near_deadline(1000) == []
+
+
+def test_update_deadline(task_state: TaskState):
+    job = with_deadline(now_ms())
+    task_state.add(job)
+
+    task_state.update_deadline(job, now_ms() + 60_000)
+
+    assert task_state.jobs_near_deadline(1000) == []
+    assert task_state.get(job).deadline > now_ms()
+
+
+def test_removed_jobs_do_not_grow_deadline_index(task_state: TaskState):
+    for _ in range(1000):
+        job = with_deadline(now_ms() + 60_000)
+        task_state.add(job)
+        task_state.remove(job)
+
+    assert len(task_state._deadlines) < 100
+
+
+def test_add_reserved_consumes_reservation(task_state: TaskState, job_from_task: Job):
+    task_state.reserve(2)
+
+    task_state.add_reserved(job_from_task)
+
+    assert task_state.count_reserved() == 1
+    assert task_state.count_active() == 1
+
+
+def test_release_reservation(task_state: TaskState):
+    task_state.reserve(3)
+
+    task_state.release_reservation(3)
+
+    assert task_state.count_reserved() == 0
+
+
+def test_record_job_duration_updates_average(task_state: TaskState):
+    task_state.record_job_duration(1.0)
+    task_state.record_job_duration(1.0)
+
+    assert 0 < task_state.average_job_duration < 1.0
+
+
+@pytest.mark.anyio
+async def test_wait_for_released_job_returns_when_job_is_removed(task_state: TaskState, job_from_task: Job):
+    task_state.add(job_from_task)
+    waiter = asyncio.create_task(task_state.wait_for_released_job())
+    await asyncio.sleep(0)
+
+    task_state.remove(job_from_task)
+
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+@pytest.mark.anyio
+async def test_wait_for_released_job_ignores_unknown_jobs(task_state: TaskState, job_from_task: Job):
+    waiter = asyncio.create_task(task_state.wait_for_released_job())
+    await asyncio.sleep(0)
+
+    task_state.remove(job_from_task)
+    await asyncio.sleep(0)
+
+    assert not waiter.done()
+    waiter.cancel()
+
+
+@pytest.mark.anyio
+async def test_wait_for_released_job_returns_when_reservation_is_released(task_state: TaskState):
+    task_state.reserve(1)
+    waiter = asyncio.create_task(task_state.wait_for_released_job())
+    await asyncio.sleep(0)
+
+    task_state.release_reservation(1)
+
+    await asyncio.wait_for(waiter, timeout=1)
+
+
+def with_deadline(deadline: int) -> Job:
+    return replace(random_job(), deadline=deadline)
+
+
+def now_ms() -> int:
+    return int(time.time() * 1000)
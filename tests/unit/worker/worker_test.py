@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest.mock import AsyncMock, Mock
 from uuid import uuid4
 
@@ -12,8 +14,11 @@ from pyzeebe import ExceptionHandler, TaskDecorator, ZeebeTaskRouter
 from pyzeebe.errors import DuplicateTaskTypeError
 from pyzeebe.job.job import Job, JobController
 from pyzeebe.task.task import Task
+from pyzeebe.task.thread_pool import TaskThreadPool
+from pyzeebe.worker.job_executor import JobExecutor
 from pyzeebe.worker.job_poller import JobPoller, JobStreamer
 from pyzeebe.worker.worker import ZeebeWorker
+from tests.unit.utils.random_utils import random_job
 
 
 @pytest.mark.anyio
@@ -96,6 +101,16 @@ class TestIncludeRouter:
 
         assert len(zeebe_worker.tasks) == len(routers)
 
+    async def test_keeps_thread_pool_of_router_task(self, zeebe_worker: ZeebeWorker, router: ZeebeTaskRouter):
+        @router.task(str(uuid4()), max_threads=2)
+        def blocking_task():
+            pass
+
+        zeebe_worker.include_router(router)
+
+        assert zeebe_worker.tasks[0].config.max_threads == 2
+        assert zeebe_worker.tasks[0].config.executor is router.tasks[0].config.executor
+
     async def test_router_before_decorator(
         self,
         zeebe_worker: ZeebeWorker,
@@ -248,6 +263,149 @@ class TestWorker:
         await zeebe_worker.stop()
         zeebe_worker._stop_event.set.assert_called_once()
 
+    async def test_one_poller_per_concurrent_activation(self, zeebe_worker: ZeebeWorker):
+        @zeebe_worker.task(str(uuid4()), concurrent_activations=3)
+        def dummy_function():
+            pass
+
+        zeebe_worker._init_tasks()
+
+        assert len(zeebe_worker._job_pollers) == 3
+        assert len({id(poller.task_state) for poller in zeebe_worker._job_pollers}) == 1
+        assert len(zeebe_worker._job_executors) == 1
+
+    async def test_process_tasks_share_the_process_pool(self, zeebe_worker: ZeebeWorker):
+        for _ in range(2):
+
+            @zeebe_worker.task(str(uuid4()), execution_mode="process")
+            def dummy_function():
+                pass
+
+        zeebe_worker._init_tasks()
+
+        process_pool = zeebe_worker._process_pool
+        assert isinstance(process_pool, ProcessPoolExecutor)
+        assert all(task.config.executor is process_pool for task in zeebe_worker.tasks)
+
+    async def test_process_task_runs_as_many_jobs_as_the_pool_has_processes(self, zeebe_worker: ZeebeWorker):
+        zeebe_worker._process_pool_size = 3
+
+        @zeebe_worker.task(str(uuid4()), execution_mode="process")
+        def dummy_function():
+            pass
+
+        zeebe_worker._init_tasks()
+
+        assert zeebe_worker._job_executors[0].max_started_jobs == 3
+
+    async def test_tasks_share_the_json_offloader(self, zeebe_worker: ZeebeWorker, task: Task):
+        zeebe_worker._add_task(task)
+
+        zeebe_worker._init_tasks()
+
+        assert task.config.json_offloader is zeebe_worker.zeebe_adapter.json_offloader
+
+    async def test_no_process_pool_without_process_tasks(self, zeebe_worker: ZeebeWorker, task: Task):
+        zeebe_worker._add_task(task)
+
+        zeebe_worker._init_tasks()
+
+        assert zeebe_worker._process_pool is None
+
+    async def test_stop_shuts_down_process_pool(self, zeebe_worker: ZeebeWorker):
+        process_pool = Mock(spec_set=ProcessPoolExecutor)
+        zeebe_worker._process_pool = process_pool
+
+        await zeebe_worker.stop()
+
+        process_pool.shutdown.assert_called_once()
+        assert zeebe_worker._process_pool is None
+
+    async def test_stop_shuts_down_task_thread_pools(self, zeebe_worker: ZeebeWorker):
+        @zeebe_worker.task(str(uuid4()), max_threads=2)
+        def dummy_function():
+            pass
+
+        thread_pool = zeebe_worker.tasks[0].config.executor
+        assert isinstance(thread_pool, TaskThreadPool)
+
+        await zeebe_worker.stop()
+
+        assert thread_pool._shutdown
+
+    async def test_stop_keeps_user_executor_running(self, zeebe_worker: ZeebeWorker):
+        executor = Mock(spec_set=ThreadPoolExecutor)
+
+        @zeebe_worker.task(str(uuid4()), executor=executor)
+        def dummy_function():
+            pass
+
+        await zeebe_worker.stop()
+
+        executor.shutdown.assert_not_called()
+
+    async def test_stop_passes_drain_timeout_to_executors(self, zeebe_worker: ZeebeWorker):
+        executor_mock = AsyncMock(spec_set=JobExecutor)
+        zeebe_worker._job_executors = [executor_mock]
+
+        await zeebe_worker.stop(drain_timeout=30)
+
+        executor_mock.stop.assert_awaited_once_with(30)
+
+    async def test_stop_returns_within_drain_timeout_while_sync_handler_runs(self, zeebe_worker: ZeebeWorker):
+        @zeebe_worker.task(str(uuid4()), max_threads=1)
+        def slow_function():
+            time.sleep(3)
+
+        zeebe_worker._init_tasks()
+        job_executor = zeebe_worker._job_executors[0]
+        job = random_job(zeebe_worker.tasks[0])
+        job_executor.task_state.add(job)
+        await job_executor.jobs.put(job)
+        execution = asyncio.create_task(job_executor.execute())
+        await asyncio.sleep(0.1)
+
+        started = time.monotonic()
+        await asyncio.wait_for(zeebe_worker.stop(drain_timeout=0.5), timeout=2)
+
+        assert time.monotonic() - started < 1
+        assert zeebe_worker.tasks[0].config.executor._shutdown
+        execution.cancel()
+
+    async def test_stop_delivers_pending_completions(self, aio_grpc_channel_mock):
+        zeebe_worker = ZeebeWorker(aio_grpc_channel_mock, max_pending_completions=8)
+        zeebe_worker._completion_dispatcher = AsyncMock()
+
+        await zeebe_worker.stop()
+
+        zeebe_worker._completion_dispatcher.stop.assert_awaited_once()
+
+    async def test_tasks_share_worker_budget(self, aio_grpc_channel_mock, task: Task):
+        zeebe_worker = ZeebeWorker(aio_grpc_channel_mock, max_running_jobs=8, stream_enabled=True)
+        zeebe_worker._add_task(task)
+
+        zeebe_worker._init_tasks()
+
+        budget = zeebe_worker._job_pollers[0].budget
+        assert budget.max_running_jobs == 8
+        assert zeebe_worker._job_streamers[0].budget is budget
+        assert budget.count_available(task.type) == 8
+
+    async def test_pollers_have_no_strategy_by_default(self, zeebe_worker: ZeebeWorker, task: Task):
+        zeebe_worker._add_task(task)
+
+        zeebe_worker._init_tasks()
+
+        assert zeebe_worker._job_pollers[0].polling_strategy is None
+
+    async def test_adaptive_polling_uses_request_timeout_as_longest_poll(self, aio_grpc_channel_mock, task: Task):
+        zeebe_worker = ZeebeWorker(aio_grpc_channel_mock, request_timeout=5000, adaptive_polling=True)
+        zeebe_worker._add_task(task)
+
+        zeebe_worker._init_tasks()
+
+        assert zeebe_worker._job_pollers[0].polling_strategy.max_request_timeout == 5000
+
     async def test_poller_stoped(self, zeebe_worker: ZeebeWorker):
         zeebe_worker._init_tasks = Mock()
         zeebe_worker._stop_event = AsyncMock(spec_set=anyio.Event)